@@ -0,0 +1,70 @@
+import functools
+
+from django.http import JsonResponse
+
+from rest_framework.authtoken.models import Token
+
+
+async def aget_token_user(request, allow_query_token=False):
+    """
+    Resolve the user of a token-authenticated request in async views.
+
+    Accepts the token from the ``Authorization: Token <key>`` header, as
+    DRF's TokenAuthentication does. With ``allow_query_token`` a ``token``
+    query parameter is accepted as well, for clients such as
+    ``EventSource`` that cannot set headers; tokens in URLs end up in
+    access logs, so only endpoints that need it enable it.
+
+    :param request: Django HttpRequest
+    :param allow_query_token: Also accept ``?token=<key>``
+    :return: Active User instance or None if the token is missing or invalid
+    """
+    key = None
+    header = request.headers.get("Authorization", "").split()
+    if len(header) == 2 and header[0].lower() == "token":
+        key = header[1]
+    elif allow_query_token and request.GET.get("token"):
+        key = request.GET["token"]
+
+    if not key:
+        return None
+
+    try:
+        token = await Token.objects.select_related("user").aget(key=key)
+    except Token.DoesNotExist:
+        return None
+
+    if not token.user.is_active:
+        return None
+    return token.user
+
+
+def async_token_required(view=None, *, allow_query_token=False):
+    """
+    Decorator for async views that require token authentication.
+
+    Sets ``request.user`` to the token's user, or answers with the same
+    401 response body DRF uses when no valid token is given. Use it as
+    ``@async_token_required``, or as
+    ``@async_token_required(allow_query_token=True)`` for views whose
+    clients cannot send the Authorization header.
+
+    :param view: Async view function
+    :param allow_query_token: Also accept the token as ``?token=<key>``
+    :return: Wrapped async view function
+    """
+    if view is None:
+        return functools.partial(async_token_required, allow_query_token=allow_query_token)
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await aget_token_user(request, allow_query_token=allow_query_token)
+        if user is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=401,
+            )
+        request.user = user
+        return await view(request, *args, **kwargs)
+
+    return wrapper
@@ -1,3 +1,39 @@
-from django.test import TestCase
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.urls import reverse
 
-# Create your tests here.
+from core.testing import QueryBudgetTestCase
+
+
+class AuthQueryBudgetTests(QueryBudgetTestCase):
+    """
+    Query budgets of the registration and login endpoints.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        owner_ids = [seeded.owner.id for seeded in cls.seeded.values()]
+        User.objects.filter(id__in=owner_ids).update(password=make_password("secret"))
+
+    def test_registration_check(self):
+        self.check_budget(1, lambda seeded: self.client.get(reverse("registration")))
+
+    def test_registration(self):
+        self.check_budget(8, lambda seeded: self.client.post(
+            reverse("registration"),
+            {
+                "fullname": f"New User {seeded.board.id}",
+                "email": f"new-{seeded.board.id}@example.com",
+                "password": "secret",
+                "repeated_password": "secret",
+            },
+            format="json",
+        ))
+
+    def test_login(self):
+        self.check_budget(5, lambda seeded: self.client.post(
+            reverse("login"),
+            {"email": seeded.owner.email, "password": "secret"},
+            format="json",
+        ))
@@ -1,10 +1,16 @@
 from django.contrib import admin
-from .models import Board
+from .models import Board, BoardMembership
 
 # Register your models here.
+class BoardMembershipInline(admin.TabularInline):
+    model = BoardMembership
+    extra = 0
+    raw_id_fields = ("user",)
+
+
 class BoardAdmin(admin.ModelAdmin):
     list_display = ("id", "title", "owner")
     search_fields = ("title", "owner__username", "owner__email")
-    filter_horizontal = ("members",) 
+    inlines = (BoardMembershipInline,)
 
-admin.site.register(Board, BoardAdmin)
\ No newline at end of file
+admin.site.register(Board, BoardAdmin)
@@ -0,0 +1,49 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from auth_app.api.authentication import async_token_required
+from board_app.dashboard import aget_dashboard
+from board_app.membership import aget_board_owner_id, ais_board_member
+from board_app.models import Board
+from board_app.snapshots import aget_board_snapshot, board_etag, board_not_modified, snapshot_response
+
+
+@require_GET
+@async_token_required
+async def board_dashboard(request):
+    """
+    Async variant of the board dashboard (GET /api/boards/).
+
+    Returns the same payload as BoardDashboardView from the same
+    per-user cache, without holding a worker thread while it runs.
+    """
+    return JsonResponse(await aget_dashboard(request.user), safe=False)
+
+
+@require_GET
+@async_token_required
+async def board_detail(request, pk):
+    """
+    Async variant of the board detail (GET /api/boards/<id>/).
+
+    Membership is checked against the cached membership index before the
+    board row is loaded; the payload is served from the snapshot of the
+    board's version, or answered with 304 if the client holds it.
+    """
+    if await aget_board_owner_id(pk) is None:
+        return JsonResponse({"detail": "No Board matches the given query."}, status=404)
+    if not await ais_board_member(request.user.id, pk):
+        return JsonResponse(
+            {"detail": "You do not have permission to perform this action."},
+            status=403,
+        )
+
+    try:
+        board = await Board.objects.aget(pk=pk)
+    except Board.DoesNotExist:
+        return JsonResponse({"detail": "No Board matches the given query."}, status=404)
+
+    response = board_not_modified(request, board)
+    if response is None:
+        response = snapshot_response(request, await aget_board_snapshot(board), board_etag(board))
+    return response
@@ -1,5 +1,7 @@
 from rest_framework import permissions
 
+from board_app.membership import is_board_member
+
 class IsBoardMemberOrOwner(permissions.BasePermission):
     """
     Permission class that allows access only to board members or the board owner.
@@ -36,11 +38,7 @@ class IsBoardMemberOrOwner(permissions.BasePermission):
         Returns:
             bool: True if the user is the owner or a member of the board.
         """
-        user = request.user
-        return (
-            obj.owner_id == user.id
-            or obj.members.filter(id=user.id).exists()
-        )
+        return is_board_member(request.user.id, obj.id)
 
 
 class IsBoardOwner(permissions.BasePermission):
@@ -1,22 +1,26 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
 
+from board_app.exports import EXPORT_FORMATS
 from board_app.models import Board
 
-from rest_framework.exceptions import PermissionDenied
-from task_app.api.serializers import TaskUserSerializer
+from task_app.api.serializers import TaskCommentsSerializer, TaskUserSerializer
 from task_app.models import Task
+from core.instrumentation import TimedSerializerMixin
 
-class BoardDashboardSerializer(serializers.ModelSerializer):
+class BoardDashboardSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for displaying summarized board information
     on the board dashboard.
+
+    The counters are read from annotations, so instances must come from
+    ``Board.objects.with_dashboard_counts()``.
     """
 
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
+    member_count = serializers.IntegerField(read_only=True)
+    ticket_count = serializers.IntegerField(read_only=True)
+    tasks_to_do_count = serializers.IntegerField(read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -31,29 +35,23 @@ class BoardDashboardSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['owner_id', 'member_count', 'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count']
 
-    def get_member_count(self, obj):
-        """
-        Return the number of members assigned to the board.
-        """
-        return obj.members.count()
 
-    def get_ticket_count(self, obj):
-        """
-        Return the total number of tasks associated with the board.
-        """
-        return obj.tasks.count()
-
-    def get_tasks_to_do_count(self, obj):
-        """
-        Return the number of tasks with status 'to-do'.
-        """
-        return obj.tasks.filter(status="to-do").count()
+def validate_user_ids(user_ids):
+    """
+    Check that all given user ids exist with a single query.
 
-    def get_tasks_high_prio_count(self, obj):
-        """
-        Return the number of tasks with high priority.
-        """
-        return obj.tasks.filter(priority="high").count()
+    :param user_ids: List of user ids
+    :return: The user ids without duplicates
+    :raises ValidationError: If a user does not exist
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    existing = set(User.objects.filter(id__in=user_ids).values_list("id", flat=True))
+    missing = [user_id for user_id in user_ids if user_id not in existing]
+    if missing:
+        raise serializers.ValidationError(
+            f'Invalid pk "{missing[0]}" - object does not exist.'
+        )
+    return user_ids
 
 
 class BoardCreateSerializer(serializers.ModelSerializer):
@@ -65,9 +63,8 @@ class BoardCreateSerializer(serializers.ModelSerializer):
     and added as a board member.
     """
 
-    members = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        many=True,
+    members = serializers.ListField(
+        child=serializers.IntegerField(),
         required=False,
         write_only=True,
     )
@@ -81,6 +78,9 @@ class BoardCreateSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id"]
 
+    def validate_members(self, value):
+        return validate_user_ids(value)
+
     def create(self, validated_data):
         """
         Create a new board instance and assign members.
@@ -96,12 +96,13 @@ class BoardCreateSerializer(serializers.ModelSerializer):
             owner=request_user,
         )
 
-        board.members.add(request_user, *members)
+        # The owner membership is created by the board's post_save signal.
+        board.members.add(*members)
 
         return board
 
 
-class BoardMemberSerializer(serializers.ModelSerializer):
+class BoardMemberSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for representing board members.
     """
@@ -113,28 +114,24 @@ class BoardMemberSerializer(serializers.ModelSerializer):
         fields = ["id", "email", "fullname"]
 
 
-class BoardTaskSerializer(serializers.ModelSerializer):
+class BoardTaskSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializer for tasks nested in the board detail view.
+
+    Board membership is checked once by the view's permission classes,
+    not per task.
+    """
+
     assignee = TaskUserSerializer(read_only=True)
     reviewer = TaskUserSerializer(read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Task
         fields = ["id", "title", "description", "status", "priority", "assignee", "reviewer", "due_date", "comments_count"]
 
-    def get_comments_count(self, obj):
-        return obj.comments.count()
-
-    def to_representation(self, instance):
-        user = self.context["request"].user
-        board = instance.board
-        if not (board.owner == user or board.members.filter(id=user.id).exists()):
-            raise PermissionDenied("You must be a member of the board to view tasks.")
-        return super().to_representation(instance)
-
-
 
-class SingleBoardDetailSerializer(serializers.ModelSerializer):
+class SingleBoardDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for detailed board view including members and tasks.
     """
@@ -142,7 +139,6 @@ class SingleBoardDetailSerializer(serializers.ModelSerializer):
     members = BoardMemberSerializer(many=True, read_only=True)
     tasks = BoardTaskSerializer(many=True, read_only=True)
     owner_id = serializers.IntegerField(
-        source="owner.id",
         read_only=True,
     )
 
@@ -161,29 +157,69 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
     """
     Serializer for updating board data.
 
-    Supports updating the board title and replacing
-    the member list.
+    Supports updating the board title and either replacing the member
+    list (``members``) or changing it incrementally (``add_members`` /
+    ``remove_members``). The owner always stays a member.
+
+    User ids are validated with one query per list, so the cost of an
+    incremental change depends on the number of changed members only.
     """
 
-    members = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        many=True,
+    members = serializers.ListField(
+        child=serializers.IntegerField(),
         required=False,
     )
+    add_members = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        write_only=True,
+    )
+    remove_members = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        write_only=True,
+    )
 
     class Meta:
         model = Board
-        fields = ["title", "members"]
+        fields = ["title", "members", "add_members", "remove_members"]
+
+    def validate_members(self, value):
+        return validate_user_ids(value)
+
+    def validate_add_members(self, value):
+        return validate_user_ids(value)
+
+    def validate_remove_members(self, value):
+        return list(dict.fromkeys(value))
+
+    def validate(self, data):
+        """
+        Reject combining a full replacement with incremental changes
+        and removing the owner.
+        """
+        if "members" in data and ("add_members" in data or "remove_members" in data):
+            raise serializers.ValidationError(
+                "Use either members or add_members/remove_members."
+            )
+
+        if self.instance is not None and self.instance.owner_id in data.get("remove_members", []):
+            raise serializers.ValidationError(
+                {"remove_members": "The board owner cannot be removed."}
+            )
+        return data
 
     def update(self, instance, validated_data):
         """
-        Update board attributes and replace members if provided.
+        Update board attributes and replace or change members if provided.
 
         :param instance: Board instance to update
         :param validated_data: Validated input data
         :return: Updated Board instance
         """
         members = validated_data.pop("members", None)
+        add_members = validated_data.pop("add_members", None)
+        remove_members = validated_data.pop("remove_members", None)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -191,12 +227,16 @@ class BoardUpdateSerializer(serializers.ModelSerializer):
         instance.save()
 
         if members is not None:
-            instance.members.set(members)
+            instance.members.set([*members, instance.owner_id])
+        if add_members:
+            instance.members.add(*add_members)
+        if remove_members:
+            instance.members.remove(*remove_members)
 
         return instance
 
 
-class BoardUpdateResponseSerializer(serializers.ModelSerializer):
+class BoardUpdateResponseSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for returning board data after an update.
     """
@@ -221,6 +261,56 @@ class BoardUpdateResponseSerializer(serializers.ModelSerializer):
         ]
 
 
+class BoardUpdateSummarySerializer(BoardUpdateResponseSerializer):
+    """
+    Serializer for returning board data after an update without the
+    member list, for clients that only changed a few members.
+    """
+
+    class Meta(BoardUpdateResponseSerializer.Meta):
+        fields = [
+            "id",
+            "title",
+            "owner_data",
+        ]
+
+
+class BoardChangesQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating the query parameters of the change feed.
+    """
+
+    since = serializers.IntegerField(min_value=0, required=False)
+
+
+class BoardExportQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating the query parameters of the board export.
+    """
+
+    format = serializers.ChoiceField(choices=list(EXPORT_FORMATS), default="json")
+
+
+class BoardChangeTaskSerializer(BoardTaskSerializer):
+    """
+    Serializer for tasks returned by the change feed.
+    """
+
+    class Meta(BoardTaskSerializer.Meta):
+        fields = BoardTaskSerializer.Meta.fields + ["updated_at"]
+
+
+class BoardChangeCommentSerializer(TaskCommentsSerializer):
+    """
+    Serializer for comments returned by the change feed.
+    """
+
+    task_id = serializers.IntegerField(read_only=True)
+
+    class Meta(TaskCommentsSerializer.Meta):
+        fields = TaskCommentsSerializer.Meta.fields + ["task_id"]
+
+
 class EmailCheckSerializer(serializers.Serializer):
     """
     Serializer for validating an email address.
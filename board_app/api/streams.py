@@ -0,0 +1,129 @@
+import asyncio
+import json
+import time
+
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from auth_app.api.authentication import async_token_required
+from board_app.events import get_broker, serialize_change
+from board_app.membership import aget_board_owner_id, ais_board_member
+from board_app.models import BoardChange
+
+
+HEARTBEAT_SECONDS = 15
+REPLAY_LIMIT = 1000
+
+
+@require_GET
+@async_token_required(allow_query_token=True)
+async def board_event_stream(request, pk):
+    """
+    Stream the changes on a board as Server-Sent Events.
+
+    Each event carries a change log entry (``kind``, ``action``,
+    ``object_id``) with its id as SSE event id, so a reconnecting
+    ``EventSource`` resumes from ``Last-Event-ID`` through the change log.
+    Meant to be served under ASGI, where an idle connection costs a
+    queue on the event loop instead of a worker thread. Only this view
+    accepts the token as ``?token=``, as EventSource cannot send headers.
+    """
+    if await aget_board_owner_id(pk) is None:
+        return JsonResponse({"detail": "Board not found."}, status=404)
+    if not await ais_board_member(request.user.id, pk):
+        return JsonResponse(
+            {"detail": "You must be a member of the board to view changes."},
+            status=403,
+        )
+
+    last_event_id = parse_event_id(request.headers.get("Last-Event-ID"))
+
+    response = StreamingHttpResponse(
+        stream_board_events(pk, request.user.id, last_event_id),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def stream_board_events(board_id, user_id, last_event_id):
+    """
+    Yield SSE frames for a board until the client disconnects.
+
+    Subscribes before replaying the change log, so no event committed
+    in between is lost; events already replayed are skipped. The log is
+    replayed in pages of ``REPLAY_LIMIT`` changes until it is caught up.
+
+    Access is checked again at least every ``HEARTBEAT_SECONDS`` and
+    whenever the user's membership of the board is deleted; the stream
+    ends once the user has left the board or the board was deleted.
+    """
+    yield f"retry: {HEARTBEAT_SECONDS * 1000}\n\n"
+
+    async with get_broker().subscribe(board_id) as subscription:
+        while last_event_id is not None:
+            replayed = 0
+            async for change in BoardChange.objects.filter(
+                board_id=board_id,
+                id__gt=last_event_id,
+            ).order_by("id")[:REPLAY_LIMIT]:
+                replayed += 1
+                last_event_id = change.pk
+                yield format_event(serialize_change(change))
+            if replayed < REPLAY_LIMIT:
+                break
+
+        checked_at = time.monotonic()
+        while not subscription.overflowed:
+            try:
+                event = await asyncio.wait_for(subscription.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                event = None
+
+            if (
+                event is None
+                or time.monotonic() - checked_at >= HEARTBEAT_SECONDS
+                or is_membership_removal(event, user_id)
+            ):
+                if not await ais_board_member(user_id, board_id):
+                    return
+                checked_at = time.monotonic()
+
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            if last_event_id is not None and event["id"] is not None and event["id"] <= last_event_id:
+                continue
+            yield format_event(event)
+
+
+def is_membership_removal(event, user_id):
+    """
+    Check whether an event removes the user from the board.
+    """
+    return (
+        event["kind"] == BoardChange.MEMBER
+        and event["action"] == BoardChange.DELETE
+        and event["object_id"] == user_id
+    )
+
+
+def format_event(event):
+    """
+    Return an event payload as an SSE frame.
+    """
+    frame = f"event: {event['kind']}\ndata: {json.dumps(event)}\n\n"
+    if event["id"] is not None:
+        frame = f"id: {event['id']}\n" + frame
+    return frame
+
+
+def parse_event_id(value):
+    """
+    Return the numeric ``Last-Event-ID`` header value, or None.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
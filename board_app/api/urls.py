@@ -2,10 +2,18 @@
 from django.urls import path
 
 # Local Imports
-from .views import BoardDashboardView, SingleBoardDetailView, EmailCheckView
+from . import async_views
+from .streams import board_event_stream
+from .views import BoardDashboardView, SingleBoardDetailView, BoardChangesView, BoardExportView, BoardImportView, EmailCheckView
 
 urlpatterns = [
     path('api/boards/', BoardDashboardView.as_view(), name="boardDashboard"), #View to show all existing boards
+    path('api/boards/import/', BoardImportView.as_view(), name="board-import"), #View to create a board from an export archive
     path('api/boards/<int:pk>/', SingleBoardDetailView.as_view(), name="board-detail"), #View to show special existing boards; pk = id of the special board
-    path('api/email-check/', EmailCheckView.as_view(), name="email-check") #View to check a email adress
+    path('api/boards/<int:pk>/changes/', BoardChangesView.as_view(), name="board-changes"), #View to get the changes on a board since a cursor; pk = id of the board
+    path('api/boards/<int:pk>/export/', BoardExportView.as_view(), name="board-export"), #View to stream an export of a board as json, ndjson or csv; pk = id of the board
+    path('api/boards/<int:pk>/events/', board_event_stream, name="board-events"), #Server-Sent Events stream of the changes on a board; pk = id of the board
+    path('api/email-check/', EmailCheckView.as_view(), name="email-check"), #View to check a email adress
+    path('api/async/boards/', async_views.board_dashboard, name="boardDashboard-async"), #Async variant of the board dashboard
+    path('api/async/boards/<int:pk>/', async_views.board_detail, name="board-detail-async"), #Async variant of the board detail; pk = id of the board
 ]
\ No newline at end of file
@@ -1,18 +1,36 @@
+from collections import defaultdict
+
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.negotiation import DefaultContentNegotiation
 
-from board_app.models import Board
+from board_app.dashboard import dashboard_queryset, get_dashboard
+from board_app.deletion import mark_board_deleted
+from board_app.exports import EXPORT_FORMATS, stream_board_export
+from board_app.imports import BoardImporter, BoardImportError, records_from_json
+from board_app.membership import get_board_owner_id, is_board_member
+from board_app.models import Board, BoardChange
+from board_app.snapshots import board_etag, board_not_modified, get_board_snapshot, snapshot_response
+from task_app.models import Task, TaskCommentModel
 from .serializers import (
+    BoardChangeCommentSerializer,
+    BoardChangesQuerySerializer,
+    BoardChangeTaskSerializer,
     BoardDashboardSerializer,
+    BoardExportQuerySerializer,
+    BoardMemberSerializer,
     BoardCreateSerializer,
     BoardUpdateSerializer,
     BoardUpdateResponseSerializer,
+    BoardUpdateSummarySerializer,
     EmailCheckSerializer,
     SingleBoardDetailSerializer
 )
@@ -42,9 +60,14 @@ class BoardDashboardView(generics.ListCreateAPIView):
                 "You must be logged in to view boards."
             )
 
-        return Board.objects.filter(
-            Q(owner=user) | Q(members=user)
-        ).distinct()
+        return dashboard_queryset(user)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Return the dashboard, served from the per-user cache while none
+        of the user's boards changed.
+        """
+        return Response(get_dashboard(request.user))
 
     def get_serializer_class(self):
         """
@@ -64,6 +87,7 @@ class BoardDashboardView(generics.ListCreateAPIView):
                 )
         serializer.is_valid(raise_exception=True)
         board = serializer.save()
+        board = Board.objects.with_dashboard_counts().get(pk=board.pk)
 
         dashboard_serializer = BoardDashboardSerializer(
                     board,
@@ -86,6 +110,20 @@ class SingleBoardDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Board.objects.all()
     serializer_class = SingleBoardDetailSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return the board detail from the snapshot of the board's version.
+
+        Only the board row is loaded to check access; clients sending the
+        current ETag get 304 Not Modified, all others the stored bytes,
+        compressed as they accept.
+        """
+        board = self.get_object()
+        response = board_not_modified(request, board)
+        if response is None:
+            response = snapshot_response(request, get_board_snapshot(board), board_etag(board))
+        return response
+
     def get_permissions(self):
         """
         Return permissions based on request method.
@@ -101,6 +139,9 @@ class SingleBoardDetailView(generics.RetrieveUpdateDestroyAPIView):
     def patch(self, request, *args, **kwargs):
         """
         Partially update a board and return the updated board data.
+
+        With ``?members=false`` the member list is left out of the
+        response, which keeps small member changes on large boards cheap.
         """
         instance = self.get_object()
 
@@ -113,16 +154,209 @@ class SingleBoardDetailView(generics.RetrieveUpdateDestroyAPIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        response_serializer = BoardUpdateResponseSerializer(
-            instance,
-            context={"request": request},
-        )
+        if request.query_params.get("members") in ("false", "0"):
+            response_serializer = BoardUpdateSummarySerializer(
+                Board.objects.select_related("owner__userprofile").get(pk=instance.pk),
+                context={"request": request},
+            )
+        else:
+            response_serializer = BoardUpdateResponseSerializer(
+                Board.objects.select_related("owner__userprofile").prefetch_related(
+                    Prefetch("members", queryset=User.objects.select_related("userprofile")),
+                ).get(pk=instance.pk),
+                context={"request": request},
+            )
 
         return Response(
             response_serializer.data,
             status=status.HTTP_200_OK,
         )
 
+    def perform_destroy(self, instance):
+        """
+        Mark the board as deleted; its content is purged in the background
+        by ``manage.py purge_deleted_boards``.
+        """
+        mark_board_deleted(instance)
+
+
+class BoardChangesView(APIView):
+    """
+    API view returning the changes on a board since a cursor.
+
+    Clients load the cursor first (request without ``since``), then the
+    full board, and afterwards poll with ``?since=<cursor>``. Each response
+    contains the current state of tasks, comments and members changed
+    after the cursor, tombstones for deleted ones and the cursor to use
+    for the next poll. The cost depends on the number of changes, not on
+    the size of the board.
+    """
+
+    permission_classes = [IsAuthenticated]
+    max_changes = 1000
+
+    def get(self, request, pk):
+        """
+        Return the changes on the board after the ``since`` cursor.
+        """
+        if get_board_owner_id(pk) is None:
+            raise NotFound("Board not found.")
+        if not is_board_member(request.user.id, pk):
+            raise PermissionDenied("You must be a member of the board to view changes.")
+
+        query = BoardChangesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        since = query.validated_data.get("since")
+
+        if since is None:
+            cursor = BoardChange.objects.filter(board_id=pk).order_by("-id").values_list("id", flat=True).first()
+            return Response(self.build_payload(pk, cursor or 0, {}, has_more=False))
+
+        entries = list(
+            BoardChange.objects.filter(
+                board_id=pk,
+                id__gt=since,
+            ).order_by("id").values_list("id", "kind", "action", "object_id")[:self.max_changes + 1]
+        )
+        has_more = len(entries) > self.max_changes
+        entries = entries[:self.max_changes]
+
+        # Only the latest action per object matters.
+        latest = {}
+        for _, kind, action, object_id in entries:
+            latest[(kind, object_id)] = action
+
+        cursor = entries[-1][0] if entries else since
+        return Response(self.build_payload(pk, cursor, latest, has_more))
+
+    def build_payload(self, board_id, cursor, latest, has_more):
+        """
+        Load the current state of the changed objects and build the response.
+
+        Objects logged as updated that no longer exist are reported as
+        deleted; their tombstone follows in a later part of the log.
+        """
+        upserted = defaultdict(set)
+        deleted = defaultdict(set)
+        for (kind, object_id), action in latest.items():
+            if action == BoardChange.UPSERT:
+                upserted[kind].add(object_id)
+            else:
+                deleted[kind].add(object_id)
+
+        context = {"request": self.request}
+
+        tasks = Task.objects.filter(
+            board_id=board_id,
+            id__in=upserted[BoardChange.TASK],
+        ).select_related("assignee__userprofile", "reviewer__userprofile").order_by("id")
+        comments = TaskCommentModel.objects.filter(
+            task__board_id=board_id,
+            id__in=upserted[BoardChange.COMMENT],
+        ).select_related("author__userprofile").order_by("id")
+        members = User.objects.filter(
+            board_memberships__board_id=board_id,
+            id__in=upserted[BoardChange.MEMBER],
+        ).select_related("userprofile").order_by("id")
+
+        task_data = BoardChangeTaskSerializer(tasks, many=True, context=context).data
+        comment_data = BoardChangeCommentSerializer(comments, many=True, context=context).data
+        member_data = BoardMemberSerializer(members, many=True, context=context).data
+
+        board = None
+        if upserted[BoardChange.BOARD]:
+            board = Board.objects.filter(pk=board_id).values("id", "title", "owner_id").first()
+
+        def tombstones(kind, data):
+            missing = upserted[kind] - {item["id"] for item in data}
+            return sorted(deleted[kind] | missing)
+
+        return {
+            "cursor": cursor,
+            "has_more": has_more,
+            "board": board,
+            "tasks": task_data,
+            "deleted_tasks": tombstones(BoardChange.TASK, task_data),
+            "comments": comment_data,
+            "deleted_comments": tombstones(BoardChange.COMMENT, comment_data),
+            "members": member_data,
+            "removed_members": tombstones(BoardChange.MEMBER, member_data),
+        }
+
+
+class ExportContentNegotiation(DefaultContentNegotiation):
+    """
+    Content negotiation that ignores the ``format`` query parameter.
+
+    The export uses ``?format=`` to pick the export format, which DRF
+    would otherwise treat as a renderer override and answer with 404.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+class BoardExportView(APIView):
+    """
+    API view streaming a full export of a board.
+
+    Supports ``?format=json`` (default), ``ndjson`` and ``csv``. Members,
+    tasks and comments are read in batches while the response is being
+    sent, so memory use does not depend on the size of the board. Under
+    ASGI the export is streamed through an async iterator.
+    """
+
+    permission_classes = [IsAuthenticated]
+    content_negotiation_class = ExportContentNegotiation
+
+    def get(self, request, pk):
+        """
+        Stream the board in the requested format.
+        """
+        if get_board_owner_id(pk) is None:
+            raise NotFound("Board not found.")
+        if not is_board_member(request.user.id, pk):
+            raise PermissionDenied("You must be a member of the board to export it.")
+
+        query = BoardExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        export_format = query.validated_data["format"]
+
+        response = StreamingHttpResponse(
+            stream_board_export(pk, export_format, isinstance(request._request, ASGIRequest)),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="board-{pk}.{export_format}"'
+        return response
+
+
+class BoardImportView(APIView):
+    """
+    API view creating a board from an archive in the JSON export shape.
+
+    The requesting user becomes the owner. Members, assignees, reviewers
+    and comment authors are matched by email. Archives larger than the
+    request size limit can be loaded with ``manage.py import_board``.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Import the archive and return the new board with import statistics.
+
+        :raises ValidationError: If the archive is invalid
+        """
+        try:
+            board, stats = BoardImporter(request.user).run(records_from_json(request.data))
+        except BoardImportError as exc:
+            raise ValidationError(str(exc))
+
+        return Response(
+            {"id": board.id, "title": board.title, **stats},
+            status=status.HTTP_201_CREATED,
+        )
+
 
 class EmailCheckView(APIView):
     """
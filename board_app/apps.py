@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class BoardAppConfig(AppConfig):
     name = 'board_app'
+
+    def ready(self):
+        from board_app import signals  # noqa: F401
@@ -0,0 +1,78 @@
+import contextlib
+import contextvars
+
+from django.db import transaction
+
+from board_app.events import publish_changes
+from board_app.models import Board, BoardChange
+
+
+_purging_board = contextvars.ContextVar("purging_board", default=False)
+
+
+def record_change(board_id, kind, action, object_id):
+    """
+    Append a single entry to a board's change log.
+
+    Args:
+        board_id (int): The id of the changed board.
+        kind (str): One of the ``BoardChange`` kinds.
+        action (str): ``BoardChange.UPSERT`` or ``BoardChange.DELETE``.
+        object_id (int): The id of the changed object.
+    """
+    record_changes([(board_id, kind, action, object_id)])
+
+
+def record_changes(changes):
+    """
+    Append several entries to the change log with a single insert.
+
+    The versions of the affected boards are bumped in the same
+    transaction, and the entries are published to live board streams
+    once it commits.
+
+    Args:
+        changes (Iterable[tuple]): ``(board_id, kind, action, object_id)`` tuples.
+    """
+    entries = [
+        BoardChange(board_id=board_id, kind=kind, action=action, object_id=object_id)
+        for board_id, kind, action, object_id in changes
+    ]
+    if entries:
+        BoardChange.objects.bulk_create(entries)
+        Board.all_objects.filter(pk__in={entry.board_id for entry in entries}).bump_versions()
+        transaction.on_commit(lambda: publish_changes(entries))
+
+
+@contextlib.contextmanager
+def purging_board():
+    """
+    Treat all deletions inside the block as part of a board deletion.
+
+    Used while a deleted board is purged in batches, where tasks, comments
+    and memberships are deleted through their own querysets.
+    """
+    token = _purging_board.set(True)
+    try:
+        yield
+    finally:
+        _purging_board.reset(token)
+
+
+def is_board_deletion(origin):
+    """
+    Check whether a delete signal was caused by deleting a whole board.
+
+    Cascaded deletes of a board's tasks, comments and memberships are not
+    logged, since the change log itself is deleted with the board. The
+    same applies to deletions inside ``purging_board()``.
+
+    Args:
+        origin: The ``origin`` argument of the ``post_delete`` signal.
+
+    Returns:
+        bool: True if the deletion originated from a board.
+    """
+    if _purging_board.get() or isinstance(origin, Board):
+        return True
+    return getattr(origin, "model", None) is Board
@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from board_app.api.serializers import BoardDashboardSerializer
+from board_app.membership import aget_user_board_ids, get_user_board_ids
+from board_app.models import Board
+
+
+DASHBOARD_CACHE_TIMEOUT = getattr(settings, "BOARD_DASHBOARD_CACHE_TIMEOUT", 300)
+
+
+def dashboard_cache_key(user_id):
+    """
+    Return the cache key holding the serialized dashboard of a user.
+    """
+    return f"board-dashboard:user:{user_id}"
+
+
+def dashboard_queryset(user):
+    """
+    Return the boards of a user annotated with the dashboard counters.
+    """
+    return Board.objects.visible_to(user).with_dashboard_counts().order_by("id")
+
+
+def get_dashboard(user):
+    """
+    Return the serialized dashboard of a user.
+
+    The dashboard is cached per user together with the versions of its
+    boards. A cached dashboard is served as long as the user sees the
+    same boards in the same versions; checking this costs one query on
+    the board ids, which come from the membership cache. Any entry in a
+    board's change log bumps its version and so invalidates the
+    dashboards of all its members.
+
+    Args:
+        user (User): The user whose dashboard is requested.
+
+    Returns:
+        list: The serialized boards.
+    """
+    board_ids = get_user_board_ids(user.id)
+    versions = dict(Board.objects.filter(id__in=board_ids).values_list("id", "version")) if board_ids else {}
+
+    key = dashboard_cache_key(user.id)
+    cached = cache.get(key)
+    if cached is not None and cached["versions"] == versions:
+        return cached["data"]
+
+    data = list(BoardDashboardSerializer(dashboard_queryset(user), many=True).data)
+    cache.set(key, {"versions": versions, "data": data}, DASHBOARD_CACHE_TIMEOUT)
+    return data
+
+
+async def aget_dashboard(user):
+    """
+    Async variant of ``get_dashboard``.
+    """
+    board_ids = await aget_user_board_ids(user.id)
+    versions = {}
+    if board_ids:
+        async for board_id, version in Board.objects.filter(id__in=board_ids).values_list("id", "version"):
+            versions[board_id] = version
+
+    key = dashboard_cache_key(user.id)
+    cached = await cache.aget(key)
+    if cached is not None and cached["versions"] == versions:
+        return cached["data"]
+
+    boards = [board async for board in dashboard_queryset(user)]
+    data = list(BoardDashboardSerializer(boards, many=True).data)
+    await cache.aset(key, {"versions": versions, "data": data}, DASHBOARD_CACHE_TIMEOUT)
+    return data
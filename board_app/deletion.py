@@ -0,0 +1,69 @@
+import time
+
+from django.db import transaction
+from django.utils import timezone
+
+from board_app.changes import purging_board
+from board_app.membership import invalidate_board, invalidate_users
+from board_app.models import Board, BoardChange, BoardMembership
+from task_app.models import Task, TaskCommentModel
+
+
+def mark_board_deleted(board):
+    """
+    Hide a board right away and leave its content for the purge.
+
+    The board is excluded from ``Board.objects`` and from the cached board
+    ids of its members; its tasks, comments and memberships are removed
+    later by ``purge_board``.
+
+    Args:
+        board (Board): The board to delete.
+    """
+    member_ids = list(board.memberships.values_list("user_id", flat=True))
+    Board.all_objects.filter(pk=board.pk).update(deleted_at=timezone.now())
+    invalidate_board(board.pk)
+    invalidate_users(member_ids)
+
+
+def purge_board(board_id, batch_size=1000, pause=0):
+    """
+    Delete a board marked as deleted together with all of its content.
+
+    Comments, tasks, change log entries and memberships are deleted in
+    primary-key batches of at most ``batch_size`` rows, each batch in its
+    own transaction, so memory use and the time a write lock is held do
+    not grow with the size of the board.
+
+    Args:
+        board_id (int): The id of the deleted board.
+        batch_size (int): Maximum number of rows deleted per transaction.
+        pause (float): Seconds to sleep between batches, to let other
+            writers through.
+
+    Returns:
+        dict: The number of deleted rows per model.
+    """
+    querysets = {
+        "comments": TaskCommentModel.objects.filter(task__board_id=board_id),
+        "tasks": Task.objects.filter(board_id=board_id),
+        "changes": BoardChange.objects.filter(board_id=board_id),
+        "memberships": BoardMembership.objects.filter(board_id=board_id),
+    }
+    deleted = dict.fromkeys(querysets, 0)
+
+    with purging_board():
+        for name, queryset in querysets.items():
+            while True:
+                ids = list(queryset.order_by("pk").values_list("pk", flat=True)[:batch_size])
+                if not ids:
+                    break
+                with transaction.atomic():
+                    queryset.model.objects.filter(pk__in=ids).delete()
+                deleted[name] += len(ids)
+                if pause:
+                    time.sleep(pause)
+
+        Board.all_objects.filter(pk=board_id, deleted_at__isnull=False).delete()
+
+    return deleted
@@ -0,0 +1,149 @@
+import asyncio
+import functools
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+DEFAULT_BROKER = "board_app.events.InProcessBroker"
+
+
+class Subscription:
+    """
+    A single listener for the events of one board.
+
+    Events are delivered into an asyncio queue bound to the event loop
+    the subscription was created on. A subscription that falls too far
+    behind is marked as overflowed; its stream should end so the client
+    reconnects and catches up from the change log.
+    """
+
+    def __init__(self, broker, board_id, max_pending):
+        self.broker = broker
+        self.board_id = board_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.overflowed = False
+
+    async def __aenter__(self):
+        """
+        Start receiving events.
+        """
+        self.broker.add_subscription(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """
+        Stop receiving events.
+        """
+        self.broker.remove_subscription(self)
+
+    def deliver(self, event):
+        """
+        Queue an event; must be called on the subscription's event loop.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self):
+        """
+        Wait for the next event.
+        """
+        return await self.queue.get()
+
+
+class InProcessBroker:
+    """
+    Publish/subscribe broker for board events within one process.
+
+    ``publish`` may be called from any thread (typically a sync view's
+    ``on_commit`` hook); events are handed to each subscriber's event loop
+    with ``call_soon_threadsafe``. Idle subscribers cost one queue and no
+    thread.
+
+    Other backends (e.g. Redis pub/sub for multi-process deployments) can
+    be plugged in through the ``BOARD_EVENTS_BROKER`` setting; they need to
+    provide ``subscribe(board_id)`` returning an async context manager with
+    an async ``get()`` and ``overflowed`` flag, and ``publish(board_id, event)``.
+    """
+
+    max_pending = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, board_id):
+        """
+        Return a subscription to the events of a board.
+
+        Use as ``async with broker.subscribe(board_id) as subscription``.
+        """
+        return Subscription(self, board_id, self.max_pending)
+
+    def add_subscription(self, subscription):
+        """
+        Register a subscription; called when it is entered.
+        """
+        with self._lock:
+            self._subscriptions[subscription.board_id].add(subscription)
+
+    def remove_subscription(self, subscription):
+        """
+        Unregister a subscription; called when it is exited.
+        """
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.board_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.board_id]
+
+    def publish(self, board_id, event):
+        """
+        Deliver an event to all current subscribers of a board.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(board_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # The subscriber's event loop is closed.
+                self.remove_subscription(subscription)
+
+
+@functools.cache
+def get_broker():
+    """
+    Return the process-wide broker configured by ``BOARD_EVENTS_BROKER``.
+    """
+    return import_string(getattr(settings, "BOARD_EVENTS_BROKER", DEFAULT_BROKER))()
+
+
+def publish_changes(changes):
+    """
+    Publish saved ``BoardChange`` entries as board events.
+
+    Args:
+        changes (Iterable[BoardChange]): The committed change log entries.
+    """
+    broker = get_broker()
+    for change in changes:
+        broker.publish(change.board_id, serialize_change(change))
+
+
+def serialize_change(change):
+    """
+    Return the event payload for a change log entry.
+    """
+    return {
+        "id": change.pk,
+        "kind": change.kind,
+        "action": change.action,
+        "object_id": change.object_id,
+    }
@@ -0,0 +1,256 @@
+import csv
+import io
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+
+from board_app.models import Board, BoardMembership
+from task_app.models import Task, TaskCommentModel
+
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+CSV_COLUMNS = [
+    "type",
+    "id",
+    "task_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "assignee_email",
+    "reviewer_email",
+    "due_date",
+    "email",
+    "fullname",
+    "role",
+    "author_email",
+    "content",
+    "created_at",
+]
+
+
+def iter_board(board_id):
+    """
+    Yield the board record of the export.
+    """
+    yield from Board.objects.filter(pk=board_id).values(
+        "id",
+        "title",
+        owner_email=F("owner__email"),
+    )
+
+
+def iter_members(board_id, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yield one record per membership of the board.
+    """
+    yield from BoardMembership.objects.filter(board_id=board_id).order_by("pk").values(
+        "role",
+        email=F("user__email"),
+        fullname=F("user__userprofile__fullname"),
+    ).iterator(chunk_size=batch_size)
+
+
+def iter_task_batches(board_id, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yield the tasks of the board as lists of records, in keyset batches by id.
+    """
+    last_id = 0
+    while True:
+        batch = list(
+            Task.objects.filter(board_id=board_id, pk__gt=last_id).order_by("pk").values(
+                "id",
+                "title",
+                "description",
+                "status",
+                "priority",
+                "due_date",
+                "created_at",
+                assignee_email=F("assignee__email"),
+                reviewer_email=F("reviewer__email"),
+            )[:batch_size]
+        )
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]["id"]
+
+
+def iter_tasks(board_id, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yield one record per task of the board.
+    """
+    for batch in iter_task_batches(board_id, batch_size):
+        yield from batch
+
+
+def iter_comments(board_id, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Yield one record per comment on the board's tasks.
+
+    Comments are read per keyset batch of task ids, so every query uses
+    the index on the comment's task.
+    """
+    last_id = 0
+    while True:
+        task_ids = list(
+            Task.objects.filter(board_id=board_id, pk__gt=last_id).order_by("pk").values_list(
+                "pk", flat=True,
+            )[:batch_size]
+        )
+        if not task_ids:
+            return
+        yield from TaskCommentModel.objects.filter(task_id__in=task_ids).order_by("task_id", "pk").values(
+            "id",
+            "task_id",
+            "content",
+            "created_at",
+            author_email=F("author__email"),
+        ).iterator(chunk_size=batch_size)
+        last_id = task_ids[-1]
+
+
+def iter_records(board_id):
+    """
+    Yield ``(type, record)`` pairs for the whole board.
+    """
+    for record in iter_board(board_id):
+        yield "board", record
+    for record in iter_members(board_id):
+        yield "member", record
+    for record in iter_tasks(board_id):
+        yield "task", record
+    for record in iter_comments(board_id):
+        yield "comment", record
+
+
+def encode(record):
+    """
+    Encode a record as compact JSON.
+    """
+    return json.dumps(record, cls=DjangoJSONEncoder, separators=(",", ":"))
+
+
+def join_chunks(pieces, size=EXPORT_BATCH_SIZE):
+    """
+    Join small string pieces into chunks of up to ``size`` pieces.
+
+    Keeps the number of writes to the client low while holding at most
+    one chunk in memory. The first piece is sent on its own, so the
+    response starts before the first batch of rows is read.
+    """
+    pieces = iter(pieces)
+    first = next(pieces, None)
+    if first is not None:
+        yield first
+
+    chunk = []
+    for piece in pieces:
+        chunk.append(piece)
+        if len(chunk) >= size:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def stream_ndjson(board_id):
+    """
+    Stream the board as newline-delimited JSON, one typed record per line.
+    """
+    for record_type, record in iter_records(board_id):
+        yield encode({"type": record_type, **record}) + "\n"
+
+
+def stream_json(board_id):
+    """
+    Stream the board as one JSON document.
+
+    The document is written piece by piece, so only one batch of rows is
+    held in memory at a time.
+    """
+    board = next(iter_board(board_id), None)
+    yield '{"board":' + encode(board)
+
+    sections = [
+        ("members", iter_members(board_id)),
+        ("tasks", iter_tasks(board_id)),
+        ("comments", iter_comments(board_id)),
+    ]
+    for name, records in sections:
+        separator = "["
+        yield f',"{name}":'
+        for record in records:
+            yield separator + encode(record)
+            separator = ","
+        yield "[]" if separator == "[" else "]"
+    yield "}\n"
+
+
+def stream_csv(board_id):
+    """
+    Stream the board as CSV with one row per record and a ``type`` column.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS)
+
+    def flush():
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writeheader()
+    yield flush()
+    for record_type, record in iter_records(board_id):
+        if record_type == "board":
+            record = {"id": record["id"], "title": record["title"], "email": record["owner_email"]}
+        writer.writerow({"type": record_type, **record})
+        yield flush()
+
+
+STREAMS = {
+    "json": stream_json,
+    "ndjson": stream_ndjson,
+    "csv": stream_csv,
+}
+
+
+async def aiterate(iterator):
+    """
+    Yield the items of a sync iterator, reading each one in a thread.
+
+    Under ASGI, Django reads a sync streaming iterator into a list before
+    sending anything; pulling one chunk at a time keeps memory flat. The
+    chunks are read in the thread that holds the database connection.
+    """
+    read = sync_to_async(next)
+    done = object()
+    while (item := await read(iterator, done)) is not done:
+        yield item
+
+
+def stream_board_export(board_id, export_format, asynchronous=False):
+    """
+    Return an iterator over the export of a board in the given format.
+
+    Args:
+        board_id (int): The id of the exported board.
+        export_format (str): One of ``EXPORT_FORMATS``.
+        asynchronous (bool): Return an async iterator, for responses
+            served under ASGI.
+
+    Returns:
+        Iterator[str] | AsyncIterator[str]: The chunks of the export.
+    """
+    chunks = join_chunks(STREAMS[export_format](board_id))
+    return aiterate(chunks) if asynchronous else chunks
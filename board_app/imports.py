@@ -0,0 +1,348 @@
+import datetime
+import json
+import time
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Lower
+
+from board_app.deletion import mark_board_deleted, purge_board
+from board_app.membership import invalidate_users
+from board_app.models import Board, BoardMembership
+from task_app.models import Task, TaskCommentModel
+
+
+IMPORT_BATCH_SIZE = 2000
+
+# Number of emails resolved per query; keeps the IN clause below the
+# bound parameter limit of SQLite.
+EMAIL_LOOKUP_SIZE = 900
+
+
+class BoardImportError(ValueError):
+    """
+    Raised when a board archive cannot be imported.
+    """
+
+
+def records_from_json(data):
+    """
+    Yield ``(type, record)`` pairs from an archive in the JSON export shape.
+
+    Args:
+        data (dict): The parsed archive with ``board``, ``members``,
+            ``tasks`` and ``comments``.
+    """
+    if not isinstance(data, dict):
+        raise BoardImportError("The archive must be a JSON object.")
+    yield "board", data.get("board") or {}
+    for record_type, key in (("member", "members"), ("task", "tasks"), ("comment", "comments")):
+        records = data.get(key) or []
+        if not isinstance(records, list):
+            raise BoardImportError(f"The {key} must be a list.")
+        for record in records:
+            yield record_type, record
+
+
+def records_from_ndjson(lines):
+    """
+    Yield ``(type, record)`` pairs from an archive in the NDJSON export shape.
+
+    Args:
+        lines (Iterable[str]): The lines of the archive.
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            raise BoardImportError(f"Line {number} is not valid JSON.")
+        if not isinstance(record, dict):
+            raise BoardImportError(f"Line {number} is not a JSON object.")
+        yield record.pop("type", None), record
+
+
+class BoardImporter:
+    """
+    Create a board with its members, tasks and comments from an archive.
+
+    Records are consumed in the order of the export (board, members,
+    tasks, comments) and inserted with ``bulk_create`` in chunks of
+    ``batch_size``. By default the whole import runs in one transaction;
+    with ``atomic=False`` every chunk is committed on its own, so a large
+    import does not hold the database write lock until it is done, and a
+    failed import deletes the partly imported board again. Member emails are resolved to
+    users in one batched lookup; assignees, reviewers and comment authors
+    are matched against the resolved members. Only one chunk of records
+    is held in memory, plus the mapping from archived to new task ids.
+
+    The importing user becomes the owner of the new board.
+    """
+
+    def __init__(self, owner, batch_size=IMPORT_BATCH_SIZE, atomic=True):
+        self.owner = owner
+        self.batch_size = batch_size
+        self.atomic = atomic
+        self.board = None
+        self.user_ids = {owner.email.lower(): owner.id} if owner.email else {}
+        self.task_ids = {}
+        self.pending_members = []
+        self.pending_tasks = []
+        self.pending_comments = []
+        self.stats = {
+            "members": 0,
+            "tasks": 0,
+            "comments": 0,
+            "unresolved_emails": 0,
+            "skipped_comments": 0,
+        }
+        self.status_choices = {value for value, _ in Task._meta.get_field("status").choices}
+        self.priority_choices = {value for value, _ in Task._meta.get_field("priority").choices}
+
+    def run(self, records):
+        """
+        Import all records and return the board and import statistics.
+
+        Args:
+            records (Iterable[tuple]): ``(type, record)`` pairs, e.g. from
+                ``records_from_json`` or ``records_from_ndjson``.
+
+        Returns:
+            tuple: The new ``Board`` and a dictionary with the number of
+            imported rows, the duration and the rows per second.
+
+        Raises:
+            BoardImportError: If the archive is invalid.
+        """
+        started = time.perf_counter()
+
+        if self.atomic:
+            with transaction.atomic():
+                self.import_records(records)
+        else:
+            try:
+                self.import_records(records)
+            except Exception:
+                if self.board is not None:
+                    mark_board_deleted(self.board)
+                    purge_board(self.board.pk, self.batch_size)
+                raise
+
+        seconds = time.perf_counter() - started
+        rows = self.stats["members"] + self.stats["tasks"] + self.stats["comments"]
+        self.stats["seconds"] = round(seconds, 3)
+        self.stats["rows_per_second"] = round(rows / seconds) if seconds else rows
+        return self.board, self.stats
+
+    def import_records(self, records):
+        """
+        Dispatch the records to their handlers and insert what is queued.
+        """
+        handlers = {
+            "board": self.add_board,
+            "member": self.add_member,
+            "task": self.add_task,
+            "comment": self.add_comment,
+        }
+
+        for record_type, record in records:
+            handler = handlers.get(record_type)
+            if handler is None:
+                raise BoardImportError(f"Unknown record type {record_type!r}.")
+            if self.board is None and record_type != "board":
+                raise BoardImportError("The archive must start with the board.")
+            if not isinstance(record, dict):
+                raise BoardImportError(f"A {record_type} record is not a JSON object.")
+            handler(record)
+
+        if self.board is None:
+            raise BoardImportError("The archive does not contain a board.")
+        self.flush_members()
+        self.flush_tasks()
+        self.flush_comments()
+        self.update_comment_counts()
+
+    def add_board(self, record):
+        """
+        Create the board from the board record.
+        """
+        if self.board is not None:
+            raise BoardImportError("The archive contains more than one board.")
+        title = record.get("title")
+        if not title:
+            raise BoardImportError("The board needs a title.")
+        self.board = Board.objects.create(title=title, owner=self.owner)
+
+    def add_member(self, record):
+        """
+        Queue a member; members are resolved once all of them are read.
+        """
+        email = self.get_email(record, "email")
+        if email:
+            self.pending_members.append(email)
+
+    def add_task(self, record):
+        """
+        Queue a task and insert the queue once it is full.
+        """
+        self.flush_members()
+
+        status = record.get("status") or "to-do"
+        priority = record.get("priority") or "medium"
+        self.check_id(record, "id")
+        if not record.get("title"):
+            raise BoardImportError(f"Task {record.get('id')} needs a title.")
+        if status not in self.status_choices or priority not in self.priority_choices:
+            raise BoardImportError(f"Task {record.get('id')} has an invalid status or priority.")
+
+        self.pending_tasks.append((
+            record.get("id"),
+            Task(
+                board=self.board,
+                title=record["title"],
+                description=record.get("description") or "",
+                status=status,
+                priority=priority,
+                assignee_id=self.resolve_user(self.get_email(record, "assignee_email")),
+                reviewer_id=self.resolve_user(self.get_email(record, "reviewer_email")),
+                due_date=self.parse_date(record.get("due_date"), record.get("id")),
+                created_by=self.owner,
+            ),
+        ))
+        if len(self.pending_tasks) >= self.batch_size:
+            self.flush_tasks()
+
+    def add_comment(self, record):
+        """
+        Queue a comment and insert the queue once it is full.
+
+        Comments whose task or author cannot be found are skipped.
+        """
+        self.flush_members()
+        self.flush_tasks()
+
+        task_id = self.task_ids.get(self.check_id(record, "task_id"))
+        author_id = self.resolve_user(self.get_email(record, "author_email"))
+        if task_id is None or author_id is None:
+            self.stats["skipped_comments"] += 1
+            return
+
+        self.pending_comments.append(TaskCommentModel(
+            task_id=task_id,
+            author_id=author_id,
+            content=record.get("content"),
+        ))
+        if len(self.pending_comments) >= self.batch_size:
+            self.flush_comments()
+
+    def flush_members(self):
+        """
+        Resolve the queued member emails and insert their memberships.
+        """
+        if not self.pending_members:
+            return
+
+        emails = list(dict.fromkeys(email.lower() for email in self.pending_members))
+        self.pending_members = []
+        for start in range(0, len(emails), EMAIL_LOOKUP_SIZE):
+            users = User.objects.annotate(
+                email_lower=Lower("email"),
+            ).filter(
+                email_lower__in=emails[start:start + EMAIL_LOOKUP_SIZE],
+            ).order_by("id").values_list("email_lower", "id")
+            for email, user_id in users:
+                self.user_ids.setdefault(email, user_id)
+
+        member_ids = {self.user_ids.get(email) for email in emails}
+        self.stats["unresolved_emails"] += sum(1 for email in emails if email not in self.user_ids)
+        memberships = [
+            BoardMembership(board=self.board, user_id=user_id)
+            for user_id in member_ids - {None, self.owner.id}
+        ]
+        BoardMembership.objects.bulk_create(memberships, batch_size=self.batch_size, ignore_conflicts=True)
+        invalidate_users(membership.user_id for membership in memberships)
+        self.stats["members"] += len(memberships)
+
+    def flush_tasks(self):
+        """
+        Insert the queued tasks and remember their new ids.
+        """
+        if not self.pending_tasks:
+            return
+
+        archived_ids = [archived_id for archived_id, _ in self.pending_tasks]
+        tasks = Task.objects.bulk_create([task for _, task in self.pending_tasks])
+        self.pending_tasks = []
+        for archived_id, task in zip(archived_ids, tasks):
+            if archived_id is not None:
+                self.task_ids[archived_id] = task.pk
+        self.stats["tasks"] += len(tasks)
+
+    def flush_comments(self):
+        """
+        Insert the queued comments.
+        """
+        if not self.pending_comments:
+            return
+
+        TaskCommentModel.objects.bulk_create(self.pending_comments)
+        self.stats["comments"] += len(self.pending_comments)
+        self.pending_comments = []
+
+    def update_comment_counts(self):
+        """
+        Set ``comments_count`` of all imported tasks with one statement.
+        """
+        if not self.stats["comments"]:
+            return
+
+        comment_counts = TaskCommentModel.objects.filter(
+            task_id=OuterRef("pk"),
+        ).order_by().values("task_id").annotate(
+            count=Count("pk"),
+        ).values("count")
+        Task.objects.filter(board=self.board).update(
+            comments_count=Coalesce(Subquery(comment_counts), 0),
+        )
+
+    def get_email(self, record, key):
+        """
+        Return an email field of a record, or None if it is empty.
+        """
+        email = record.get(key)
+        if email and not isinstance(email, str):
+            raise BoardImportError(f"The {key} {email!r} is not a string.")
+        return email or None
+
+    def check_id(self, record, key):
+        """
+        Return an archived id field of a record after checking its type.
+        """
+        value = record.get(key)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, str))):
+            raise BoardImportError(f"The {key} {value!r} is not a valid id.")
+        return value
+
+    def resolve_user(self, email):
+        """
+        Return the id of a resolved member, or None.
+        """
+        if not email:
+            return None
+        user_id = self.user_ids.get(email.lower())
+        if user_id is None:
+            self.stats["unresolved_emails"] += 1
+        return user_id
+
+    def parse_date(self, value, task_id):
+        """
+        Parse an ISO due date.
+        """
+        if not value:
+            return None
+        try:
+            return datetime.date.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise BoardImportError(f"Task {task_id} has an invalid due date.")
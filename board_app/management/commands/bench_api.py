@@ -0,0 +1,310 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+
+from board_app.models import Board
+from core.benchmarks import summarize
+from task_app.models import Task
+
+
+# Share of requests per endpoint: clients mostly poll the dashboard and
+# open boards; writes and logins are rarer.
+DEFAULT_MIX = {
+    "dashboard": 50,
+    "board-detail": 25,
+    "task-patch": 15,
+    "comment-create": 8,
+    "login": 2,
+}
+
+TASKS_PER_USER = 50
+
+
+class VirtualUser:
+    """
+    A seeded user with a token and the boards and tasks it works on.
+    """
+
+    def __init__(self, user, token, board_ids, task_ids):
+        self.user = user
+        self.token = token
+        self.board_ids = board_ids
+        self.task_ids = task_ids
+
+
+class Command(BaseCommand):
+    """
+    Load-test the API in-process through Django's WSGI and ASGI handlers.
+
+    Every virtual user repeatedly sends a request drawn from the mix
+    (dashboard polling, board detail, task PATCH, comment create and
+    login by default), as a seeded user, until ``--duration`` is over.
+    Requests go through the complete handler with all middleware and the
+    real URL conf; no sockets or HTTP server are involved. Under WSGI
+    every virtual user is a thread, under ASGI a coroutine on one event
+    loop.
+
+    Prints throughput and p50/p95/p99 latency per endpoint as JSON, so
+    two commits can be compared on the same machine and database. Run it
+    against a database filled by ``seed_kanban``; the users must share
+    the ``--password`` for the login requests. Task updates and new
+    comments are written to that database.
+    """
+
+    help = "Benchmark the API in-process with concurrent virtual users through WSGI and ASGI."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=16, help="Concurrent virtual users (default: 16).")
+        parser.add_argument("--duration", type=float, default=10, help="Seconds per handler (default: 10).")
+        parser.add_argument(
+            "--handler",
+            choices=["wsgi", "asgi", "both"],
+            default="both",
+            help="Handler to benchmark (default: both).",
+        )
+        parser.add_argument(
+            "--mix",
+            help="Endpoint weights, e.g. dashboard=50,board-detail=25 (default: "
+            + ",".join(f"{name}={weight}" for name, weight in DEFAULT_MIX.items()) + ").",
+        )
+        parser.add_argument(
+            "--password",
+            default="kanmind-seed",
+            help="Password of the seeded users, used for login (default: kanmind-seed).",
+        )
+        parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42).")
+
+    def handle(self, *args, **options):
+        mix = self.parse_mix(options["mix"])
+        virtual_users = self.load_virtual_users(options["users"])
+        self.password = options["password"]
+        self.factory = RequestFactory()
+
+        handlers = ["wsgi", "asgi"] if options["handler"] == "both" else [options["handler"]]
+        results = {
+            "config": {
+                "users": len(virtual_users),
+                "duration": options["duration"],
+                "mix": mix,
+                "database": settings.DATABASES["default"]["ENGINE"],
+            },
+        }
+        # The request factory sends requests for the "testserver" host.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for handler in handlers:
+                rng = random.Random(options["seed"])
+                plans = [(virtual_user, random.Random(rng.random())) for virtual_user in virtual_users]
+                if handler == "wsgi":
+                    samples, elapsed = self.run_wsgi(plans, mix, options["duration"])
+                else:
+                    samples, elapsed = asyncio.run(self.run_asgi(plans, mix, options["duration"]))
+                results[handler] = self.report(samples, elapsed)
+
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def parse_mix(self, value):
+        """
+        Parse ``--mix`` into endpoint weights.
+        """
+        if not value:
+            return dict(DEFAULT_MIX)
+        mix = {}
+        for item in value.split(","):
+            name, _, weight = item.partition("=")
+            if name not in DEFAULT_MIX:
+                raise CommandError(f"Unknown endpoint {name!r}; choose from {', '.join(DEFAULT_MIX)}.")
+            try:
+                mix[name] = float(weight)
+            except ValueError:
+                raise CommandError(f"Invalid weight for {name!r}.")
+        if not any(weight > 0 for weight in mix.values()):
+            raise CommandError("At least one endpoint needs a positive weight.")
+        return mix
+
+    def load_virtual_users(self, count):
+        """
+        Pick users that are members of a board with tasks.
+        """
+        user_ids = list(
+            Task.objects.filter(board__deleted_at__isnull=True)
+            .values_list("board__memberships__user_id", flat=True)
+            .order_by("board__memberships__user_id")
+            .distinct()[:count]
+        )
+        if len(user_ids) < count:
+            raise CommandError(
+                f"Found {len(user_ids)} users with tasks on their boards, {count} needed. "
+                "Fill the database with manage.py seed_kanban first."
+            )
+
+        virtual_users = []
+        for user in User.objects.filter(id__in=user_ids).order_by("id"):
+            token, _ = Token.objects.get_or_create(user=user)
+            board_ids = list(Board.objects.visible_to(user).order_by("id").values_list("id", flat=True))
+            task_ids = list(
+                Task.objects.filter(board_id__in=board_ids).order_by("id").values_list("id", flat=True)[:TASKS_PER_USER]
+            )
+            virtual_users.append(VirtualUser(user, token.key, board_ids, task_ids))
+        return virtual_users
+
+    def build_request(self, name, virtual_user, rng):
+        """
+        Return ``(method, path, body)`` of a request to the given endpoint.
+        """
+        if name == "dashboard":
+            return "GET", reverse("boardDashboard"), None
+        if name == "board-detail":
+            return "GET", reverse("board-detail", kwargs={"pk": rng.choice(virtual_user.board_ids)}), None
+        if name == "task-patch":
+            task_id = rng.choice(virtual_user.task_ids)
+            body = {"status": rng.choice(["to-do", "in-progress", "review", "done"])}
+            return "PATCH", reverse("task", kwargs={"pk": task_id}), body
+        if name == "comment-create":
+            task_id = rng.choice(virtual_user.task_ids)
+            body = {"content": "Benchmark comment"}
+            return "POST", reverse("comment-collection", kwargs={"pk": task_id}), body
+        body = {"email": virtual_user.user.email, "password": self.password}
+        return "POST", reverse("login"), body
+
+    def next_request(self, virtual_user, rng, mix):
+        """
+        Draw the next endpoint from the mix and build its request.
+        """
+        name = rng.choices(list(mix), weights=list(mix.values()))[0]
+        return (name, *self.build_request(name, virtual_user, rng))
+
+    def run_wsgi(self, plans, mix, duration):
+        """
+        Run every virtual user in its own thread against the WSGI handler.
+        """
+        handler = WSGIHandler()
+        samples = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def run(virtual_user, rng):
+            own_samples = []
+            while time.perf_counter() < deadline:
+                name, method, path, body = self.next_request(virtual_user, rng, mix)
+                request = self.factory.generic(
+                    method,
+                    path,
+                    json.dumps(body) if body is not None else "",
+                    content_type="application/json",
+                    HTTP_AUTHORIZATION=f"Token {virtual_user.token}",
+                )
+                status = []
+                started = time.perf_counter()
+                response = handler(request.environ, lambda code, headers: status.append(int(code[:3])))
+                try:
+                    b"".join(response)
+                finally:
+                    response.close()
+                own_samples.append((name, status[0], time.perf_counter() - started))
+            with lock:
+                samples.extend(own_samples)
+
+        threads = [threading.Thread(target=run, args=plan) for plan in plans]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return samples, time.perf_counter() - started
+
+    async def run_asgi(self, plans, mix, duration):
+        """
+        Run every virtual user as a coroutine against the ASGI handler.
+        """
+        handler = ASGIHandler()
+        samples = []
+        deadline = time.perf_counter() + duration
+
+        async def run(virtual_user, rng):
+            while time.perf_counter() < deadline:
+                name, method, path, body = self.next_request(virtual_user, rng, mix)
+                started = time.perf_counter()
+                status = await call_asgi(handler, method, path, body, virtual_user.token)
+                samples.append((name, status, time.perf_counter() - started))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(run(*plan) for plan in plans))
+        return samples, time.perf_counter() - started
+
+    def report(self, samples, elapsed):
+        """
+        Summarize all samples and the samples of every endpoint.
+        """
+        by_endpoint = defaultdict(list)
+        for name, status, duration in samples:
+            by_endpoint[name].append((status, duration))
+
+        return {
+            "total": summarize([(status, duration) for _, status, duration in samples], elapsed),
+            "endpoints": {
+                name: summarize(endpoint_samples, elapsed)
+                for name, endpoint_samples in sorted(by_endpoint.items())
+            },
+        }
+
+
+async def call_asgi(handler, method, path, body, token):
+    """
+    Send one HTTP request through an ASGI application and return the status.
+    """
+    url = urlsplit(path)
+    payload = json.dumps(body).encode() if body is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "headers": [
+            (b"host", b"testserver"),
+            (b"authorization", f"Token {token}".encode()),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+    disconnected = asyncio.Event()
+    status = []
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        # The handler listens for a disconnect while the view runs.
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    try:
+        await handler(scope, receive, send)
+    finally:
+        disconnected.set()
+    if not status:
+        raise CommandError(f"{method} {path} ended without sending a response.")
+    return status[0]
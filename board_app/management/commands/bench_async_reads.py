@@ -0,0 +1,101 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+
+from board_app.models import Board
+from core.benchmarks import summarize
+from task_app.models import Task
+
+
+class Command(BaseCommand):
+    """
+    Compare the sync DRF read endpoints with their async variants.
+
+    Every endpoint is requested ``--requests`` times with ``--concurrency``
+    requests in flight: the sync views from a thread pool, the async views
+    as concurrent coroutines on one event loop. Both run in-process
+    against the configured database, so results are comparable between
+    runs on the same machine.
+    """
+
+    help = "Benchmark the sync and async read endpoints against each other."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", required=True, help="Email of the user to request as.")
+        parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and mode (default: 200).")
+        parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight (default: 16).")
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(email=options["email"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user with email {options['email']}.")
+
+        token, _ = Token.objects.get_or_create(user=user)
+        board = Board.objects.visible_to(user).order_by("id").first()
+        task = Task.objects.filter(board=board).order_by("id").first() if board else None
+        if task is None:
+            raise CommandError("The user needs at least one board with a task.")
+
+        endpoints = {
+            "dashboard": ("boardDashboard", "boardDashboard-async", {}),
+            "board-detail": ("board-detail", "board-detail-async", {"pk": board.pk}),
+            "assigned-to-me": ("tasks-assigned-to-me", "tasks-assigned-to-me-async", {}),
+            "reviewing": ("tasks-reviewed-to-me", "tasks-reviewed-to-me-async", {}),
+            "comments": ("comment-collection", "comment-collection-async", {"pk": task.pk}),
+        }
+
+        results = {}
+        # The test clients send requests for the "testserver" host.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for name, (sync_name, async_name, kwargs) in endpoints.items():
+                results[name] = {
+                    "sync": self.run_sync(reverse(sync_name, kwargs=kwargs), token.key, options),
+                    "async": asyncio.run(self.run_async(reverse(async_name, kwargs=kwargs), token.key, options)),
+                }
+
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def run_sync(self, url, token, options):
+        """
+        Request a sync endpoint from a thread pool and return the statistics.
+        """
+        client = Client(HTTP_AUTHORIZATION=f"Token {token}")
+
+        def request():
+            started = time.perf_counter()
+            response = client.get(url)
+            return response.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            samples = list(executor.map(lambda _: request(), range(options["requests"])))
+        return summarize(samples, time.perf_counter() - started)
+
+    async def run_async(self, url, token, options):
+        """
+        Request an async endpoint from concurrent coroutines and return the statistics.
+        """
+        client = AsyncClient()
+        headers = {"Authorization": f"Token {token}"}
+        semaphore = asyncio.Semaphore(options["concurrency"])
+
+        async def request():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(url, headers=headers)
+                return response.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        samples = await asyncio.gather(*(request() for _ in range(options["requests"])))
+        return summarize(samples, time.perf_counter() - started)
+
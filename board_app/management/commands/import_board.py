@@ -0,0 +1,71 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from board_app.imports import (
+    IMPORT_BATCH_SIZE,
+    BoardImporter,
+    BoardImportError,
+    records_from_json,
+    records_from_ndjson,
+)
+
+
+class Command(BaseCommand):
+    """
+    Create a board from an export archive.
+
+    NDJSON archives are read line by line, so their size is not limited
+    by memory; JSON archives are loaded completely before the import.
+    Every batch is committed on its own, so other writers are not locked
+    out for the whole import; if the import fails, the partly imported
+    board is deleted again.
+    Prints the number of imported rows and the rows per second.
+    """
+
+    help = (
+        "Import a board archive (JSON or NDJSON export) with batched inserts. "
+        "Each batch is committed separately; a failed import is removed again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path of the archive.")
+        parser.add_argument(
+            "--owner",
+            required=True,
+            help="Email of the user who becomes the owner of the board.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["json", "ndjson"],
+            help="Archive format (default: guessed from the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help=f"Number of rows inserted per query (default: {IMPORT_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        owner = User.objects.filter(email=options["owner"]).order_by("id").first()
+        if owner is None:
+            raise CommandError(f"No user with email {options['owner']}.")
+
+        path = options["path"]
+        archive_format = options["format"] or ("ndjson" if path.endswith(".ndjson") else "json")
+        importer = BoardImporter(owner, options["batch_size"], atomic=False)
+
+        try:
+            with open(path, encoding="utf-8") as archive:
+                if archive_format == "ndjson":
+                    board, stats = importer.run(records_from_ndjson(archive))
+                else:
+                    board, stats = importer.run(records_from_json(json.load(archive)))
+        except BoardImportError as exc:
+            raise CommandError(f"Invalid archive: {exc}")
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(json.dumps({"id": board.id, "title": board.title, **stats}, indent=2))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from board_app.deletion import purge_board
+from board_app.models import Board
+
+
+class Command(BaseCommand):
+    """
+    Purge boards that were deleted through the API.
+
+    Deleting a board only marks it as deleted; this command removes the
+    boards and their comments, tasks, change log and memberships in
+    bounded batches. Run it periodically (e.g. from cron) or as a worker.
+    """
+
+    help = "Delete boards marked as deleted together with their content, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Maximum number of rows deleted per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to wait between batches (default: 0).",
+        )
+        parser.add_argument(
+            "--board",
+            type=int,
+            help="Only purge the deleted board with this id.",
+        )
+
+    def handle(self, *args, **options):
+        boards = Board.all_objects.filter(deleted_at__isnull=False).order_by("deleted_at")
+        if options["board"] is not None:
+            boards = boards.filter(pk=options["board"])
+
+        board_ids = list(boards.values_list("pk", flat=True))
+        for board_id in board_ids:
+            deleted = purge_board(board_id, options["batch_size"], options["pause"])
+            summary = ", ".join(f"{count} {name}" for name, count in deleted.items())
+            self.stdout.write(f"Board {board_id}: deleted {summary}")
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {len(board_ids)} deleted boards."))
@@ -0,0 +1,178 @@
+import json
+import statistics
+from collections import Counter, defaultdict
+from itertools import islice
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory, override_settings
+from django.urls import NoReverseMatch, reverse
+
+from rest_framework.authtoken.models import Token
+
+from core.benchmarks import percentiles
+from core.capture import read_trace
+from core.instrumentation import install_query_timer, track_request
+
+
+class Command(BaseCommand):
+    """
+    Replay requests recorded by ``TrafficCaptureMiddleware``.
+
+    The trace is replayed in recording order, one request at a time,
+    through the WSGI handler against the configured database, as the
+    recorded users (their tokens are created when missing). Run it
+    against a snapshot of the production database and restore the
+    snapshot before every run, as replayed writes change it.
+
+    Prints per endpoint the recorded and replayed latency and query
+    count and their difference as JSON. With ``--baseline`` the
+    difference is taken to an earlier replay report instead, e.g. of
+    the previous commit. Requests whose body was too large to capture,
+    or whose URL or user no longer exists, are skipped and counted.
+    """
+
+    help = "Replay a captured request trace and report latency and query deltas per endpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="Capture files, oldest first (capture.log.1 capture.log).",
+        )
+        parser.add_argument("--baseline", help="Report of an earlier replay to compare with.")
+        parser.add_argument("--limit", type=int, help="Replay at most this many requests.")
+
+    def handle(self, *args, **options):
+        baseline = {}
+        if options["baseline"]:
+            try:
+                with open(options["baseline"], encoding="utf-8") as report:
+                    baseline = json.load(report)["endpoints"]
+            except (OSError, ValueError, KeyError) as exc:
+                raise CommandError(f"Cannot read the baseline: {exc}")
+
+        install_query_timer()
+        self.handler = WSGIHandler()
+        self.factory = RequestFactory()
+        self.tokens = {}
+        samples = defaultdict(list)
+        skipped = Counter()
+
+        # The request factory sends requests for the "testserver" host.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            try:
+                for entry in islice(read_trace(options["paths"]), options["limit"]):
+                    reason = self.replay(entry, samples)
+                    if reason:
+                        skipped[reason] += 1
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read the trace: {exc}")
+
+        self.stdout.write(json.dumps({
+            "replayed": sum(map(len, samples.values())),
+            "skipped": dict(skipped),
+            "endpoints": {
+                key: self.report(endpoint_samples, baseline.get(key, {}).get("replay"))
+                for key, endpoint_samples in sorted(samples.items())
+            },
+        }, indent=2))
+
+    def replay(self, entry, samples):
+        """
+        Send one recorded request and add its measurements to ``samples``.
+
+        :return: The reason the request was skipped, or None
+        """
+        if entry["body"] is None and entry["body_size"]:
+            return "body not captured"
+        try:
+            path = reverse(entry["url_name"], kwargs=entry["kwargs"])
+        except NoReverseMatch:
+            return "unknown url"
+        if entry["query"]:
+            path += "?" + urlencode(entry["query"])
+
+        headers = {}
+        if entry["user_id"] is not None:
+            token = self.get_token(entry["user_id"])
+            if token is None:
+                return "unknown user"
+            headers["HTTP_AUTHORIZATION"] = f"Token {token}"
+
+        request = self.factory.generic(
+            entry["method"],
+            path,
+            json.dumps(entry["body"]) if entry["body"] is not None else "",
+            content_type="application/json",
+            **headers,
+        )
+        status = []
+        with track_request() as timing:
+            response = self.handler(request.environ, lambda code, response_headers: status.append(int(code[:3])))
+            try:
+                b"".join(response)
+            finally:
+                response.close()
+
+        samples[f"{entry['method']} {entry['url_name']}"].append({
+            "recorded_ms": entry["duration_ms"],
+            "recorded_queries": entry["queries"],
+            "replay_ms": timing.view_time * 1000,
+            "replay_queries": timing.query_count,
+            "status_changed": status[0] != entry["status"],
+        })
+        return None
+
+    def get_token(self, user_id):
+        """
+        Return the token key of a user, creating the token if needed.
+        """
+        if user_id not in self.tokens:
+            user = User.objects.filter(pk=user_id).first()
+            self.tokens[user_id] = Token.objects.get_or_create(user=user)[0].key if user else None
+        return self.tokens[user_id]
+
+    def report(self, samples, reference=None):
+        """
+        Summarize the samples of one endpoint.
+
+        :param reference: Replay statistics of the baseline; defaults to
+            the recorded statistics
+        """
+        recorded = summarize(
+            [sample["recorded_ms"] for sample in samples],
+            [sample["recorded_queries"] for sample in samples],
+        )
+        replay = summarize(
+            [sample["replay_ms"] for sample in samples],
+            [sample["replay_queries"] for sample in samples],
+        )
+        reference = reference or recorded
+        return {
+            "requests": len(samples),
+            "status_changes": sum(sample["status_changed"] for sample in samples),
+            "recorded": recorded,
+            "replay": replay,
+            "delta": {
+                name: round(replay[name] - reference[name], 2)
+                for name in ("p50_ms", "p95_ms", "queries_mean")
+                if name in reference
+            },
+        }
+
+
+def summarize(latencies, queries):
+    """
+    Return latency percentiles and the mean query count.
+    """
+    p50, p95, p99 = percentiles(latencies)
+    return {
+        "p50_ms": round(p50, 2),
+        "p95_ms": round(p95, 2),
+        "p99_ms": round(p99, 2),
+        "queries_mean": round(statistics.fmean(queries), 2),
+    }
@@ -0,0 +1,275 @@
+import datetime
+import random
+import time
+from array import array
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from auth_app.models import UserProfile
+from board_app.models import Board, BoardMembership
+from task_app.models import Task, TaskCommentModel
+
+
+FIRST_NAMES = [
+    "Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hannah", "Jonas", "Lea",
+    "Lukas", "Marie", "Max", "Mia", "Noah", "Paul", "Sophie", "Tim", "Lina", "Elias",
+]
+LAST_NAMES = [
+    "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker",
+    "Schulz", "Hoffmann", "Koch", "Richter", "Klein", "Wolf", "Neumann", "Schwarz",
+]
+BOARD_TOPICS = [
+    "Website Relaunch", "Mobile App", "Onboarding", "Marketing Q3", "Infrastructure",
+    "Customer Support", "Billing", "Design System", "Data Platform", "Hiring",
+]
+TASK_VERBS = ["Fix", "Add", "Refactor", "Review", "Document", "Test", "Design", "Migrate", "Update", "Remove"]
+TASK_NOUNS = [
+    "login form", "checkout flow", "user settings", "search index", "email templates",
+    "API pagination", "error handling", "dashboard charts", "deployment script", "access rules",
+    "invoice export", "notification center", "file upload", "onboarding tour", "audit log",
+]
+COMMENT_TEXTS = [
+    "Looks good to me.", "Can you add a test for this?", "I'll take a look tomorrow.",
+    "Blocked by the API change.", "Done, please review.", "Moved to the next sprint.",
+    "This needs a second opinion.", "Works on staging.", "Found a small edge case.",
+    "Updated the description.",
+]
+
+# Share of tasks per status and priority, roughly what a board in
+# active use looks like: most work is open, little is in review.
+STATUS_WEIGHTS = {"to-do": 35, "in-progress": 25, "review": 10, "done": 30}
+PRIORITY_WEIGHTS = {"low": 30, "medium": 50, "high": 20}
+
+# Due dates are spread around this day unless --today is given, so the
+# same seed produces the same data whenever it runs.
+DEFAULT_TODAY = datetime.date(2026, 1, 1)
+
+
+class Command(BaseCommand):
+    """
+    Fill the database with a realistic, reproducible dataset.
+
+    Creates users with profiles, boards with memberships, tasks and
+    comments. Boards differ in size (a few large boards hold most tasks),
+    assignees and reviewers are members of the task's board, statuses
+    and priorities follow ``STATUS_WEIGHTS`` and ``PRIORITY_WEIGHTS``,
+    and due dates spread from a month before to two months after
+    ``--today``, some tasks having none. The same ``--seed`` and
+    ``--today`` produce the same data.
+
+    Rows are written with ``bulk_create`` in chunks of ``--batch-size``,
+    one transaction per chunk, and only ids are kept in memory, so
+    millions of tasks can be generated. All users share one password
+    hash; the change log is not filled.
+    """
+
+    help = "Generate users, boards, memberships, tasks and comments for benchmarks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="Number of users (default: 1000).")
+        parser.add_argument("--boards", type=int, default=100, help="Number of boards (default: 100).")
+        parser.add_argument(
+            "--members-per-board",
+            type=int,
+            default=10,
+            help="Average number of members per board, owner included (default: 10).",
+        )
+        parser.add_argument("--tasks", type=int, default=10000, help="Number of tasks (default: 10000).")
+        parser.add_argument("--comments", type=int, default=30000, help="Number of comments (default: 30000).")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42).")
+        parser.add_argument(
+            "--today",
+            type=datetime.date.fromisoformat,
+            default=DEFAULT_TODAY,
+            help=f"Day the due dates are spread around, YYYY-MM-DD (default: {DEFAULT_TODAY}).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows written per transaction (default: 5000).",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="seed",
+            help="Prefix of the generated usernames and emails (default: seed).",
+        )
+        parser.add_argument(
+            "--password",
+            default="kanmind-seed",
+            help="Password of all generated users (default: kanmind-seed).",
+        )
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["boards"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--users, --boards and --batch-size must be at least 1.")
+        if options["comments"] and not options["tasks"]:
+            raise CommandError("Comments need at least one task.")
+        if User.objects.filter(username__startswith=f"{options['prefix']}-").exists():
+            raise CommandError(f"Users with the prefix {options['prefix']!r} exist already; choose another --prefix.")
+
+        self.rng = random.Random(options["seed"])
+        self.verbosity = options["verbosity"]
+        self.batch_size = options["batch_size"]
+        self.today = options["today"]
+        started = time.perf_counter()
+
+        user_ids = self.create_users(options["users"], options["prefix"], options["password"])
+        board_ids, board_members = self.create_boards(options["boards"], user_ids, options["members_per_board"])
+        tasks, comments = self.create_tasks(options["tasks"], options["comments"], board_ids, board_members)
+
+        seconds = time.perf_counter() - started
+        rows = len(user_ids) * 2 + len(board_ids) + sum(map(len, board_members)) + tasks + comments
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(user_ids)} users, {len(board_ids)} boards, "
+            f"{sum(map(len, board_members))} memberships, {tasks} tasks and {comments} comments "
+            f"in {seconds:.1f}s ({rows / seconds:.0f} rows/s)."
+        ))
+
+    def chunks(self, total):
+        """
+        Yield ``(start, stop)`` ranges of at most ``batch_size`` rows.
+        """
+        for start in range(0, total, self.batch_size):
+            yield start, min(start + self.batch_size, total)
+
+    def create_users(self, count, prefix, password):
+        """
+        Create users with profiles and return their ids.
+        """
+        password_hash = make_password(password)
+        user_ids = array("q")
+        for start, stop in self.chunks(count):
+            names = [
+                f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+                for _ in range(start, stop)
+            ]
+            with transaction.atomic():
+                users = User.objects.bulk_create([
+                    User(
+                        username=f"{prefix}-{index}",
+                        email=f"{prefix}-{index}@example.com",
+                        password=password_hash,
+                    )
+                    for index in range(start, stop)
+                ])
+                UserProfile.objects.bulk_create([
+                    UserProfile(user=user, fullname=name) for user, name in zip(users, names)
+                ])
+            user_ids.extend(user.pk for user in users)
+            self.progress("users", stop, count)
+        return user_ids
+
+    def create_boards(self, count, user_ids, members_per_board):
+        """
+        Create boards with their memberships.
+
+        Returns:
+            tuple: The board ids and, per board, the ids of its members
+            with the owner first.
+        """
+        board_members = []
+        for _ in range(count):
+            size = min(len(user_ids), max(1, round(self.rng.uniform(0.5, 1.5) * members_per_board)))
+            board_members.append(self.rng.sample(user_ids, size))
+
+        board_ids = array("q")
+        for start, stop in self.chunks(count):
+            with transaction.atomic():
+                boards = Board.objects.bulk_create([
+                    Board(
+                        title=f"{self.rng.choice(BOARD_TOPICS)} {index + 1}",
+                        owner_id=board_members[index][0],
+                    )
+                    for index in range(start, stop)
+                ])
+                board_ids.extend(board.pk for board in boards)
+                BoardMembership.objects.bulk_create(
+                    [
+                        BoardMembership(
+                            board_id=board.pk,
+                            user_id=user_id,
+                            role=BoardMembership.OWNER if position == 0 else BoardMembership.MEMBER,
+                        )
+                        for board, members in zip(boards, board_members[start:stop])
+                        for position, user_id in enumerate(members)
+                    ],
+                    batch_size=self.batch_size,
+                )
+            self.progress("boards", stop, count)
+        return board_ids, board_members
+
+    def create_tasks(self, count, comment_count, board_ids, board_members):
+        """
+        Create tasks and their comments.
+
+        Comments are spread over random tasks up front, so every task is
+        inserted with its final ``comments_count`` and its comments are
+        written in the same chunk.
+
+        Returns:
+            tuple: The number of created tasks and comments.
+        """
+        comments_per_task = array("I", bytes(4 * count))
+        for _ in range(comment_count):
+            comments_per_task[self.rng.randrange(count)] += 1
+
+        # Pareto weights: a few boards get most of the tasks.
+        board_weights = list(accumulate(self.rng.paretovariate(1.2) for _ in board_ids))
+        statuses, status_weights = list(STATUS_WEIGHTS), list(accumulate(STATUS_WEIGHTS.values()))
+        priorities, priority_weights = list(PRIORITY_WEIGHTS), list(accumulate(PRIORITY_WEIGHTS.values()))
+
+        comments = 0
+        for start, stop in self.chunks(count):
+            board_indexes = self.rng.choices(range(len(board_ids)), cum_weights=board_weights, k=stop - start)
+            tasks = []
+            for offset, board_index in enumerate(board_indexes):
+                members = board_members[board_index]
+                tasks.append(Task(
+                    board_id=board_ids[board_index],
+                    title=f"{self.rng.choice(TASK_VERBS)} {self.rng.choice(TASK_NOUNS)}",
+                    description="" if self.rng.random() < 0.4 else "Details are in the linked ticket.",
+                    status=self.rng.choices(statuses, cum_weights=status_weights)[0],
+                    priority=self.rng.choices(priorities, cum_weights=priority_weights)[0],
+                    assignee_id=None if self.rng.random() < 0.15 else self.rng.choice(members),
+                    reviewer_id=None if self.rng.random() < 0.4 else self.rng.choice(members),
+                    due_date=self.due_date(),
+                    created_by_id=members[0],
+                    comments_count=comments_per_task[start + offset],
+                ))
+
+            with transaction.atomic():
+                tasks = Task.objects.bulk_create(tasks)
+                chunk_comments = [
+                    TaskCommentModel(
+                        task_id=task.pk,
+                        author_id=self.rng.choice(board_members[board_index]),
+                        content=self.rng.choice(COMMENT_TEXTS),
+                    )
+                    for task, board_index in zip(tasks, board_indexes)
+                    for _ in range(task.comments_count)
+                ]
+                TaskCommentModel.objects.bulk_create(chunk_comments, batch_size=self.batch_size)
+            comments += len(chunk_comments)
+            self.progress("tasks", stop, count)
+        return count, comments
+
+    def due_date(self):
+        """
+        Return a due date between a month before and two months after
+        ``--today``, or None.
+        """
+        if self.rng.random() < 0.2:
+            return None
+        return self.today + datetime.timedelta(days=self.rng.randint(-30, 60))
+
+    def progress(self, name, done, total):
+        """
+        Report the progress of a long step.
+        """
+        if self.verbosity > 1 or done == total:
+            self.stdout.write(f"{name}: {done}/{total}")
@@ -0,0 +1,172 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from board_app.models import Board, BoardMembership
+
+
+MEMBERSHIP_CACHE_TIMEOUT = getattr(settings, "BOARD_MEMBERSHIP_CACHE_TIMEOUT", 300)
+
+
+def user_boards_cache_key(user_id):
+    """
+    Return the cache key holding the board ids visible to a user.
+    """
+    return f"board-membership:user:{user_id}"
+
+
+def board_owner_cache_key(board_id):
+    """
+    Return the cache key holding the owner id of a board.
+    """
+    return f"board-membership:owner:{board_id}"
+
+
+def get_user_board_ids(user_id):
+    """
+    Return the ids of all boards the user owns or is a member of.
+
+    Boards marked as deleted are left out.
+
+    The result is cached and invalidated by the signal handlers in
+    ``board_app.signals`` whenever the user's memberships change.
+
+    Args:
+        user_id (int): The id of the user.
+
+    Returns:
+        frozenset: The board ids visible to the user.
+    """
+    key = user_boards_cache_key(user_id)
+    board_ids = cache.get(key)
+    if board_ids is None:
+        board_ids = frozenset(
+            BoardMembership.objects.filter(
+                user_id=user_id,
+                board__deleted_at__isnull=True,
+            ).values_list("board_id", flat=True)
+        )
+        cache.set(key, board_ids, MEMBERSHIP_CACHE_TIMEOUT)
+    return board_ids
+
+
+def get_board_owner_id(board_id):
+    """
+    Return the owner id of a board, or None if the board does not exist.
+
+    Args:
+        board_id (int): The id of the board.
+
+    Returns:
+        int | None: The id of the board owner.
+    """
+    key = board_owner_cache_key(board_id)
+    owner_id = cache.get(key)
+    if owner_id is None:
+        owner_id = Board.objects.filter(pk=board_id).values_list("owner_id", flat=True).first()
+        if owner_id is not None:
+            cache.set(key, owner_id, MEMBERSHIP_CACHE_TIMEOUT)
+    return owner_id
+
+
+def is_board_member(user_id, board_id):
+    """
+    Check whether a user is the owner or a member of a board.
+
+    Args:
+        user_id (int): The id of the user.
+        board_id (int): The id of the board.
+
+    Returns:
+        bool: True if the user owns or belongs to the board.
+    """
+    return board_id in get_user_board_ids(user_id)
+
+
+async def aget_user_board_ids(user_id):
+    """
+    Async variant of ``get_user_board_ids`` for async views.
+
+    Args:
+        user_id (int): The id of the user.
+
+    Returns:
+        frozenset: The board ids visible to the user.
+    """
+    key = user_boards_cache_key(user_id)
+    board_ids = await cache.aget(key)
+    if board_ids is None:
+        memberships = BoardMembership.objects.filter(
+            user_id=user_id,
+            board__deleted_at__isnull=True,
+        ).values_list("board_id", flat=True)
+        board_ids = frozenset([board_id async for board_id in memberships])
+        await cache.aset(key, board_ids, MEMBERSHIP_CACHE_TIMEOUT)
+    return board_ids
+
+
+async def aget_board_owner_id(board_id):
+    """
+    Async variant of ``get_board_owner_id`` for async views.
+
+    Args:
+        board_id (int): The id of the board.
+
+    Returns:
+        int | None: The id of the board owner.
+    """
+    key = board_owner_cache_key(board_id)
+    owner_id = await cache.aget(key)
+    if owner_id is None:
+        owner_id = await Board.objects.filter(pk=board_id).values_list("owner_id", flat=True).afirst()
+        if owner_id is not None:
+            await cache.aset(key, owner_id, MEMBERSHIP_CACHE_TIMEOUT)
+    return owner_id
+
+
+async def ais_board_member(user_id, board_id):
+    """
+    Async variant of ``is_board_member`` for async views.
+
+    Args:
+        user_id (int): The id of the user.
+        board_id (int): The id of the board.
+
+    Returns:
+        bool: True if the user owns or belongs to the board.
+    """
+    return board_id in await aget_user_board_ids(user_id)
+
+
+def invalidate_users(user_ids):
+    """
+    Drop the cached board ids of the given users.
+
+    The keys are dropped immediately and again after the current
+    transaction commits, so a concurrent request cannot re-cache the
+    pre-commit state.
+
+    Args:
+        user_ids (Iterable[int]): The ids of the affected users.
+    """
+    keys = [user_boards_cache_key(user_id) for user_id in set(user_ids)]
+    if keys:
+        _delete_now_and_on_commit(keys)
+
+
+def invalidate_board(board_id):
+    """
+    Drop the cached owner id of a board.
+
+    Args:
+        board_id (int): The id of the board.
+    """
+    _delete_now_and_on_commit([board_owner_cache_key(board_id)])
+
+
+def _delete_now_and_on_commit(keys):
+    """
+    Delete cache keys now and once more when the transaction commits.
+    """
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
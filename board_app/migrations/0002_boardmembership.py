@@ -0,0 +1,95 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_owner_memberships(apps, schema_editor):
+    """
+    Give every board owner a membership with the ``owner`` role.
+
+    Owners who were already stored in ``members`` get their role upgraded,
+    owners that were missing from ``members`` get a new membership.
+    """
+    Board = apps.get_model("board_app", "Board")
+    BoardMembership = apps.get_model("board_app", "BoardMembership")
+    db_alias = schema_editor.connection.alias
+
+    owner_memberships = BoardMembership.objects.using(db_alias).filter(
+        user_id=models.F("board__owner_id"),
+    )
+    BoardMembership.objects.using(db_alias).filter(
+        pk__in=owner_memberships.values("pk"),
+    ).update(role="owner")
+
+    boards_with_owner = set(
+        BoardMembership.objects.using(db_alias).filter(
+            role="owner",
+        ).values_list("board_id", flat=True)
+    )
+    missing = []
+    boards = Board.objects.using(db_alias).values_list("id", "owner_id")
+    for board_id, owner_id in boards.iterator(chunk_size=2000):
+        if board_id not in boards_with_owner:
+            missing.append(BoardMembership(board_id=board_id, user_id=owner_id, role="owner"))
+        if len(missing) >= 2000:
+            BoardMembership.objects.using(db_alias).bulk_create(missing)
+            missing = []
+    BoardMembership.objects.using(db_alias).bulk_create(missing)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Adopt the auto-created members table as an explicit through model
+        # without touching the data.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='BoardMembership',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='board_app.board')),
+                        ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='board_memberships', to=settings.AUTH_USER_MODEL)),
+                    ],
+                    options={
+                        'db_table': 'board_app_board_members',
+                        'unique_together': {('board', 'user')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='board',
+                    name='members',
+                    field=models.ManyToManyField(related_name='boards', through='board_app.BoardMembership', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='boardmembership',
+            name='role',
+            field=models.CharField(choices=[('owner', 'Owner'), ('member', 'Member')], default='member', max_length=10),
+        ),
+        migrations.AlterModelTable(
+            name='boardmembership',
+            table=None,
+        ),
+        migrations.AlterUniqueTogether(
+            name='boardmembership',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='boardmembership',
+            constraint=models.UniqueConstraint(fields=('board', 'user'), name='unique_board_membership'),
+        ),
+        migrations.AddIndex(
+            model_name='boardmembership',
+            index=models.Index(fields=['user', 'board'], name='membership_user_board_idx'),
+        ),
+        migrations.RunPython(backfill_owner_memberships, migrations.RunPython.noop),
+    ]
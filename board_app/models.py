@@ -1,5 +1,80 @@
 from django.db import models
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+
+class BoardQuerySet(models.QuerySet):
+    """
+    QuerySet with the board lookups shared by the API views.
+    """
+
+    def visible_to(self, user):
+        """
+        Return boards the given user owns or is a member of.
+
+        Owners are stored as memberships with the ``owner`` role, so this
+        is a single indexed join that cannot produce duplicate rows.
+
+        Args:
+            user (User): The user whose boards should be returned.
+
+        Returns:
+            BoardQuerySet: The filtered queryset.
+        """
+        return self.filter(memberships__user_id=user.id)
+
+    def with_dashboard_counts(self):
+        """
+        Annotate the counters shown on the board dashboard.
+
+        All counters are computed in the same grouped query that loads
+        the boards, instead of one COUNT query per board and counter.
+
+        Returns:
+            BoardQuerySet: The annotated queryset.
+        """
+        member_counts = BoardMembership.objects.filter(
+            board_id=OuterRef("pk"),
+        ).order_by().values("board_id").annotate(
+            count=Count("pk"),
+        ).values("count")
+
+        return self.annotate(
+            member_count=Coalesce(
+                Subquery(member_counts),
+                0,
+            ),
+            ticket_count=Count("tasks"),
+            tasks_to_do_count=Count("tasks", filter=Q(tasks__status="to-do")),
+            tasks_high_prio_count=Count("tasks", filter=Q(tasks__priority="high")),
+        )
+
+    def bump_versions(self):
+        """
+        Increase the version and set ``updated_at`` of the boards.
+
+        Runs as a single UPDATE with ``F()``, so concurrent bumps are not
+        lost and no signals are sent.
+
+        Returns:
+            int: The number of updated boards.
+        """
+        return self.update(version=F("version") + 1, updated_at=timezone.now())
+
+
+class BoardManager(models.Manager.from_queryset(BoardQuerySet)):
+    """
+    Default board manager; hides boards that are marked as deleted.
+
+    Deleted boards stay in the database until ``manage.py
+    purge_deleted_boards`` removes them and their content in batches.
+    They can still be reached through ``Board.all_objects``.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 class Board(models.Model):
@@ -7,7 +82,8 @@ class Board(models.Model):
     Represents a project board that groups users and tasks.
 
     A board has exactly one owner and can have multiple members.
-    The owner is always implicitly considered a member of the board.
+    The owner is always a member of the board, stored as a membership
+    with the ``owner`` role.
     """
 
     title = models.CharField(
@@ -22,9 +98,54 @@ class Board(models.Model):
 
     members = models.ManyToManyField(
         User,
+        through="BoardMembership",
         related_name="boards",
     )
 
+    # Increased with every entry in the board's change log, i.e. whenever
+    # the board, its members, tasks or comments change. Cached dashboards
+    # and board snapshots are stored per version.
+    version = models.PositiveBigIntegerField(
+        default=0,
+    )
+
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+    )
+
+    # Set when the board is deleted through the API; the board is purged
+    # later by ``manage.py purge_deleted_boards``.
+    deleted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+    )
+
+    objects = BoardManager()
+    all_objects = BoardQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["deleted_at"],
+                name="board_deleted_idx",
+                condition=Q(deleted_at__isnull=False),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Save the board without writing back ``version`` and ``updated_at``.
+
+        Both are only changed by ``BoardQuerySet.bump_versions``; an
+        instance loaded before a concurrent bump must not reset them.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in ("version", "updated_at")
+            ]
+        super().save(*args, **kwargs)
+
     def __str__(self):
         """
         Return representation of the board.
@@ -33,3 +154,118 @@ class Board(models.Model):
             str: The board title.
         """
         return self.title
+
+
+class BoardMembership(models.Model):
+    """
+    Links a user to a board they can access.
+
+    Every board has exactly one membership with the ``owner`` role for
+    its owner; all other users are stored with the ``member`` role.
+    """
+
+    OWNER = "owner"
+    MEMBER = "member"
+
+    board = models.ForeignKey(
+        Board,
+        on_delete=models.CASCADE,
+        related_name="memberships",
+    )
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="board_memberships",
+    )
+
+    role = models.CharField(
+        max_length=10,
+        choices=[
+            (OWNER, "Owner"),
+            (MEMBER, "Member"),
+        ],
+        default=MEMBER,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["board", "user"], name="unique_board_membership"),
+        ]
+        indexes = [
+            # Serves "boards visible to user" lookups.
+            models.Index(fields=["user", "board"], name="membership_user_board_idx"),
+        ]
+
+    def __str__(self):
+        """
+        Return representation of the membership.
+
+        Returns:
+            str: User, board and role.
+        """
+        return f"{self.user} on {self.board} ({self.role})"
+
+
+class BoardChange(models.Model):
+    """
+    Entry of the per-board change log used for delta synchronization.
+
+    Each entry records that an object on the board was created/updated
+    (``upsert``) or deleted (``delete``). The auto-incrementing id serves
+    as the sync cursor; the current state of changed objects is read from
+    their own tables when the log is consumed.
+    """
+
+    TASK = "task"
+    COMMENT = "comment"
+    MEMBER = "member"
+    BOARD = "board"
+
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+    board = models.ForeignKey(
+        Board,
+        on_delete=models.CASCADE,
+        related_name="changes",
+    )
+
+    kind = models.CharField(
+        max_length=10,
+        choices=[
+            (TASK, "Task"),
+            (COMMENT, "Comment"),
+            (MEMBER, "Member"),
+            (BOARD, "Board"),
+        ],
+    )
+
+    action = models.CharField(
+        max_length=10,
+        choices=[
+            (UPSERT, "Created or updated"),
+            (DELETE, "Deleted"),
+        ],
+    )
+
+    object_id = models.PositiveBigIntegerField()
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    class Meta:
+        indexes = [
+            # Serves "changes on board X after cursor Y" lookups.
+            models.Index(fields=["board", "id"], name="boardchange_board_cursor_idx"),
+        ]
+
+    def __str__(self):
+        """
+        Return representation of the change.
+
+        Returns:
+            str: Kind, action and object of the change.
+        """
+        return f"{self.action} {self.kind} {self.object_id} on board {self.board_id}"
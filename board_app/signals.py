@@ -0,0 +1,116 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from board_app.changes import is_board_deletion, record_change, record_changes
+from board_app.membership import invalidate_board, invalidate_users
+from board_app.models import Board, BoardChange, BoardMembership
+
+
+@receiver(pre_save, sender=Board)
+def remember_previous_owner(sender, instance, update_fields=None, **kwargs):
+    """
+    Remember the stored owner of a board before it is saved.
+
+    Needed to move the ``owner`` membership role when the owner changes.
+    """
+    if instance.pk is None or (update_fields is not None and "owner" not in update_fields):
+        instance._previous_owner_id = None
+        return
+    instance._previous_owner_id = Board.objects.filter(
+        pk=instance.pk,
+    ).values_list("owner_id", flat=True).first()
+
+
+@receiver(post_save, sender=Board)
+def sync_owner_membership(sender, instance, created, **kwargs):
+    """
+    Keep the owner's membership in sync after a board is created or its owner changes.
+
+    The previous owner keeps access to the board as a regular member.
+    """
+    previous_owner_id = getattr(instance, "_previous_owner_id", None)
+    if not created:
+        record_change(instance.pk, BoardChange.BOARD, BoardChange.UPSERT, instance.pk)
+    if not created and previous_owner_id == instance.owner_id:
+        return
+
+    if previous_owner_id is not None:
+        BoardMembership.objects.filter(
+            board=instance,
+            user_id=previous_owner_id,
+        ).update(role=BoardMembership.MEMBER)
+
+    BoardMembership.objects.update_or_create(
+        board=instance,
+        user_id=instance.owner_id,
+        defaults={"role": BoardMembership.OWNER},
+    )
+
+    invalidate_board(instance.pk)
+    invalidate_users(
+        user_id for user_id in (previous_owner_id, instance.owner_id)
+        if user_id is not None
+    )
+
+
+@receiver(post_delete, sender=Board)
+def invalidate_deleted_board(sender, instance, **kwargs):
+    """
+    Invalidate the cached owner of a deleted board.
+
+    Members are invalidated by the cascade deleting their memberships.
+    """
+    invalidate_board(instance.pk)
+
+
+@receiver(post_save, sender=BoardMembership)
+def membership_saved(sender, instance, **kwargs):
+    """
+    Invalidate the user's cached boards and log the membership change.
+    """
+    invalidate_users([instance.user_id])
+    record_change(instance.board_id, BoardChange.MEMBER, BoardChange.UPSERT, instance.user_id)
+
+
+@receiver(post_delete, sender=BoardMembership)
+def membership_deleted(sender, instance, origin=None, **kwargs):
+    """
+    Invalidate the user's cached boards and log the removed membership.
+    """
+    invalidate_users([instance.user_id])
+    if not is_board_deletion(origin):
+        record_change(instance.board_id, BoardChange.MEMBER, BoardChange.DELETE, instance.user_id)
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Invalidate cached memberships when board members are added or removed.
+
+    ``members.add()`` inserts memberships with ``bulk_create``, which does
+    not send ``post_save``, so added members are also logged here; removed
+    memberships are logged by their ``post_delete`` handler. Handles both directions of the relation:
+    ``board.members`` (instance is a Board, pk_set holds user ids) and
+    ``user.boards`` (instance is a User, pk_set holds board ids).
+    """
+    if reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_users([instance.pk])
+        if action == "post_add":
+            record_changes(
+                (board_id, BoardChange.MEMBER, BoardChange.UPSERT, instance.pk)
+                for board_id in pk_set
+            )
+        return
+
+    if action == "pre_clear":
+        instance._cleared_member_ids = list(instance.members.values_list("id", flat=True))
+    elif action == "post_clear":
+        invalidate_users(getattr(instance, "_cleared_member_ids", []))
+    elif action in ("post_add", "post_remove"):
+        invalidate_users(pk_set or [])
+    if action == "post_add":
+        record_changes(
+            (instance.pk, BoardChange.MEMBER, BoardChange.UPSERT, user_id)
+            for user_id in pk_set
+        )
@@ -0,0 +1,187 @@
+import gzip
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from rest_framework.renderers import JSONRenderer
+
+from board_app.api.serializers import SingleBoardDetailSerializer
+from core.conditional import encoded_etag, make_etag, not_modified
+from task_app.models import Task
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+SNAPSHOT_CACHE_TIMEOUT = getattr(settings, "BOARD_SNAPSHOT_CACHE_TIMEOUT", 3600)
+
+# Bodies below this size are not worth compressing.
+SNAPSHOT_MIN_COMPRESS_SIZE = 512
+
+
+def board_detail_prefetches():
+    """
+    Return the prefetches needed by SingleBoardDetailSerializer.
+
+    Members and tasks are prefetched together with their user profiles,
+    so the whole detail payload is built by a fixed number of queries
+    regardless of board size.
+    """
+    return [
+        Prefetch(
+            "members",
+            queryset=User.objects.select_related("userprofile"),
+        ),
+        Prefetch(
+            "tasks",
+            queryset=Task.objects.select_related(
+                "assignee__userprofile",
+                "reviewer__userprofile",
+            ),
+        ),
+    ]
+
+
+def board_etag(board):
+    """
+    Return the ETag of the detail payload of a board version.
+    """
+    return make_etag("board", board.pk, board.version)
+
+
+def board_not_modified(request, board):
+    """
+    Return a 304 response if the client holds the board's current version.
+
+    Args:
+        request: The GET request; access must already be checked.
+        board (Board): The board, loaded with its ``version``.
+
+    Returns:
+        HttpResponseNotModified | None: See ``core.conditional.not_modified``.
+    """
+    response = not_modified(request, board_etag(board))
+    if response is not None:
+        patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
+def snapshot_cache_key(board_id):
+    """
+    Return the cache key of the snapshot of a board.
+    """
+    return f"board-snapshot:{board_id}"
+
+
+def build_snapshot(board):
+    """
+    Render the detail payload of a board and compress it.
+
+    Gzip output is made reproducible (no timestamp), so every worker
+    building the same version produces the same bytes.
+
+    Args:
+        board (Board): The board; its members and tasks are prefetched
+            here unless already loaded.
+
+    Returns:
+        dict: The JSON body under ``identity`` and its compressed copies
+        under ``gzip`` and ``br`` (None when not available).
+    """
+    prefetch_related_objects([board], *board_detail_prefetches())
+    body = JSONRenderer().render(SingleBoardDetailSerializer(board).data)
+
+    snapshot = {"identity": body, "gzip": None, "br": None}
+    if len(body) >= SNAPSHOT_MIN_COMPRESS_SIZE:
+        snapshot["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        if brotli is not None:
+            snapshot["br"] = brotli.compress(body, quality=11)
+    return snapshot
+
+
+def get_board_snapshot(board):
+    """
+    Return the snapshot of the current version of a board.
+
+    Each board has one cache entry, holding the snapshot of the version
+    it was built for. It is served while that version is current and
+    replaced on the first read after a change, as any entry in the
+    board's change log bumps the version; old versions therefore never
+    pile up in the cache. The snapshot is the same for every viewer;
+    access must be checked by the caller.
+
+    Args:
+        board (Board): The board, loaded with its ``version``.
+
+    Returns:
+        dict: See ``build_snapshot``.
+    """
+    key = snapshot_cache_key(board.pk)
+    cached = cache.get(key)
+    if cached is not None and cached["version"] == board.version:
+        return cached["snapshot"]
+
+    snapshot = build_snapshot(board)
+    cache.set(key, {"version": board.version, "snapshot": snapshot}, SNAPSHOT_CACHE_TIMEOUT)
+    return snapshot
+
+
+async def aget_board_snapshot(board):
+    """
+    Async variant of ``get_board_snapshot``.
+    """
+    key = snapshot_cache_key(board.pk)
+    cached = await cache.aget(key)
+    if cached is not None and cached["version"] == board.version:
+        return cached["snapshot"]
+
+    snapshot = await sync_to_async(build_snapshot)(board)
+    await cache.aset(key, {"version": board.version, "snapshot": snapshot}, SNAPSHOT_CACHE_TIMEOUT)
+    return snapshot
+
+
+def accepted_encodings(accept_encoding):
+    """
+    Return the content codings a client accepts, from its Accept-Encoding header.
+    """
+    encodings = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+def snapshot_response(request, snapshot, etag):
+    """
+    Return a response with the snapshot body in the best accepted encoding.
+
+    Brotli is preferred over gzip; the stored bytes are sent as they are.
+    Each encoding gets its own strong ETag, derived from ``etag``.
+    """
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    for coding in ("br", "gzip"):
+        if snapshot[coding] is not None and (coding in accepted or "*" in accepted):
+            response = HttpResponse(snapshot[coding], content_type="application/json")
+            response["Content-Encoding"] = coding
+            break
+    else:
+        coding = None
+        response = HttpResponse(snapshot["identity"], content_type="application/json")
+    response["ETag"] = encoded_etag(etag, coding)
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
@@ -1,3 +1,1259 @@
-from django.test import TestCase
+import asyncio
+import csv
+import datetime
+import gzip
+import json
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from auth_app.models import UserProfile
+from board_app import snapshots
+from board_app.api.streams import stream_board_events
+from board_app.deletion import mark_board_deleted
+from board_app.management.commands.bench_api import call_asgi
+from board_app.events import publish_changes
+from board_app.membership import get_board_owner_id, is_board_member
+from board_app.models import Board, BoardChange, BoardMembership
+from core.testing import QueryBudgetTestCase
+from task_app.models import Task, TaskCommentModel
+
+
+class BoardDashboardQueryTests(APITestCase):
+    """
+    Query-count regression tests for the board dashboard.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com", password="pw")
+        UserProfile.objects.create(user=self.user, fullname="Owner")
+        self.other = User.objects.create_user(username="other", email="other@example.com", password="pw")
+        UserProfile.objects.create(user=self.other, fullname="Other")
+        self.client.force_authenticate(self.user)
+
+    def create_boards(self, count):
+        """
+        Create boards owned by or shared with the user, each with tasks.
+        """
+        for index in range(count):
+            owner = self.user if index % 2 == 0 else self.other
+            board = Board.objects.create(title=f"Board {index}", owner=owner)
+            board.members.add(self.user, self.other)
+            Task.objects.create(board=board, title="todo", status="to-do", priority="high")
+            Task.objects.create(board=board, title="done", status="done", priority="low")
+
+    def count_dashboard_queries(self):
+        """
+        Request the dashboard and return the number of executed queries.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("boardDashboard"))
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.data
+
+    def test_query_count_is_independent_of_board_count(self):
+        self.create_boards(1)
+        queries_for_one, _ = self.count_dashboard_queries()
+
+        self.create_boards(20)
+        queries_for_many, data = self.count_dashboard_queries()
+
+        self.assertEqual(len(data), 21)
+        self.assertEqual(queries_for_one, queries_for_many)
+        # Membership lookup, version check and the dashboard query.
+        self.assertEqual(queries_for_many, 3)
+
+    def test_counters(self):
+        self.create_boards(1)
+        Board.objects.create(title="Hidden", owner=self.other)
+
+        _, data = self.count_dashboard_queries()
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["member_count"], 2)
+        self.assertEqual(data[0]["ticket_count"], 2)
+        self.assertEqual(data[0]["tasks_to_do_count"], 1)
+        self.assertEqual(data[0]["tasks_high_prio_count"], 1)
+        self.assertEqual(data[0]["owner_id"], self.user.id)
+
+    def test_owner_keeps_access_after_member_replacement(self):
+        board = Board.objects.create(title="Board", owner=self.user)
+
+        response = self.client.patch(
+            reverse("board-detail", kwargs={"pk": board.pk}),
+            {"members": [self.other.id]},
+            format="json",
+        )
+        _, data = self.count_dashboard_queries()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in data], [board.id])
+        self.assertEqual(data[0]["member_count"], 2)
+
+    def test_create_returns_counters(self):
+        response = self.client.post(
+            reverse("boardDashboard"),
+            {"title": "New", "members": [self.other.id]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["member_count"], 2)
+        self.assertEqual(response.data["ticket_count"], 0)
+
+
+class BoardDashboardCacheTests(APITestCase):
+    """
+    Tests for the per-user dashboard cache and the board versions.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        self.other = User.objects.create_user(username="other", email="other@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.other)
+        self.client.force_authenticate(self.user)
+
+    def dashboard(self):
+        """
+        Request the dashboard and return the payload.
+        """
+        response = self.client.get(reverse("boardDashboard"))
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_cache_hit_only_checks_versions(self):
+        self.dashboard()
+
+        with self.assertNumQueries(1):
+            data = self.dashboard()
+
+        self.assertEqual(data[0]["title"], "Board")
+
+    def test_task_changes_invalidate(self):
+        self.dashboard()
+
+        task = Task.objects.create(board=self.board, title="Task", status="to-do", priority="high")
+        self.assertEqual(self.dashboard()[0]["tasks_high_prio_count"], 1)
+
+        task.priority = "low"
+        task.save()
+        self.assertEqual(self.dashboard()[0]["tasks_high_prio_count"], 0)
+
+        task.delete()
+        self.assertEqual(self.dashboard()[0]["ticket_count"], 0)
+
+    def test_title_and_member_changes_invalidate(self):
+        self.client.force_authenticate(self.other)
+        self.dashboard()
+
+        self.client.force_authenticate(self.user)
+        response = self.client.patch(
+            reverse("board-detail", kwargs={"pk": self.board.pk}),
+            {"title": "Renamed", "remove_members": [self.other.id]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.dashboard()[0]["title"], "Renamed")
+        self.assertEqual(self.dashboard()[0]["member_count"], 1)
+
+        self.client.force_authenticate(self.other)
+        self.assertEqual(self.dashboard(), [])
+
+    def test_async_variant_shares_the_cache(self):
+        token = Token.objects.create(user=self.user)
+        self.client.force_authenticate(None)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.dashboard()
+
+        # Token lookup and version check.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("boardDashboard-async"))
+
+        self.assertEqual(response.json()[0]["title"], "Board")
+
+    def test_stale_instance_does_not_reset_version(self):
+        stale = Board.objects.get(pk=self.board.pk)
+        Task.objects.create(board=self.board, title="Task")
+        version = Board.objects.get(pk=self.board.pk).version
+
+        stale.title = "Renamed"
+        stale.save()
+
+        self.assertGreater(Board.objects.get(pk=self.board.pk).version, version)
+
+
+class BoardDetailQueryTests(APITestCase):
+    """
+    Query-count regression tests for the board detail endpoint.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com", password="pw")
+        UserProfile.objects.create(user=self.user, fullname="Owner")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.user)
+        self.client.force_authenticate(self.user)
+
+    def add_members_and_tasks(self, count):
+        """
+        Add members with profiles and tasks assigned to them.
+        """
+        offset = self.board.members.count()
+        for index in range(offset, offset + count):
+            member = User.objects.create_user(username=f"member{index}", email=f"member{index}@example.com")
+            UserProfile.objects.create(user=member, fullname=f"Member {index}")
+            self.board.members.add(member)
+            task = Task.objects.create(board=self.board, title=f"Task {index}", status="to-do", assignee=member, reviewer=self.user)
+            task.comments.create(author=member, content="comment")
+
+    def count_detail_queries(self):
+        """
+        Request the board detail and return query count and payload.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("board-detail", kwargs={"pk": self.board.pk}))
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.json()
+
+    def test_query_count_is_independent_of_board_size(self):
+        self.add_members_and_tasks(1)
+        self.count_detail_queries()
+        # Drop the snapshot built above so the payload is rendered again.
+        Board.objects.filter(pk=self.board.pk).bump_versions()
+        queries_for_one, _ = self.count_detail_queries()
+
+        self.add_members_and_tasks(20)
+        queries_for_many, data = self.count_detail_queries()
+
+        self.assertEqual(len(data["tasks"]), 21)
+        self.assertEqual(len(data["members"]), 22)
+        self.assertEqual(queries_for_one, queries_for_many)
+        self.assertLessEqual(queries_for_many, 3)
+
+    def test_payload(self):
+        self.add_members_and_tasks(1)
+
+        _, data = self.count_detail_queries()
+
+        task = data["tasks"][0]
+        self.assertEqual(data["owner_id"], self.user.id)
+        self.assertEqual(task["comments_count"], 1)
+        self.assertEqual(task["reviewer"]["fullname"], "Owner")
+
+    def test_non_member_is_forbidden(self):
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.client.force_authenticate(stranger)
+
+        response = self.client.get(reverse("board-detail", kwargs={"pk": self.board.pk}))
+
+        self.assertEqual(response.status_code, 403)
+
+
+class BoardSnapshotTests(APITestCase):
+    """
+    Tests for the board detail snapshots and their compressed copies.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        UserProfile.objects.create(user=self.user, fullname="Owner")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        for index in range(10):
+            Task.objects.create(board=self.board, title=f"Task {index}", status="to-do", assignee=self.user)
+        self.client.force_authenticate(self.user)
+        self.url = reverse("board-detail", kwargs={"pk": self.board.pk})
+
+    def test_serves_gzip_bytes_when_accepted(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(json.loads(gzip.decompress(response.content)), self.client.get(self.url).json())
+
+    def test_serves_identity_when_gzip_is_refused(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip;q=0, identity")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(len(response.json()["tasks"]), 10)
+
+    def test_brotli_is_preferred_when_available(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, br")
+
+        expected = "br" if snapshots.brotli is not None else "gzip"
+        self.assertEqual(response["Content-Encoding"], expected)
+
+    def test_snapshot_hit_loads_only_the_board(self):
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_snapshot_is_rebuilt_after_a_change(self):
+        self.client.get(self.url)
+
+        Task.objects.create(board=self.board, title="New", status="done", assignee=self.user)
+
+        self.assertEqual(len(self.client.get(self.url).json()["tasks"]), 11)
+        # The new version replaces the old one in the board's single entry.
+        cached = cache.get(snapshots.snapshot_cache_key(self.board.pk))
+        self.assertEqual(cached["version"], Board.objects.get(pk=self.board.pk).version)
+
+    def test_snapshot_is_not_served_to_non_members(self):
+        self.client.get(self.url)
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.client.force_authenticate(stranger)
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_unchanged_board_is_not_modified(self):
+        etag = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_encodings_have_distinct_etags(self):
+        identity = self.client.get(self.url)["ETag"]
+        gzipped = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+
+        self.assertNotEqual(identity, gzipped)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=gzipped).status_code, 304)
+
+    def test_change_invalidates_the_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        Task.objects.create(board=self.board, title="New", status="done")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class BoardMemberUpdateTests(APITestCase):
+    """
+    Tests for replacing and incrementally changing board members.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        UserProfile.objects.create(user=self.user, fullname="Owner")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.client.force_authenticate(self.user)
+
+    def create_users(self, count):
+        """
+        Create users with profiles and return them.
+        """
+        offset = User.objects.count()
+        users = []
+        for index in range(offset, offset + count):
+            user = User.objects.create_user(username=f"user{index}", email=f"user{index}@example.com")
+            UserProfile.objects.create(user=user, fullname=f"User {index}")
+            users.append(user)
+        return users
+
+    def patch(self, data, query=""):
+        """
+        Patch the board and return the response.
+        """
+        url = reverse("board-detail", kwargs={"pk": self.board.pk}) + query
+        return self.client.patch(url, data, format="json")
+
+    def count_add_queries(self):
+        """
+        Add one new member and return the number of queries.
+        """
+        new_member, = self.create_users(1)
+        with CaptureQueriesContext(connection) as context:
+            response = self.patch({"add_members": [new_member.id]}, "?members=false")
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_add_cost_is_independent_of_member_count(self):
+        self.board.members.add(*self.create_users(2))
+        self.count_add_queries()
+        queries_for_few = self.count_add_queries()
+
+        self.board.members.add(*self.create_users(30))
+        queries_for_many = self.count_add_queries()
+
+        self.assertEqual(queries_for_few, queries_for_many)
+        self.assertEqual(self.board.members.count(), 36)
+
+    def test_add_and_remove(self):
+        first, second = self.create_users(2)
+        self.board.members.add(first)
+
+        response = self.patch({"add_members": [second.id], "remove_members": [first.id]}, "?members=false")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("members_data", response.data)
+        self.assertEqual(set(self.board.members.values_list("id", flat=True)), {self.user.id, second.id})
+
+    def test_replace_members(self):
+        first, second = self.create_users(2)
+        self.board.members.add(first)
+
+        response = self.patch({"members": [second.id]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {member["id"] for member in response.data["members_data"]},
+            {self.user.id, second.id},
+        )
+
+    def test_owner_cannot_be_removed(self):
+        response = self.patch({"remove_members": [self.user.id]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(self.board.members.filter(id=self.user.id).exists())
+
+    def test_unknown_user_is_rejected(self):
+        response = self.patch({"add_members": [self.user.id + 100]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("add_members", response.data)
+
+    def test_replace_and_delta_are_exclusive(self):
+        response = self.patch({"members": [], "add_members": [self.user.id]})
+
+        self.assertEqual(response.status_code, 400)
+
+
+class BoardDeletionTests(APITestCase):
+    """
+    Tests for marking boards as deleted and purging them in batches.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        self.member = User.objects.create_user(username="member", email="member@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.member)
+        self.kept_board = Board.objects.create(title="Kept", owner=self.user)
+        for index in range(5):
+            task = Task.objects.create(board=self.board, title=f"Task {index}", status="to-do")
+            task.comments.create(author=self.member, content="first")
+            task.comments.create(author=self.member, content="second")
+        self.kept_task = Task.objects.create(board=self.kept_board, title="Kept", status="to-do")
+        self.client.force_authenticate(self.user)
+        self.assertTrue(is_board_member(self.member.id, self.board.id))
+
+    def delete_board(self):
+        """
+        Delete the board through the API.
+        """
+        response = self.client.delete(reverse("board-detail", kwargs={"pk": self.board.pk}))
+        self.assertEqual(response.status_code, 204)
+
+    def test_delete_hides_board_without_deleting_content(self):
+        task = Task.objects.filter(board=self.board).first()
+
+        self.delete_board()
+
+        self.assertFalse(Board.objects.filter(pk=self.board.pk).exists())
+        self.assertTrue(Board.all_objects.filter(pk=self.board.pk).exists())
+        self.assertEqual(Task.objects.filter(board_id=self.board.pk).count(), 5)
+        self.assertFalse(is_board_member(self.member.id, self.board.id))
+        self.assertIsNone(get_board_owner_id(self.board.id))
+
+        dashboard = self.client.get(reverse("boardDashboard"))
+        self.assertEqual([board["id"] for board in dashboard.data], [self.kept_board.id])
+        detail = self.client.get(reverse("board-detail", kwargs={"pk": self.board.pk}))
+        self.assertEqual(detail.status_code, 404)
+        task_detail = self.client.get(reverse("task", kwargs={"pk": task.pk}))
+        self.assertEqual(task_detail.status_code, 404)
+
+    def test_comments_of_deleted_board_are_hidden(self):
+        comment = TaskCommentModel.objects.filter(task__board=self.board).first()
+        url = reverse("comment", kwargs={"task_id": comment.task_id, "pk": comment.pk})
+        self.delete_board()
+        changes_before = BoardChange.objects.filter(board_id=self.board.pk).count()
+        self.client.force_authenticate(self.member)
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.patch(url, {"content": "edited"}, format="json").status_code, 404)
+        self.assertEqual(self.client.delete(url).status_code, 404)
+        comment.refresh_from_db()
+        self.assertEqual(comment.content, "first")
+        self.assertEqual(BoardChange.objects.filter(board_id=self.board.pk).count(), changes_before)
+
+    def test_purge_deletes_content_in_batches(self):
+        self.delete_board()
+        output = StringIO()
+
+        call_command("purge_deleted_boards", "--batch-size", "3", stdout=output)
+
+        self.assertFalse(Board.all_objects.filter(pk=self.board.pk).exists())
+        self.assertFalse(Task.objects.filter(board_id=self.board.pk).exists())
+        self.assertFalse(TaskCommentModel.objects.exists())
+        self.assertFalse(BoardChange.objects.filter(board_id=self.board.pk).exists())
+        self.assertFalse(BoardMembership.objects.filter(board_id=self.board.pk).exists())
+        self.assertTrue(Task.objects.filter(pk=self.kept_task.pk).exists())
+        self.assertIn("10 comments, 5 tasks", output.getvalue())
+        self.assertIn("Purged 1 deleted boards.", output.getvalue())
+
+    def test_purge_does_not_log_changes_for_other_boards(self):
+        self.delete_board()
+        changes_before = BoardChange.objects.filter(board=self.kept_board).count()
+
+        call_command("purge_deleted_boards", stdout=StringIO())
+
+        self.assertEqual(BoardChange.objects.filter(board=self.kept_board).count(), changes_before)
+        self.assertFalse(BoardChange.objects.filter(board_id=self.board.pk).exists())
+
+
+class BoardExportTests(APITestCase):
+    """
+    Tests for the streaming board export.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        UserProfile.objects.create(user=self.user, fullname="Owner")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        for index in range(3):
+            task = Task.objects.create(board=self.board, title=f"Task {index}", status="to-do", assignee=self.user)
+            task.comments.create(author=self.user, content=f"Comment {index}")
+        self.client.force_authenticate(self.user)
+
+    def export(self, export_format):
+        """
+        Request the export and return the response with its joined content.
+        """
+        response = self.client.get(
+            reverse("board-export", kwargs={"pk": self.board.pk}), {"format": export_format}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_json(self):
+        response, content = self.export("json")
+
+        data = json.loads(content)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(data["board"]["owner_email"], "owner@example.com")
+        self.assertEqual(data["members"], [{"role": "owner", "email": "owner@example.com", "fullname": "Owner"}])
+        self.assertEqual([task["title"] for task in data["tasks"]], ["Task 0", "Task 1", "Task 2"])
+        self.assertEqual(data["tasks"][0]["assignee_email"], "owner@example.com")
+        self.assertEqual(len(data["comments"]), 3)
+        self.assertEqual(data["comments"][0]["task_id"], data["tasks"][0]["id"])
+
+    def test_ndjson(self):
+        _, content = self.export("ndjson")
+
+        types = [json.loads(line)["type"] for line in content.splitlines()]
+        self.assertEqual(types, ["board", "member"] + ["task"] * 3 + ["comment"] * 3)
+
+    def test_csv(self):
+        response, content = self.export("csv")
+
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(rows[0]["type"], "board")
+        self.assertEqual(rows[-1]["content"], "Comment 2")
+        self.assertEqual(len(rows), 8)
+
+    def test_empty_board_is_valid_json(self):
+        Task.objects.all().delete()
+
+        _, content = self.export("json")
+
+        self.assertEqual(json.loads(content)["tasks"], [])
+
+    async def test_async_export_is_streamed_asynchronously(self):
+        token = await Token.objects.acreate(user=self.user)
+
+        response = await self.async_client.get(
+            reverse("board-export", kwargs={"pk": self.board.pk}),
+            {"format": "ndjson"},
+            headers={"Authorization": f"Token {token.key}"},
+        )
+        content = b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        self.assertEqual(len(content.splitlines()), 1 + 1 + 3 + 3)
+
+    def test_unknown_format(self):
+        response = self.client.get(reverse("board-export", kwargs={"pk": self.board.pk}), {"format": "xml"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_non_member_is_forbidden(self):
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.client.force_authenticate(stranger)
+
+        response = self.client.get(reverse("board-export", kwargs={"pk": self.board.pk}))
+
+        self.assertEqual(response.status_code, 403)
+
+
+class BoardImportTests(APITestCase):
+    """
+    Tests for importing boards from export archives.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        self.member = User.objects.create_user(username="member", email="member@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.member)
+        for index in range(5):
+            task = Task.objects.create(
+                board=self.board, title=f"Task {index}", status="review", priority="high",
+                assignee=self.member, due_date="2026-01-0%d" % (index + 1),
+            )
+            task.comments.create(author=self.member, content=f"Comment {index}")
+            task.comments.create(author=self.user, content="Reply")
+        self.client.force_authenticate(self.user)
+
+    def export(self, export_format):
+        """
+        Return the export of the board as text.
+        """
+        response = self.client.get(
+            reverse("board-export", kwargs={"pk": self.board.pk}), {"format": export_format}
+        )
+        return b"".join(response.streaming_content).decode()
+
+    def assert_imported_copy(self, board_id):
+        """
+        Check that the imported board matches the exported one.
+        """
+        board = Board.objects.get(pk=board_id)
+        self.assertEqual(board.title, "Board")
+        self.assertEqual(board.owner, self.user)
+        self.assertEqual(set(board.members.values_list("id", flat=True)), {self.user.id, self.member.id})
+        tasks = list(board.tasks.order_by("id"))
+        self.assertEqual([task.title for task in tasks], [f"Task {index}" for index in range(5)])
+        self.assertEqual(tasks[0].assignee, self.member)
+        self.assertEqual(str(tasks[0].due_date), "2026-01-01")
+        self.assertEqual([task.comments_count for task in tasks], [2] * 5)
+        self.assertEqual(TaskCommentModel.objects.filter(task__board=board).count(), 10)
+        self.assertTrue(is_board_member(self.member.id, board.id))
+
+    def test_import_endpoint(self):
+        archive = json.loads(self.export("json"))
+
+        response = self.client.post(reverse("board-import"), archive, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["tasks"], 5)
+        self.assertEqual(response.data["comments"], 10)
+        self.assertIn("rows_per_second", response.data)
+        self.assert_imported_copy(response.data["id"])
+
+    def test_import_command_with_ndjson(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as archive:
+            archive.write(self.export("ndjson"))
+            archive.flush()
+            output = StringIO()
+
+            call_command("import_board", archive.name, "--owner", "owner@example.com", "--batch-size", "3", stdout=output)
+
+        stats = json.loads(output.getvalue())
+        self.assertEqual(stats["members"], 1)
+        self.assert_imported_copy(stats["id"])
+
+    def test_failed_import_command_removes_the_board(self):
+        lines = [
+            {"type": "board", "title": "Imported"},
+            *({"type": "task", "id": index, "title": f"Task {index}"} for index in range(5)),
+            {"type": "task", "id": 5, "title": "Task", "status": "unknown"},
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson") as archive:
+            archive.write("".join(f"{json.dumps(line)}\n" for line in lines))
+            archive.flush()
+
+            with self.assertRaisesMessage(CommandError, "Invalid archive: Task 5 has an invalid"):
+                call_command("import_board", archive.name, "--owner", "owner@example.com", "--batch-size", "2")
+
+        self.assertFalse(Board.all_objects.filter(title="Imported").exists())
+        self.assertFalse(Task.objects.filter(title__startswith="Task ").exclude(board=self.board).exists())
+
+    def test_unknown_users_are_reported(self):
+        archive = {
+            "board": {"title": "Imported"},
+            "members": [{"email": "nobody@example.com"}],
+            "tasks": [{"id": 1, "title": "Task", "status": "to-do", "assignee_email": "nobody@example.com"}],
+            "comments": [{"task_id": 1, "author_email": "nobody@example.com", "content": "Hi"}],
+        }
+
+        response = self.client.post(reverse("board-import"), archive, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["unresolved_emails"], 3)
+        self.assertEqual(response.data["skipped_comments"], 1)
+        self.assertIsNone(Task.objects.get(board_id=response.data["id"]).assignee_id)
+
+    def test_invalid_archive_is_rolled_back(self):
+        archive = {
+            "board": {"title": "Imported"},
+            "tasks": [{"id": 1, "title": "Task", "status": "unknown"}],
+        }
+
+        response = self.client.post(reverse("board-import"), archive, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Board.objects.filter(title="Imported").exists())
+
+    def test_malformed_archives_are_rejected(self):
+        archives = [
+            {"board": {"title": "Imported"}, "tasks": [1]},
+            {"board": {"title": "Imported"}, "tasks": {"id": 1}},
+            {"board": ["Imported"]},
+            {"board": {"title": "Imported"}, "members": [{"email": 5}]},
+            {"board": {"title": "Imported"}, "tasks": [{"id": [1], "title": "Task"}]},
+        ]
+        for archive in archives:
+            with self.subTest(archive=archive):
+                response = self.client.post(reverse("board-import"), archive, format="json")
+
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(Board.objects.filter(title="Imported").exists())
+
+    def test_emails_are_matched_case_insensitively(self):
+        User.objects.create_user(username="mixed", email="Mixed.Case@Example.com")
+        archive = {
+            "board": {"title": "Imported"},
+            "members": [{"email": "mixed.case@example.com"}],
+            "tasks": [{"id": 1, "title": "Task", "status": "to-do", "assignee_email": "MIXED.case@example.com"}],
+        }
+
+        response = self.client.post(reverse("board-import"), archive, format="json")
+
+        self.assertEqual(response.data["members"], 1)
+        self.assertEqual(response.data["unresolved_emails"], 0)
+        self.assertEqual(Task.objects.get(board_id=response.data["id"]).assignee.username, "mixed")
+
+
+class BoardMembershipCacheTests(APITestCase):
+    """
+    Tests for the cached membership index and its signal-driven invalidation.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", email="owner@example.com")
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.owner)
+
+    def test_owner_is_member(self):
+        self.assertTrue(is_board_member(self.owner.id, self.board.id))
+        self.assertFalse(is_board_member(self.user.id, self.board.id))
+
+    def test_lookup_is_cached(self):
+        is_board_member(self.user.id, self.board.id)
+        get_board_owner_id(self.board.id)
+
+        with self.assertNumQueries(0):
+            is_board_member(self.user.id, self.board.id)
+            get_board_owner_id(self.board.id)
+
+    def test_member_changes_invalidate(self):
+        self.assertFalse(is_board_member(self.user.id, self.board.id))
+
+        self.board.members.add(self.user)
+        self.assertTrue(is_board_member(self.user.id, self.board.id))
+
+        self.board.members.remove(self.user)
+        self.assertFalse(is_board_member(self.user.id, self.board.id))
+
+        self.user.boards.add(self.board)
+        self.assertTrue(is_board_member(self.user.id, self.board.id))
+
+        self.board.members.clear()
+        self.assertFalse(is_board_member(self.user.id, self.board.id))
+
+    def test_owner_change_and_delete_invalidate(self):
+        self.assertEqual(get_board_owner_id(self.board.id), self.owner.id)
+        self.assertTrue(is_board_member(self.owner.id, self.board.id))
+
+        self.board.owner = self.user
+        self.board.save()
+        self.assertEqual(get_board_owner_id(self.board.id), self.user.id)
+        self.assertTrue(is_board_member(self.owner.id, self.board.id))
+        self.assertTrue(is_board_member(self.user.id, self.board.id))
+        self.assertEqual(
+            dict(self.board.memberships.values_list("user_id", "role")),
+            {self.owner.id: BoardMembership.MEMBER, self.user.id: BoardMembership.OWNER},
+        )
+
+        board_id = self.board.id
+        self.board.delete()
+        self.assertIsNone(get_board_owner_id(board_id))
+        self.assertFalse(is_board_member(self.user.id, board_id))
+
+
+class BoardChangesTests(APITestCase):
+    """
+    Tests for the board change feed.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        UserProfile.objects.create(user=self.user, fullname="Owner")
+        self.member = User.objects.create_user(username="member", email="member@example.com")
+        UserProfile.objects.create(user=self.member, fullname="Member")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.client.force_authenticate(self.user)
+        self.url = reverse("board-changes", kwargs={"pk": self.board.pk})
+
+    def get_changes(self, since=None):
+        """
+        Request the change feed and return the payload.
+        """
+        url = self.url if since is None else f"{self.url}?since={since}"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_changes_since_cursor(self):
+        cursor = self.get_changes()["cursor"]
+        kept = Task.objects.create(board=self.board, title="Kept", status="to-do")
+        removed = Task.objects.create(board=self.board, title="Removed", status="to-do")
+        removed_id = removed.id
+        comment = kept.comments.create(author=self.user, content="hello")
+        self.board.members.add(self.member)
+        removed.delete()
+
+        data = self.get_changes(cursor)
+
+        self.assertEqual([task["id"] for task in data["tasks"]], [kept.id])
+        self.assertEqual(data["deleted_tasks"], [removed_id])
+        self.assertEqual([item["id"] for item in data["comments"]], [comment.id])
+        self.assertEqual(data["comments"][0]["task_id"], kept.id)
+        self.assertEqual([item["id"] for item in data["members"]], [self.member.id])
+        self.assertIsNone(data["board"])
+
+        data = self.get_changes(data["cursor"])
+        self.assertEqual(data["tasks"], [])
+        self.assertEqual(data["deleted_tasks"], [])
+
+    def test_tombstones(self):
+        task = Task.objects.create(board=self.board, title="Task", status="to-do")
+        comment = task.comments.create(author=self.user, content="hello")
+        self.board.members.add(self.member)
+        cursor = self.get_changes()["cursor"]
+
+        comment_id = comment.id
+        comment.delete()
+        self.board.members.remove(self.member)
+        self.board.title = "Renamed"
+        self.board.save()
+
+        data = self.get_changes(cursor)
+
+        self.assertEqual(data["deleted_comments"], [comment_id])
+        self.assertEqual(data["removed_members"], [self.member.id])
+        self.assertEqual(data["board"]["title"], "Renamed")
+
+    def test_non_member_is_forbidden(self):
+        self.client.force_authenticate(self.member)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_board_deletion_is_not_logged(self):
+        Task.objects.create(board=self.board, title="Task", status="to-do").comments.create(author=self.user)
+
+        self.board.delete()
+
+        self.assertFalse(BoardChange.objects.exists())
+
+
+class BoardEventStreamTests(APITestCase):
+    """
+    Tests for the Server-Sent Events stream of board changes.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        self.token = Token.objects.create(user=self.user)
+        self.board = Board.objects.create(title="Board", owner=self.user)
+
+    def test_requires_token_and_membership(self):
+        url = reverse("board-events", kwargs={"pk": self.board.pk})
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        stranger_token = Token.objects.create(user=stranger)
+
+        self.assertEqual(self.client.get(url).status_code, 401)
+        self.assertEqual(self.client.get(f"{url}?token={stranger_token.key}").status_code, 403)
+        missing_url = reverse("board-events", kwargs={"pk": self.board.pk + 1})
+        self.assertEqual(self.client.get(f"{missing_url}?token={self.token.key}").status_code, 404)
+
+    def test_streams_published_and_replayed_events(self):
+        change = BoardChange.objects.create(
+            board=self.board,
+            kind=BoardChange.TASK,
+            action=BoardChange.UPSERT,
+            object_id=1,
+        )
+
+        async def read_frames():
+            stream = stream_board_events(self.board.pk, self.user.pk, change.pk - 1)
+            frames = [await anext(stream), await anext(stream)]
+            pending = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0)
+            publish_changes([BoardChange(
+                id=change.pk + 1,
+                board=self.board,
+                kind=BoardChange.COMMENT,
+                action=BoardChange.DELETE,
+                object_id=2,
+            )])
+            frames.append(await asyncio.wait_for(pending, 1))
+            await stream.aclose()
+            return frames
+
+        frames = async_to_sync(read_frames)()
+
+        self.assertTrue(frames[0].startswith("retry:"))
+        self.assertIn(f"id: {change.pk}\nevent: task\n", frames[1])
+        self.assertIn(f"id: {change.pk + 1}\nevent: comment\n", frames[2])
+        self.assertIn('"action": "delete"', frames[2])
+
+    def test_replay_pages_through_the_change_log(self):
+        changes = BoardChange.objects.bulk_create([
+            BoardChange(board=self.board, kind=BoardChange.TASK, action=BoardChange.UPSERT, object_id=number)
+            for number in range(5)
+        ])
+        first_id = BoardChange.objects.filter(board=self.board).order_by("id").first().pk
+
+        async def read_frames():
+            stream = stream_board_events(self.board.pk, self.user.pk, first_id - 1)
+            frames = [await anext(stream) for _ in range(len(changes) + 1)]
+            await stream.aclose()
+            return frames
+
+        with mock.patch("board_app.api.streams.REPLAY_LIMIT", 2):
+            frames = async_to_sync(read_frames)()
+
+        self.assertEqual(
+            [frame.split("\n")[0] for frame in frames[1:]],
+            [f"id: {first_id + offset}" for offset in range(5)],
+        )
+
+    def read_until_closed(self, stream, publish=None):
+        """
+        Read the frames of a stream after the retry frame until it ends,
+        at most ten.
+        """
+        async def read():
+            frames = []
+            await anext(stream)
+            pending = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0)
+            if publish:
+                publish()
+            try:
+                while len(frames) < 10:
+                    frames.append(await asyncio.wait_for(pending, 1))
+                    pending = asyncio.ensure_future(anext(stream))
+            except StopAsyncIteration:
+                return frames
+            pending.cancel()
+            await stream.aclose()
+            return frames
+
+        return async_to_sync(read)()
+
+    def test_stream_ends_when_the_user_is_removed(self):
+        member = User.objects.create_user(username="member", email="member@example.com")
+        self.board.members.add(member)
+        stream = stream_board_events(self.board.pk, member.pk, None)
+        self.board.members.remove(member)
+
+        frames = self.read_until_closed(stream, lambda: publish_changes([BoardChange(
+            id=1,
+            board=self.board,
+            kind=BoardChange.MEMBER,
+            action=BoardChange.DELETE,
+            object_id=member.pk,
+        )]))
+
+        self.assertEqual(frames, [])
+
+    def test_stream_ends_when_the_board_is_deleted(self):
+        stream = stream_board_events(self.board.pk, self.user.pk, None)
+        mark_board_deleted(self.board)
+
+        with mock.patch("board_app.api.streams.HEARTBEAT_SECONDS", 0.01):
+            frames = self.read_until_closed(stream)
+
+        self.assertEqual(frames, [])
+
+
+class AsyncBoardEndpointTests(APITestCase):
+    """
+    Tests that the async read endpoints return the same payloads as the sync ones.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="owner", email="owner@example.com")
+        UserProfile.objects.create(user=self.user, fullname="Owner")
+        self.token = Token.objects.create(user=self.user)
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        Task.objects.create(board=self.board, title="Task", status="to-do", priority="high", assignee=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def assert_same_payload(self, sync_name, async_name, **kwargs):
+        """
+        Request both variants of an endpoint and compare the payloads.
+        """
+        sync_response = self.client.get(reverse(sync_name, kwargs=kwargs))
+        async_response = self.client.get(reverse(async_name, kwargs=kwargs))
+
+        self.assertEqual(async_response.status_code, 200)
+        self.assertEqual(async_response.json(), sync_response.json())
+
+    def test_dashboard(self):
+        self.assert_same_payload("boardDashboard", "boardDashboard-async")
+
+    def test_board_detail(self):
+        self.assert_same_payload("board-detail", "board-detail-async", pk=self.board.pk)
+
+    def test_board_detail_requires_membership(self):
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        token = Token.objects.create(user=stranger)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        response = self.client.get(reverse("board-detail-async", kwargs={"pk": self.board.pk}))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_requires_token(self):
+        self.client.credentials()
+
+        response = self.client.get(reverse("boardDashboard-async"))
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_query_token_is_rejected(self):
+        self.client.credentials()
+
+        response = self.client.get(reverse("board-detail-async", kwargs={"pk": self.board.pk}) + f"?token={self.token.key}")
+
+        self.assertEqual(response.status_code, 401)
+
+
+class BoardQueryBudgetTests(QueryBudgetTestCase):
+    """
+    Query budgets of the board endpoints for boards with 1 to 1000 members,
+    tasks and comments.
+
+    Bulk inserts of 1000 rows are split into several statements by the
+    SQLite backend, which is why the write budgets leave room above the
+    counts of small boards. The event stream never ends; its queries are
+    covered by ``BoardEventStreamTests``.
+    """
+
+    def test_dashboard(self):
+        self.check_budget(4, lambda seeded: self.client.get(reverse("boardDashboard")))
+
+    def test_dashboard_async(self):
+        self.check_budget(4, lambda seeded: self.client.get(reverse("boardDashboard-async")))
+
+    def test_create(self):
+        self.check_budget(23, lambda seeded: self.client.post(
+            reverse("boardDashboard"),
+            {"title": "New board", "members": [user.id for user in seeded.members]},
+            format="json",
+        ))
+
+    def test_detail(self):
+        self.check_budget(5, lambda seeded: self.client.get(
+            reverse("board-detail", kwargs={"pk": seeded.board.pk}),
+        ))
+
+    def test_detail_async(self):
+        self.check_budget(6, lambda seeded: self.client.get(
+            reverse("board-detail-async", kwargs={"pk": seeded.board.pk}),
+        ))
+
+    def test_update(self):
+        self.check_budget(12, lambda seeded: self.client.patch(
+            reverse("board-detail", kwargs={"pk": seeded.board.pk}),
+            {"title": "Renamed", "members": [user.id for user in seeded.members]},
+            format="json",
+        ))
+
+    def test_delete(self):
+        self.check_budget(5, lambda seeded: self.client.delete(
+            reverse("board-detail", kwargs={"pk": seeded.board.pk}),
+        ))
+
+    def test_changes(self):
+        self.check_budget(6, lambda seeded: self.client.get(
+            reverse("board-changes", kwargs={"pk": seeded.board.pk}) + "?since=0",
+        ))
+
+    def test_export(self):
+        def export(seeded):
+            response = self.client.get(reverse("board-export", kwargs={"pk": seeded.board.pk}))
+            b"".join(response.streaming_content)
+            return response
+
+        self.check_budget(10, export)
+
+    def test_import(self):
+        self.check_budget(36, lambda seeded: self.client.post(
+            reverse("board-import"),
+            {
+                "board": {"title": "Imported"},
+                "members": [{"email": user.email} for user in seeded.members],
+                "tasks": [
+                    {"id": task.id, "title": task.title, "assignee_email": seeded.owner.email}
+                    for task in seeded.tasks
+                ],
+                "comments": [
+                    {"task_id": comment.task_id, "author_email": seeded.owner.email, "content": comment.content}
+                    for comment in seeded.comments
+                ],
+            },
+            format="json",
+        ))
+
+    def test_email_check(self):
+        self.check_budget(2, lambda seeded: self.client.get(
+            reverse("email-check") + f"?email={seeded.members[-1].email}",
+        ))
+
+
+class SeedKanbanTests(APITestCase):
+    """
+    Tests for the synthetic data generator.
+    """
+
+    def seed(self, prefix):
+        """
+        Run the generator with a small dataset and return the task rows.
+        """
+        call_command(
+            "seed_kanban", users=30, boards=4, tasks=200, comments=300,
+            batch_size=64, prefix=prefix, stdout=StringIO(),
+        )
+        return list(
+            Task.objects.filter(created_by__username__startswith=f"{prefix}-").order_by("id").values_list(
+                "title", "status", "priority", "due_date", "comments_count",
+            )
+        )
+
+    def test_generates_consistent_data(self):
+        self.seed("seed")
+
+        self.assertEqual(User.objects.filter(userprofile__isnull=False).count(), 30)
+        self.assertEqual(Task.objects.count(), 200)
+        self.assertEqual(TaskCommentModel.objects.count(), 300)
+        for board in Board.objects.all():
+            self.assertTrue(is_board_member(board.owner_id, board.id))
+        for task in Task.objects.exclude(assignee=None):
+            self.assertTrue(BoardMembership.objects.filter(board=task.board_id, user=task.assignee_id).exists())
+        for task in Task.objects.all():
+            self.assertEqual(task.comments.count(), task.comments_count)
+
+    def test_same_seed_same_data(self):
+        self.assertEqual(self.seed("first"), self.seed("second"))
+
+    def test_due_dates_are_anchored(self):
+        call_command(
+            "seed_kanban", "--today=2030-06-15", users=5, boards=1, tasks=50, comments=0,
+            prefix="anchored", stdout=StringIO(),
+        )
+        due_dates = set(Task.objects.exclude(due_date=None).values_list("due_date", flat=True))
+
+        self.assertTrue(due_dates)
+        self.assertGreaterEqual(min(due_dates), datetime.date(2030, 5, 16))
+        self.assertLessEqual(max(due_dates), datetime.date(2030, 8, 14))
+
+    def test_existing_prefix_is_rejected(self):
+        self.seed("seed")
+
+        with self.assertRaises(CommandError):
+            self.seed("seed")
+
+
+class BenchApiTests(APITransactionTestCase):
+    """
+    Tests for the in-process load test command.
+
+    The handlers run requests in other threads, which only see committed
+    data, hence a transaction test case.
+    """
+
+    def setUp(self):
+        cache.clear()
+        call_command(
+            "seed_kanban", users=6, boards=2, members_per_board=3, tasks=20, comments=10,
+            prefix="bench", stdout=StringIO(),
+        )
+
+    def test_reports_both_handlers(self):
+        out = StringIO()
+
+        call_command("bench_api", users=2, duration=0.2, mix="dashboard=3,board-detail=1", stdout=out)
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["config"]["users"], 2)
+        for handler in ("wsgi", "asgi"):
+            self.assertGreater(report[handler]["total"]["requests"], 0)
+            self.assertEqual(report[handler]["total"]["errors"], 0)
+            self.assertIn("p99_ms", report[handler]["endpoints"]["dashboard"])
+
+    def test_run_without_requests_is_reported(self):
+        out = StringIO()
+
+        call_command("bench_api", users=2, duration=0, stdout=out)
+
+        report = json.loads(out.getvalue())
+        for handler in ("wsgi", "asgi"):
+            self.assertEqual(report[handler]["total"]["requests"], 0)
+            self.assertIsNone(report[handler]["total"]["p99_ms"])
+            self.assertEqual(report[handler]["endpoints"], {})
+
+    def test_invalid_mix_is_rejected(self):
+        with self.assertRaises(CommandError):
+            call_command("bench_api", users=2, mix="unknown=1", stdout=StringIO())
+
+    def test_missing_response_is_reported(self):
+        async def silent_app(scope, receive, send):
+            pass
+
+        with self.assertRaisesMessage(CommandError, "GET /api/boards/ ended without sending a response."):
+            asyncio.run(call_asgi(silent_app, "GET", "/api/boards/", None, "token"))
 
-# Create your tests here.
@@ -0,0 +1,43 @@
+import statistics
+
+
+def percentiles(values):
+    """
+    Return the 50th, 95th and 99th percentile of a list of numbers.
+
+    A single value is its own percentile; without values all three are
+    None.
+    """
+    if not values:
+        return None, None, None
+    values = sorted(values)
+    quantiles = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+    return quantiles[49], quantiles[94], quantiles[98]
+
+
+def summarize(samples, elapsed):
+    """
+    Return throughput, latency percentiles and error count of a run.
+
+    The percentiles are None if no request finished.
+
+    Args:
+        samples (list): ``(status, seconds)`` pairs, one per request.
+        elapsed (float): Wall-clock seconds of the whole run.
+    """
+    p50, p95, p99 = percentiles([duration for _, duration in samples])
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for status, _ in samples if status >= 400),
+        "requests_per_second": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": milliseconds(p50),
+        "p95_ms": milliseconds(p95),
+        "p99_ms": milliseconds(p99),
+    }
+
+
+def milliseconds(seconds):
+    """
+    Return seconds as rounded milliseconds, keeping None.
+    """
+    return None if seconds is None else round(seconds * 1000, 2)
@@ -0,0 +1,109 @@
+import json
+import logging
+import os
+from logging.handlers import RotatingFileHandler
+
+
+# Values of these keys are kept as they are: they carry no personal data
+# and replayed requests need them to take the same code path.
+KEPT_FIELDS = {
+    "status",
+    "priority",
+    "due_date",
+    "format",
+    "cursor",
+    "page_size",
+    "since",
+    "members",
+}
+
+# Ids and page numbers, whose values are kept when sent as digit strings.
+NUMERIC_FIELDS = {
+    "id",
+    "board",
+    "board_id",
+    "task_id",
+    "assignee_id",
+    "reviewer_id",
+    "page",
+    "add_members",
+    "remove_members",
+}
+
+# Credentials are always masked, whatever their type.
+SECRET_FIELDS = {
+    "password",
+    "repeated_password",
+    "token",
+}
+
+# Masked strings are replaced by this fixed placeholder, which reveals
+# nothing about their length.
+MASK = "xxxxxxxx"
+
+
+def sanitize(value, key=None):
+    """
+    Return the shape of a request body or query value without personal data.
+
+    Numbers, booleans and None are kept (ids, sizes, flags), as are the
+    strings of ``KEPT_FIELDS`` and the digit strings of ``NUMERIC_FIELDS``;
+    all other strings and every value of ``SECRET_FIELDS`` are replaced by
+    ``MASK``. Lists keep their length, dictionaries their keys.
+
+    Args:
+        value: The parsed JSON value.
+        key (str | None): The dictionary key the value belongs to.
+    """
+    if key in SECRET_FIELDS:
+        return MASK
+    if isinstance(value, dict):
+        return {item_key: sanitize(item, item_key) for item_key, item in value.items()}
+    if isinstance(value, list):
+        return [sanitize(item, key) for item in value]
+    if isinstance(value, str) and key not in KEPT_FIELDS and not (key in NUMERIC_FIELDS and value.isdigit()):
+        return MASK
+    return value
+
+
+def get_capture_logger(path, max_bytes, backup_count):
+    """
+    Return the logger writing captured requests to a rotating file.
+
+    A ``{pid}`` placeholder in the path is replaced by the process id;
+    use it when several worker processes capture at the same time, as
+    they must not rotate the same file.
+
+    Args:
+        path (str): The capture file.
+        max_bytes (int): Size at which the file is rotated.
+        backup_count (int): Number of rotated files kept.
+
+    Returns:
+        logging.Logger: A logger that writes each message as one line.
+    """
+    path = str(path).format(pid=os.getpid())
+    logger = logging.getLogger(f"core.capture.{path}")
+    if not logger.handlers:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def read_trace(paths):
+    """
+    Yield the captured requests of trace files in recording order.
+
+    Args:
+        paths (Iterable[str]): Capture files; pass rotated files oldest
+            first (``capture.log.2``, ``capture.log.1``, ``capture.log``).
+    """
+    for path in paths:
+        with open(path, encoding="utf-8") as trace:
+            for line in trace:
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,85 @@
+import hashlib
+
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
+
+
+# Content codings whose representations get their own ETag, as their
+# bytes differ from the uncompressed body.
+ENCODED_SUFFIXES = ("-gzip", "-br")
+
+
+def make_etag(*parts):
+    """
+    Return a strong ETag for a resource state.
+
+    Args:
+        *parts: Values identifying the resource and its version, e.g. the
+            model name, primary key and a version counter or timestamp.
+
+    Returns:
+        str: The quoted, opaque entity tag.
+    """
+    key = ":".join(str(part) for part in parts)
+    return '"%s"' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def encoded_etag(etag, coding):
+    """
+    Return the ETag of a representation sent with the given content coding.
+    """
+    if not coding:
+        return etag
+    return f'{etag[:-1]}-{coding}"'
+
+
+def matching_etag(request, etag):
+    """
+    Return the entity tag of ``If-None-Match`` that matches ``etag``.
+
+    Tags are compared weakly, as required for If-None-Match, and the
+    content-coding suffix is ignored, so a client holding the gzip
+    representation still matches the resource version.
+
+    Returns:
+        str | None: The tag sent by the client, or None without a match.
+    """
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return None
+    for tag in parse_etags(header):
+        if tag == "*":
+            return etag
+        candidate = tag.removeprefix("W/")
+        for suffix in ENCODED_SUFFIXES:
+            if candidate.endswith(f'{suffix}"'):
+                candidate = candidate[:-len(suffix) - 1] + '"'
+                break
+        if candidate == etag:
+            return tag
+    return None
+
+
+def not_modified(request, etag):
+    """
+    Return a 304 response if the client already holds the current version.
+
+    Call it after the access checks and before the payload is built, so
+    unchanged resources cost only the query that loads their version.
+
+    Args:
+        request: The GET or HEAD request.
+        etag (str): The ETag of the current version (see ``make_etag``).
+
+    Returns:
+        HttpResponseNotModified | None: The response to send, or None if
+        the full response is needed.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    tag = matching_etag(request, etag)
+    if tag is None:
+        return None
+    response = HttpResponseNotModified()
+    response["ETag"] = tag
+    return response
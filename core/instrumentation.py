@@ -0,0 +1,134 @@
+import contextlib
+import contextvars
+import time
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+
+_current_timing = contextvars.ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    """
+    Measurements collected while one request is handled.
+
+    Times are in seconds. ``serializer_time`` is collected by
+    ``TimedSerializerMixin`` and includes queries that run lazily while a
+    serializer builds its data. Timings can be nested
+    (e.g. by two middlewares); queries and serializer time are added to
+    the innermost timing and all of its parents.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.view_time = 0.0
+        self._serializer_depth = 0
+
+    def add_query(self, duration):
+        """
+        Record one query on this timing and its parents.
+        """
+        timing = self
+        while timing is not None:
+            timing.query_count += 1
+            timing.db_time += duration
+            timing = timing.parent
+
+    def add_serializer_time(self, duration):
+        """
+        Record serializer time on this timing and its parents.
+        """
+        timing = self
+        while timing is not None:
+            timing.serializer_time += duration
+            timing = timing.parent
+
+
+@contextlib.contextmanager
+def track_request():
+    """
+    Collect query, serializer and view timings for the enclosed block.
+
+    The timing is stored in a context variable, so queries and
+    serializers running in ``sync_to_async`` threads of an async request
+    are counted too. Yields the ``RequestTiming``; ``view_time`` is set
+    when the block exits.
+    """
+    timing = RequestTiming(parent=_current_timing.get())
+    token = _current_timing.set(timing)
+    started = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        timing.view_time = time.perf_counter() - started
+        _current_timing.reset(token)
+
+
+def get_current_timing():
+    """
+    Return the ``RequestTiming`` of the request being handled, or None.
+    """
+    return _current_timing.get()
+
+
+def time_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper adding every query to the current timing.
+    """
+    timing = _current_timing.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timing.add_query(time.perf_counter() - started)
+
+
+def add_query_timer(connection, **kwargs):
+    """
+    Install ``time_query`` on a database connection once.
+    """
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+def install_query_timer():
+    """
+    Time the queries of all current and future database connections.
+
+    Safe to call more than once.
+    """
+    connection_created.connect(add_query_timer, dispatch_uid="core.instrumentation.add_query_timer")
+    for connection in connections.all(initialized_only=True):
+        add_query_timer(connection)
+
+
+class TimedSerializerMixin:
+    """
+    Serializer mixin adding ``to_representation`` time to the current timing.
+
+    Only the outermost call is timed, so nested serializers are not
+    counted twice; for ``many=True`` the time of every item is added up.
+    Queries that run lazily while an item is represented are included.
+    Mix it into the serializers that render response bodies; serializers
+    only used for input or only nested in timed ones do not need it.
+    """
+
+    def to_representation(self, instance):
+        timing = _current_timing.get()
+        if timing is None or timing._serializer_depth:
+            return super().to_representation(instance)
+
+        timing._serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            timing.add_serializer_time(time.perf_counter() - started)
+            timing._serializer_depth -= 1
@@ -0,0 +1,228 @@
+import atexit
+import bisect
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+HISTOGRAMS = {
+    "kanmind_http_request_duration_seconds": ("Request latency in seconds.", LATENCY_BUCKETS),
+    "kanmind_http_request_queries": ("Database queries per request.", QUERY_BUCKETS),
+    "kanmind_http_response_size_bytes": ("Response body size in bytes.", SIZE_BUCKETS),
+}
+
+COUNTERS = {
+    "kanmind_http_requests_total": "Requests by URL name, method and status class.",
+    "kanmind_http_request_errors_total": "Requests answered with a 5xx status.",
+}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe in-process store of request histograms and counters.
+
+    With ``METRICS_MULTIPROC_DIR`` set, every process also writes its
+    values to ``<dir>/metrics-<pid>.json`` (atomically, at most every
+    ``METRICS_FLUSH_INTERVAL`` seconds) and ``render()`` merges the files
+    of all processes, so any worker can answer a scrape for the whole
+    deployment. Clear the directory when the deployment
+    restarts.
+    """
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = defaultdict(float)
+        self._last_flush = 0.0
+        self._dirty = False
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def observe(self, name, labels, value):
+        """
+        Add a value to a histogram.
+
+        Args:
+            name (str): One of ``HISTOGRAMS``.
+            labels (dict): The label values of the series.
+            value (float): The observed value.
+        """
+        buckets = HISTOGRAMS[name][1]
+        key = series_key(name, labels)
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = {
+                    "buckets": [0] * (len(buckets) + 1),
+                    "sum": 0.0,
+                }
+            series["buckets"][bisect.bisect_left(buckets, value)] += 1
+            series["sum"] += value
+            self._dirty = True
+
+    def increment(self, name, labels, amount=1):
+        """
+        Increase a counter.
+
+        Args:
+            name (str): One of ``COUNTERS``.
+            labels (dict): The label values of the series.
+            amount (float): The increment.
+        """
+        with self._lock:
+            self._counters[series_key(name, labels)] += amount
+            self._dirty = True
+
+    def maybe_flush(self):
+        """
+        Write the values of this process if the flush interval has passed.
+        """
+        if self.directory is not None and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Atomically replace this process's file with its current values.
+        """
+        if self.directory is None:
+            return
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._dirty:
+                return
+            payload = json.dumps(self.snapshot())
+            self._dirty = False
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".metrics-", suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(payload)
+        os.replace(tmp_path, self.directory / f"metrics-{os.getpid()}.json")
+
+    def snapshot(self):
+        """
+        Return a JSON-serializable copy of the values of this process.
+        """
+        return {
+            "histograms": {
+                key: {"buckets": list(series["buckets"]), "sum": series["sum"]}
+                for key, series in self._histograms.items()
+            },
+            "counters": dict(self._counters),
+        }
+
+    def collect(self):
+        """
+        Return the values of all processes, merged.
+        """
+        with self._lock:
+            snapshots = [self.snapshot()]
+
+        if self.directory is not None:
+            own_file = f"metrics-{os.getpid()}.json"
+            for path in self.directory.glob("metrics-*.json"):
+                if path.name == own_file:
+                    continue
+                try:
+                    snapshots.append(json.loads(path.read_text()))
+                except (OSError, ValueError):
+                    # The file of a process that is just being replaced.
+                    continue
+
+        histograms = {}
+        counters = defaultdict(float)
+        for snapshot in snapshots:
+            for key, series in snapshot["histograms"].items():
+                merged = histograms.setdefault(key, {"buckets": [0] * len(series["buckets"]), "sum": 0.0})
+                merged["buckets"] = [a + b for a, b in zip(merged["buckets"], series["buckets"])]
+                merged["sum"] += series["sum"]
+            for key, value in snapshot["counters"].items():
+                counters[key] += value
+        return histograms, counters
+
+    def render(self):
+        """
+        Return all metrics in the Prometheus text exposition format.
+        """
+        histograms, counters = self.collect()
+        lines = []
+
+        for name, (help_text, buckets) in HISTOGRAMS.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for key in sorted(k for k in histograms if k.startswith(f'["{name}"')):
+                series = histograms[key]
+                labels = json.loads(key)[1]
+                cumulative = 0
+                for bound, count in zip([*buckets, "+Inf"], series["buckets"]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{format_labels({**labels, 'le': str(bound)})} {cumulative}")
+                lines.append(f"{name}_sum{format_labels(labels)} {series['sum']}")
+                lines.append(f"{name}_count{format_labels(labels)} {cumulative}")
+
+        for name, help_text in COUNTERS.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for key in sorted(k for k in counters if k.startswith(f'["{name}"')):
+                lines.append(f"{name}{format_labels(json.loads(key)[1])} {counters[key]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def series_key(name, labels):
+    """
+    Return the key of a series; JSON so it can be written to the file store.
+    """
+    return json.dumps([name, labels], sort_keys=True)
+
+
+def format_labels(labels):
+    """
+    Format labels as ``{name="value",...}`` with Prometheus escaping.
+    """
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+registry = MetricsRegistry(
+    getattr(settings, "METRICS_MULTIPROC_DIR", None),
+    getattr(settings, "METRICS_FLUSH_INTERVAL", 1.0),
+)
+atexit.register(registry.flush)
+
+
+def record_request(url_name, method, status_code, duration, query_count, response_size):
+    """
+    Record one handled request in the process-wide registry.
+
+    Args:
+        url_name (str): The resolved URL name, or ``unresolved``.
+        method (str): The HTTP method.
+        status_code (int): The response status.
+        duration (float): The handling time in seconds.
+        query_count (int): The number of database queries.
+        response_size (int | None): The body size, None for streamed bodies.
+    """
+    labels = {"url_name": url_name, "method": method}
+    registry.observe("kanmind_http_request_duration_seconds", labels, duration)
+    registry.observe("kanmind_http_request_queries", labels, query_count)
+    if response_size is not None:
+        registry.observe("kanmind_http_response_size_bytes", labels, response_size)
+    registry.increment("kanmind_http_requests_total", {**labels, "status": f"{status_code // 100}xx"})
+    if status_code >= 500:
+        registry.increment("kanmind_http_request_errors_total", labels)
+    registry.maybe_flush()
@@ -0,0 +1,392 @@
+import cProfile
+import io
+import itertools
+import json
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed, RequestDataTooBig
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+from core import metrics
+from core.capture import get_capture_logger, sanitize
+from core.instrumentation import install_query_timer, track_request
+
+
+timing_logger = logging.getLogger("core.timing")
+
+
+class ServerTimingMiddleware:
+    """
+    Measure queries, DB time, serializer time and view time per request.
+
+    A sampled share of requests (``REQUEST_TIMING_SAMPLE_RATE``, 0.0 - 1.0)
+    is measured; for those the numbers are added as a ``Server-Timing``
+    header and logged as one JSON line on the ``core.timing`` logger,
+    tagged with the resolved URL name. Requests that are not sampled pass
+    through untouched.
+
+    Place it last in ``MIDDLEWARE`` so the view time covers little more
+    than the view itself.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "REQUEST_TIMING_SAMPLE_RATE", 0.0)
+        install_query_timer()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.is_sampled():
+            return self.get_response(request)
+
+        with track_request() as timing:
+            response = self.get_response(request)
+        self.report(request, response, timing)
+        return response
+
+    async def __acall__(self, request):
+        if not self.is_sampled():
+            return await self.get_response(request)
+
+        with track_request() as timing:
+            response = await self.get_response(request)
+        self.report(request, response, timing)
+        return response
+
+    def is_sampled(self):
+        """
+        Decide whether the current request is measured.
+        """
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def report(self, request, response, timing):
+        """
+        Add the ``Server-Timing`` header and write the log line.
+        """
+        response["Server-Timing"] = ", ".join([
+            f'db;desc="{timing.query_count} queries";dur={timing.db_time * 1000:.1f}',
+            f"serializer;dur={timing.serializer_time * 1000:.1f}",
+            f"view;dur={timing.view_time * 1000:.1f}",
+        ])
+
+        match = getattr(request, "resolver_match", None)
+        timing_logger.info(json.dumps({
+            "url_name": match.url_name if match else None,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": timing.query_count,
+            "db_ms": round(timing.db_time * 1000, 2),
+            "serializer_ms": round(timing.serializer_time * 1000, 2),
+            "view_ms": round(timing.view_time * 1000, 2),
+        }))
+
+
+class MetricsMiddleware:
+    """
+    Record latency, query count, response size and status of every request
+    in the Prometheus metrics served at ``/metrics``.
+
+    Series are labelled with the resolved URL name and the HTTP method.
+    Place it first in ``MIDDLEWARE`` so the latency covers the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install_query_timer()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with track_request() as timing:
+            response = self.get_response(request)
+        self.record(request, response, timing)
+        return response
+
+    async def __acall__(self, request):
+        with track_request() as timing:
+            response = await self.get_response(request)
+        self.record(request, response, timing)
+        return response
+
+    def record(self, request, response, timing):
+        """
+        Add the request to the metrics registry.
+        """
+        match = getattr(request, "resolver_match", None)
+        metrics.record_request(
+            (match.url_name or "unnamed") if match else "unresolved",
+            request.method,
+            response.status_code,
+            timing.view_time,
+            timing.query_count,
+            None if response.streaming else len(response.content),
+        )
+
+
+class ProfilingMiddleware:
+    """
+    Run single requests under cProfile and tracemalloc on demand.
+
+    A request is profiled when it carries an ``X-Profile: 1`` header or a
+    ``?profile=1`` query parameter and comes from a staff user (session
+    or ``Authorization: Token``). The report is written to
+    ``PROFILING_DIR``: a ``.prof`` file for pstats/snakeviz and a ``.txt``
+    summary with the functions sorted by cumulative time and the top
+    allocation sites. Its name (time, pid, a per-process sequence number
+    and the URL name) is returned in the ``X-Profile-Report`` header. The flag is ignored for everyone else.
+
+    In async mode only the event loop thread is profiled; code running in
+    ``sync_to_async`` threads shows up as time spent awaiting. Only one
+    request per process is profiled at a time; concurrent requests with
+    the flag are served without profiling.
+    """
+
+    sync_capable = True
+    async_capable = True
+    header = "X-Profile"
+    query_param = "profile"
+    top_functions = 60
+    top_allocations = 30
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.directory = Path(getattr(settings, "PROFILING_DIR", settings.BASE_DIR / "profiles"))
+        self.lock = threading.Lock()
+        self.sequence = itertools.count(1)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.is_requested(request) or not self.is_staff(request):
+            return self.get_response(request)
+        if not self.lock.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            profile, started = self.start()
+            try:
+                response = self.get_response(request)
+            finally:
+                profile.disable()
+            return self.finish(request, response, profile, started)
+        finally:
+            self.lock.release()
+
+    async def __acall__(self, request):
+        if not self.is_requested(request):
+            return await self.get_response(request)
+        if not await sync_to_async(self.is_staff)(request):
+            return await self.get_response(request)
+        if not self.lock.acquire(blocking=False):
+            return await self.get_response(request)
+
+        try:
+            profile, started = self.start()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profile.disable()
+            return self.finish(request, response, profile, started)
+        finally:
+            self.lock.release()
+
+    def is_requested(self, request):
+        """
+        Check whether the request asks to be profiled.
+        """
+        return request.headers.get(self.header) == "1" or request.GET.get(self.query_param) == "1"
+
+    def is_staff(self, request):
+        """
+        Check whether the request comes from a staff user.
+        """
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return user.is_staff
+
+        if not get_authorization_header(request):
+            return False
+        try:
+            credentials = TokenAuthentication().authenticate(request)
+        except AuthenticationFailed:
+            return False
+        return credentials is not None and credentials[0].is_staff
+
+    def start(self):
+        """
+        Start tracing allocations and profiling.
+
+        :return: Tuple of the profiler and a tracemalloc snapshot taken
+            before the request
+        """
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start(10)
+        started = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile, started
+
+    def finish(self, request, response, profile, started):
+        """
+        Stop tracing, write the report and name it in the response.
+        """
+        allocations = tracemalloc.take_snapshot().compare_to(started, "lineno")
+        if self.started_tracing:
+            tracemalloc.stop()
+
+        match = getattr(request, "resolver_match", None)
+        name = "-".join([
+            time.strftime("%Y%m%d-%H%M%S"),
+            str(os.getpid()),
+            str(next(self.sequence)),
+            match.url_name if match else "unresolved",
+        ])
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(self.directory / f"{name}.prof")
+
+        report = io.StringIO()
+        report.write(f"{request.method} {request.get_full_path()} -> {response.status_code}\n\n")
+        report.write("Functions by cumulative time\n")
+        pstats.Stats(profile, stream=report).sort_stats("cumulative").print_stats(self.top_functions)
+        report.write("Allocation sites by allocated size\n\n")
+        for statistic in allocations[:self.top_allocations]:
+            report.write(f"{statistic}\n")
+        (self.directory / f"{name}.txt").write_text(report.getvalue())
+
+        response["X-Profile-Report"] = name
+        return response
+
+
+class TrafficCaptureMiddleware:
+    """
+    Record sanitized requests to a rotating file for ``manage.py replay_traffic``.
+
+    Opt-in: the middleware is only active when ``TRAFFIC_CAPTURE_FILE``
+    is set. For a sampled share of requests (``TRAFFIC_CAPTURE_SAMPLE_RATE``)
+    it writes one JSON line with the method, URL name, path parameters,
+    query and body shape (see ``core.capture.sanitize``), the id of the
+    authenticated user, and the status, latency and query count observed.
+    JSON bodies above ``TRAFFIC_CAPTURE_MAX_BODY_SIZE`` bytes are recorded
+    by size only. Unresolved URLs, ``/metrics`` and the event streams are
+    not recorded.
+    """
+
+    sync_capable = True
+    async_capable = True
+    ignored_url_names = {"metrics", "board-events"}
+
+    def __init__(self, get_response):
+        path = getattr(settings, "TRAFFIC_CAPTURE_FILE", None)
+        if not path:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "TRAFFIC_CAPTURE_SAMPLE_RATE", 1.0)
+        self.max_body_size = getattr(settings, "TRAFFIC_CAPTURE_MAX_BODY_SIZE", 64 * 1024)
+        self.logger = get_capture_logger(
+            path,
+            getattr(settings, "TRAFFIC_CAPTURE_MAX_BYTES", 50 * 1024 * 1024),
+            getattr(settings, "TRAFFIC_CAPTURE_BACKUP_COUNT", 5),
+        )
+        install_query_timer()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.is_sampled():
+            return self.get_response(request)
+
+        body = self.read_body(request)
+        with track_request() as timing:
+            response = self.get_response(request)
+        self.record(request, response, body, timing)
+        return response
+
+    async def __acall__(self, request):
+        if not self.is_sampled():
+            return await self.get_response(request)
+
+        body = self.read_body(request)
+        with track_request() as timing:
+            response = await self.get_response(request)
+        self.record(request, response, body, timing)
+        return response
+
+    def is_sampled(self):
+        """
+        Decide whether the current request is recorded.
+        """
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def read_body(self, request):
+        """
+        Return the parsed JSON body, or None.
+
+        Read before the view runs; the body stays available to the view.
+        """
+        size = self.content_length(request)
+        if request.content_type != "application/json" or not size or size > self.max_body_size:
+            return None
+        try:
+            return json.loads(request.body)
+        except (RequestDataTooBig, ValueError):
+            return None
+
+    def content_length(self, request):
+        """
+        Return the announced body size in bytes.
+        """
+        try:
+            return int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return 0
+
+    def record(self, request, response, body, timing):
+        """
+        Write the captured request as one JSON line.
+        """
+        match = getattr(request, "resolver_match", None)
+        if match is None or match.url_name is None or match.url_name in self.ignored_url_names:
+            return
+
+        user = getattr(request, "user", None)
+        self.logger.info(json.dumps({
+            "time": round(time.time(), 3),
+            "method": request.method,
+            "url_name": match.url_name,
+            "kwargs": match.kwargs,
+            "query": {key: sanitize(value, key) for key, value in request.GET.items()},
+            "body": sanitize(body),
+            "body_size": self.content_length(request),
+            "user_id": user.pk if user is not None and user.is_authenticated else None,
+            "status": response.status_code,
+            "duration_ms": round(timing.view_time * 1000, 2),
+            "queries": timing.query_count,
+        }))
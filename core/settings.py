@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,6 +47,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -53,6 +56,9 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.TrafficCaptureMiddleware',
+    'core.middleware.ServerTimingMiddleware',
+    'core.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -86,6 +92,84 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+#
+# The board membership index (board_app.membership) lives in this cache.
+# Deployments with several worker processes should point it at a shared
+# backend (Redis / Memcached) so invalidations reach every worker.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+BOARD_MEMBERSHIP_CACHE_TIMEOUT = 300
+
+# Seconds a user's dashboard stays cached (board_app.dashboard); cached
+# dashboards are also dropped as soon as one of their boards changes.
+BOARD_DASHBOARD_CACHE_TIMEOUT = 300
+
+# Seconds a rendered board detail snapshot (board_app.snapshots) stays
+# cached; each board keeps only the snapshot of its latest version.
+BOARD_SNAPSHOT_CACHE_TIMEOUT = 3600
+
+# Pub/sub backend for the board event streams (board_app.events). The
+# in-process broker only sees writes made by the same process.
+BOARD_EVENTS_BROKER = 'board_app.events.InProcessBroker'
+
+
+# Request instrumentation (core.middleware.ServerTimingMiddleware).
+# Share of requests measured and reported with a Server-Timing header and
+# a log line on the ``core.timing`` logger; 0.0 - 1.0. Off unless
+# KANMIND_REQUEST_TIMING_SAMPLE_RATE is set.
+REQUEST_TIMING_SAMPLE_RATE = float(os.environ.get('KANMIND_REQUEST_TIMING_SAMPLE_RATE', '0'))
+
+# Prometheus metrics (core.metrics), served at /metrics. With several
+# worker processes, point KANMIND_METRICS_DIR at a directory shared by the
+# workers (cleared on every deploy) so each worker can answer for all.
+METRICS_MULTIPROC_DIR = os.environ.get('KANMIND_METRICS_DIR')
+METRICS_FLUSH_INTERVAL = 1.0
+
+# On-demand profiling (core.middleware.ProfilingMiddleware): reports of
+# requests sent by staff users with "X-Profile: 1" are written here.
+PROFILING_DIR = BASE_DIR / 'profiles'
+
+# Traffic capture (core.middleware.TrafficCaptureMiddleware) for
+# ``manage.py replay_traffic``. Off unless KANMIND_CAPTURE_FILE is set;
+# with several worker processes, put "{pid}" into the file name.
+TRAFFIC_CAPTURE_FILE = os.environ.get('KANMIND_CAPTURE_FILE')
+TRAFFIC_CAPTURE_SAMPLE_RATE = 1.0
+TRAFFIC_CAPTURE_MAX_BYTES = 50 * 1024 * 1024
+TRAFFIC_CAPTURE_BACKUP_COUNT = 5
+TRAFFIC_CAPTURE_MAX_BODY_SIZE = 64 * 1024
+
+
+# Logging
+# https://docs.djangoproject.com/en/6.0/topics/logging/
+
+TESTING = sys.argv[1:2] == ['test']
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        # Timing lines are not printed while the test suite runs.
+        'core.timing': {
+            'handlers': [] if TESTING else ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -0,0 +1,172 @@
+import contextlib
+import datetime
+import re
+from collections import Counter
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from auth_app.models import UserProfile
+from board_app.models import Board, BoardChange, BoardMembership
+from task_app.models import Task, TaskCommentModel
+
+
+SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+SQL_VALUE_LISTS = re.compile(r"(\(\?(?:, \?)*\))(?:, \1)+")
+
+
+class SeededBoard:
+    """
+    A board seeded by ``seed_board`` with handles to its rows.
+    """
+
+    def __init__(self, board, owner, token, members, tasks, comments):
+        self.board = board
+        self.owner = owner
+        self.token = token
+        self.members = members
+        self.tasks = tasks
+        self.comments = comments
+
+
+def seed_board(size, prefix):
+    """
+    Create a board with ``size`` members, tasks and comments.
+
+    Rows are inserted with ``bulk_create``; the change log gets one entry
+    per task. The first task holds all comments, so comment lists grow
+    with ``size`` too. Users have no usable password; the owner gets an
+    auth token.
+
+    Args:
+        size (int): Number of members (including the owner), tasks and comments.
+        prefix (str): Prefix making usernames and emails unique.
+
+    Returns:
+        SeededBoard: The seeded board.
+    """
+    users = User.objects.bulk_create([
+        User(username=f"{prefix}-user{index}", email=f"{prefix}-user{index}@example.com", password="!")
+        for index in range(size)
+    ])
+    UserProfile.objects.bulk_create([
+        UserProfile(user=user, fullname=f"User {index}") for index, user in enumerate(users)
+    ])
+    owner = users[0]
+    board = Board.objects.create(title=f"Board {prefix}", owner=owner)
+    BoardMembership.objects.bulk_create([
+        BoardMembership(board=board, user=user) for user in users[1:]
+    ])
+
+    statuses = ["to-do", "in-progress", "review", "done"]
+    priorities = ["low", "medium", "high"]
+    today = datetime.date(2026, 1, 1)
+    tasks = Task.objects.bulk_create([
+        Task(
+            board=board,
+            title=f"Task {index}",
+            status=statuses[index % len(statuses)],
+            priority=priorities[index % len(priorities)],
+            assignee=users[index % size],
+            reviewer=owner,
+            due_date=today + datetime.timedelta(days=index % 30),
+            created_by=owner,
+        )
+        for index in range(size)
+    ])
+    comments = TaskCommentModel.objects.bulk_create([
+        TaskCommentModel(task=tasks[0], author=users[index % size], content=f"Comment {index}")
+        for index in range(size)
+    ])
+    Task.objects.filter(pk=tasks[0].pk).update(comments_count=size)
+    BoardChange.objects.bulk_create([
+        BoardChange(board=board, kind=BoardChange.TASK, action=BoardChange.UPSERT, object_id=task.pk)
+        for task in tasks
+    ])
+    return SeededBoard(board, owner, Token.objects.create(user=owner), users, tasks, comments)
+
+
+def format_queries(queries):
+    """
+    Format captured queries for a failure message.
+
+    Statements that ran more than once with different parameters are
+    listed first; they are the usual sign of an N+1 query.
+    """
+    shapes = Counter(
+        SQL_VALUE_LISTS.sub(r"\1, ...", SQL_LITERALS.sub("?", query["sql"]))
+        for query in queries
+    )
+    repeated = [(count, shape) for shape, count in shapes.most_common() if count > 1]
+
+    lines = []
+    if repeated:
+        lines.append("Repeated statements (likely N+1):")
+        lines += [f"  {count}x {shape}" for count, shape in repeated]
+    lines.append("Queries:")
+    lines += [f"  {number}. {query['sql']}" for number, query in enumerate(queries, start=1)]
+    return "\n".join(lines)
+
+
+class QueryBudgetTestCase(APITestCase):
+    """
+    Base class for query-budget tests.
+
+    Seeds one board per entry of ``sizes`` and provides
+    ``assertQueryBudget`` and ``check_budget`` to assert that an endpoint
+    stays within a fixed number of queries however big the board is.
+    Budgets are measured with a cold cache.
+    """
+
+    sizes = (1, 10, 100, 1000)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seeded = {size: seed_board(size, f"s{size}") for size in cls.sizes}
+
+    def setUp(self):
+        cache.clear()
+
+    @contextlib.contextmanager
+    def assertQueryBudget(self, budget):
+        """
+        Fail with the executed SQL if the block runs more than ``budget`` queries.
+        """
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        executed = len(context.captured_queries)
+        if executed > budget:
+            self.fail(
+                f"{executed} queries executed, budget is {budget}.\n"
+                f"{format_queries(context.captured_queries)}"
+            )
+
+    def authenticate(self, seeded):
+        """
+        Send the following requests with the token of the board owner.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {seeded.token.key}")
+
+    def check_budget(self, budget, request):
+        """
+        Call ``request(seeded)`` for every seeded board within the budget.
+
+        Requests are authenticated as the board owner.
+
+        Args:
+            budget (int): Maximum number of queries per request.
+            request (Callable[[SeededBoard], Response]): Sends the request
+                for one seeded board, authenticated as needed.
+        """
+        for size, seeded in self.seeded.items():
+            with self.subTest(size=size):
+                cache.clear()
+                self.authenticate(seeded)
+                with self.assertQueryBudget(budget):
+                    response = request(seeded)
+                self.assertLess(response.status_code, 400, getattr(response, "data", response))
@@ -0,0 +1,316 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management import call_command
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from board_app.models import Board
+from core.capture import read_trace, sanitize
+from core.conditional import encoded_etag, make_etag, not_modified
+from core.metrics import MetricsRegistry
+from core.middleware import TrafficCaptureMiddleware
+from core.testing import QueryBudgetTestCase
+from task_app.models import Task
+
+
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0)
+class ServerTimingMiddlewareTests(APITestCase):
+    """
+    Tests for the per-request query and timing instrumentation.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.client.force_authenticate(self.user)
+
+    def test_header_and_log_line(self):
+        with self.assertLogs("core.timing", "INFO") as logs:
+            response = self.client.get(reverse("board-detail", kwargs={"pk": self.board.pk}))
+
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry["url_name"], "board-detail")
+        self.assertEqual(entry["status"], 200)
+        self.assertGreater(entry["queries"], 0)
+        self.assertGreater(entry["serializer_ms"], 0)
+        self.assertEqual(logs.records[0].name, "core.timing")
+        self.assertIn(f'db;desc="{entry["queries"]} queries"', response["Server-Timing"])
+        self.assertIn("serializer;dur=", response["Server-Timing"])
+        self.assertIn("view;dur=", response["Server-Timing"])
+
+    async def test_async_view(self):
+        with self.assertLogs("core.timing", "INFO") as logs:
+            await self.async_client.get(reverse("boardDashboard-async"))
+
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(entry["url_name"], "boardDashboard-async")
+        self.assertEqual(entry["status"], 401)
+
+    @override_settings(REQUEST_TIMING_SAMPLE_RATE=0.0)
+    def test_unsampled_requests_are_not_measured(self):
+        response = self.client.get(reverse("boardDashboard"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+
+
+class MetricsTests(APITestCase):
+    """
+    Tests for the Prometheus metrics endpoint and its registry.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        self.client.force_authenticate(self.user)
+
+    def test_requests_are_exposed_per_url_name(self):
+        self.client.get(reverse("boardDashboard"))
+        self.client.get(reverse("board-detail", kwargs={"pk": 999}))
+
+        response = self.client.get(reverse("metrics"))
+        content = response.content.decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn("# TYPE kanmind_http_request_duration_seconds histogram", content)
+        self.assertIn('kanmind_http_request_duration_seconds_bucket{method="GET",url_name="boardDashboard",le="+Inf"}', content)
+        self.assertIn('kanmind_http_request_queries_count{method="GET",url_name="boardDashboard"}', content)
+        self.assertIn('kanmind_http_requests_total{method="GET",status="4xx",url_name="board-detail"}', content)
+
+    def test_histogram_buckets_are_cumulative(self):
+        test_registry = MetricsRegistry()
+        for value in (0.001, 0.02, 0.02, 20):
+            test_registry.observe("kanmind_http_request_duration_seconds", {"url_name": "x"}, value)
+
+        content = test_registry.render()
+
+        self.assertIn('kanmind_http_request_duration_seconds_bucket{url_name="x",le="0.005"} 1', content)
+        self.assertIn('kanmind_http_request_duration_seconds_bucket{url_name="x",le="0.025"} 3', content)
+        self.assertIn('kanmind_http_request_duration_seconds_bucket{url_name="x",le="10.0"} 3', content)
+        self.assertIn('kanmind_http_request_duration_seconds_bucket{url_name="x",le="+Inf"} 4', content)
+        self.assertIn('kanmind_http_request_duration_seconds_count{url_name="x"} 4', content)
+
+    def test_file_store_merges_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            other_process = MetricsRegistry()
+            other_process.increment("kanmind_http_requests_total", {"url_name": "x"}, 2)
+            Path(directory, "metrics-999999.json").write_text(json.dumps(other_process.snapshot()))
+
+            this_process = MetricsRegistry(directory)
+            this_process.increment("kanmind_http_requests_total", {"url_name": "x"})
+            this_process.flush()
+
+            self.assertIn('kanmind_http_requests_total{url_name="x"} 3.0', this_process.render())
+            self.assertEqual(len(list(Path(directory).glob("metrics-*.json"))), 2)
+
+
+class ProfilingMiddlewareTests(APITestCase):
+    """
+    Tests for on-demand request profiling.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        settings_override = override_settings(PROFILING_DIR=self.directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.staff = User.objects.create_user(username="staff", email="staff@example.com", is_staff=True)
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.staff)
+
+    def get_detail(self, user, **kwargs):
+        """
+        Request the board detail with the user's token.
+        """
+        token = Token.objects.create(user=user)
+        return self.client.get(
+            reverse("board-detail", kwargs={"pk": self.board.pk}),
+            HTTP_AUTHORIZATION=f"Token {token.key}",
+            **kwargs,
+        )
+
+    def test_staff_request_is_profiled(self):
+        response = self.get_detail(self.staff, HTTP_X_PROFILE="1")
+
+        self.assertEqual(response.status_code, 200)
+        name = response["X-Profile-Report"]
+        self.assertIn("board-detail", name)
+        report = Path(self.directory.name, f"{name}.txt").read_text()
+        self.assertIn("Functions by cumulative time", report)
+        self.assertIn("Allocation sites by allocated size", report)
+        self.assertTrue(Path(self.directory.name, f"{name}.prof").exists())
+
+    def test_reports_in_the_same_second_are_kept(self):
+        token = Token.objects.create(user=self.staff)
+        url = reverse("board-detail", kwargs={"pk": self.board.pk})
+
+        with mock.patch("core.middleware.time.strftime", return_value="20260101-000000"):
+            names = [
+                self.client.get(url, HTTP_AUTHORIZATION=f"Token {token.key}", HTTP_X_PROFILE="1")["X-Profile-Report"]
+                for _ in range(2)
+            ]
+
+        self.assertNotEqual(names[0], names[1])
+        self.assertEqual(len(list(Path(self.directory.name).glob("*.txt"))), 2)
+
+    def test_query_flag(self):
+        token = Token.objects.create(user=self.staff)
+
+        response = self.client.get(
+            reverse("boardDashboard"), {"profile": "1"}, HTTP_AUTHORIZATION=f"Token {token.key}"
+        )
+
+        self.assertIn("X-Profile-Report", response)
+
+    def test_flag_is_ignored_for_other_users(self):
+        self.board.members.add(self.user)
+
+        response = self.get_detail(self.user, HTTP_X_PROFILE="1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Report", response)
+        self.assertEqual(list(Path(self.directory.name).iterdir()), [])
+
+
+class QueryBudgetTests(QueryBudgetTestCase):
+    """
+    Tests for the query-budget assertion itself.
+    """
+
+    sizes = (3,)
+
+    def test_failure_lists_repeated_statements(self):
+        with self.assertRaises(AssertionError) as context:
+            with self.assertQueryBudget(2):
+                for user in self.seeded[3].members:
+                    User.objects.get(pk=user.pk)
+
+        message = str(context.exception)
+        self.assertIn("3 queries executed, budget is 2.", message)
+        self.assertIn("Repeated statements (likely N+1):\n  3x SELECT", message)
+        self.assertIn("  3. SELECT", message)
+
+    def test_within_budget(self):
+        with self.assertQueryBudget(1):
+            User.objects.count()
+
+
+class TrafficCaptureTests(APITestCase):
+    """
+    Tests for recording and replaying sanitized traffic.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "capture.log"
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.task = Task.objects.create(board=self.board, title="Task", status="to-do")
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sanitize(self):
+        self.assertEqual(
+            sanitize({"title": "Secret", "status": "done", "assignee_id": 3, "members": [1, 2], "page": "2"}),
+            {"title": "xxxxxxxx", "status": "done", "assignee_id": 3, "members": [1, 2], "page": "2"},
+        )
+
+    def test_sanitize_masks_numeric_secrets(self):
+        self.assertEqual(
+            sanitize({"password": "12345678", "repeated_password": 12345678, "email": "a@b.de", "title": "2024"}),
+            {"password": "xxxxxxxx", "repeated_password": "xxxxxxxx", "email": "xxxxxxxx", "title": "xxxxxxxx"},
+        )
+
+    def test_login_password_is_not_captured(self):
+        with self.settings(TRAFFIC_CAPTURE_FILE=str(self.path)):
+            self.client.post(reverse("login"), {"email": "user@example.com", "password": "12345678"}, format="json")
+
+        entry = next(read_trace([self.path]))
+        self.assertEqual(entry["url_name"], "login")
+        self.assertEqual(entry["body"], {"email": "xxxxxxxx", "password": "xxxxxxxx"})
+        self.assertNotIn("12345678", self.path.read_text())
+
+    def test_disabled_without_capture_file(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            TrafficCaptureMiddleware(lambda request: None)
+
+    def test_capture_and_replay(self):
+        with self.settings(TRAFFIC_CAPTURE_FILE=str(self.path)):
+            self.client.patch(
+                reverse("task", kwargs={"pk": self.task.pk}),
+                {"title": "Private title", "status": "done"},
+                format="json",
+            )
+            self.client.get(reverse("board-detail", kwargs={"pk": self.board.pk}) + "?members=false")
+            self.client.get("/unknown/")
+
+        entries = list(read_trace([self.path]))
+        self.assertEqual([entry["url_name"] for entry in entries], ["task", "board-detail"])
+        self.assertEqual(entries[0]["body"], {"title": "xxxxxxxx", "status": "done"})
+        self.assertEqual(entries[0]["kwargs"], {"pk": self.task.pk})
+        self.assertEqual(entries[0]["user_id"], self.user.pk)
+        self.assertEqual(entries[1]["query"], {"members": "false"})
+
+        out = StringIO()
+        call_command("replay_traffic", str(self.path), stdout=out)
+        report = json.loads(out.getvalue())
+
+        self.assertEqual(report["replayed"], 2)
+        self.assertEqual(set(report["endpoints"]), {"PATCH task", "GET board-detail"})
+        self.assertEqual(report["endpoints"]["PATCH task"]["status_changes"], 0)
+        self.assertIn("queries_mean", report["endpoints"]["PATCH task"]["delta"])
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, "xxxxxxxx")
+
+
+class ConditionalGetTests(APITestCase):
+    """
+    Tests for the ETag helpers of conditional GET requests.
+    """
+
+    def setUp(self):
+        self.etag = make_etag("board", 1, 7)
+
+    def get(self, if_none_match, method="get"):
+        request = getattr(RequestFactory(), method)("/", HTTP_IF_NONE_MATCH=if_none_match)
+        return not_modified(request, self.etag)
+
+    def test_etag_is_strong_and_versioned(self):
+        self.assertRegex(self.etag, r'^"[0-9a-f]{32}"$')
+        self.assertNotEqual(self.etag, make_etag("board", 1, 8))
+
+    def test_matching_tag_is_not_modified(self):
+        response = self.get(f'"other", W/{self.etag}')
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], f"W/{self.etag}")
+
+    def test_encoded_tag_matches_the_same_version(self):
+        self.assertEqual(self.get(encoded_etag(self.etag, "gzip")).status_code, 304)
+        self.assertIsNone(self.get(encoded_etag(make_etag("board", 1, 6), "gzip")))
+
+    def test_wildcard_and_missing_header(self):
+        self.assertEqual(self.get("*").status_code, 304)
+        self.assertIsNone(self.get(""))
+
+    def test_only_safe_methods(self):
+        self.assertIsNone(self.get(self.etag, method="post"))
@@ -17,8 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from core.views import metrics
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics, name="metrics"), #Prometheus metrics of this deployment
     path('', include('auth_app.api.urls')),
     path('', include('board_app.api.urls')),
     path('', include('task_app.api.urls')),
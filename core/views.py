@@ -0,0 +1,17 @@
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from core.metrics import registry
+
+
+@require_GET
+def metrics(request):
+    """
+    Return the request metrics in the Prometheus text exposition format.
+
+    Not authenticated; restrict access to the scraper at the proxy.
+    """
+    return HttpResponse(
+        registry.render(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,85 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+
+from auth_app.api.authentication import async_token_required
+from board_app.membership import ais_board_member
+from task_app.models import Task, TaskCommentModel
+from .pagination import TaskKeysetPagination
+from .serializers import TaskSerializer, TaskCommentsSerializer
+from core.conditional import not_modified
+from .views import comments_etag, get_task_list_queryset
+
+
+async def paginated_task_response(request, queryset):
+    """
+    Return one keyset-paginated page of tasks as JSON.
+    """
+    paginator = TaskKeysetPagination()
+    try:
+        page = await paginator.apaginate_queryset(queryset, Request(request))
+    except NotFound as exc:
+        return JsonResponse({"detail": str(exc.detail)}, status=404)
+
+    return JsonResponse({
+        "next": paginator.get_next_link(),
+        "results": TaskSerializer(page, many=True).data,
+    })
+
+
+@require_GET
+@async_token_required
+async def tasks_assigned_to_me(request):
+    """
+    Async variant of GET /api/tasks/assigned-to-me/.
+    """
+    queryset = get_task_list_queryset(request.user).filter(assignee=request.user)
+    return await paginated_task_response(request, queryset)
+
+
+@require_GET
+@async_token_required
+async def tasks_reviewed_to_me(request):
+    """
+    Async variant of GET /api/tasks/reviewing/.
+    """
+    queryset = get_task_list_queryset(request.user).filter(reviewer=request.user)
+    return await paginated_task_response(request, queryset)
+
+
+@require_GET
+@async_token_required
+async def task_comments(request, pk):
+    """
+    Async variant of GET /api/tasks/<id>/comments/.
+    """
+    task = await Task.objects.filter(pk=pk).values_list("board_id", "updated_at").afirst()
+    if task is None:
+        return JsonResponse({"detail": "Task not found."}, status=404)
+    board_id, updated_at = task
+    if not await ais_board_member(request.user.id, board_id):
+        return JsonResponse(
+            {"detail": "You must be a member of the board to view comments."},
+            status=403,
+        )
+
+    etag = comments_etag(pk, updated_at)
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
+
+    comments = TaskCommentModel.objects.filter(
+        task_id=pk,
+    ).select_related(
+        "author__userprofile",
+    ).order_by("created_at")
+    comments = [comment async for comment in comments]
+
+    response = JsonResponse(
+        TaskCommentsSerializer(comments, many=True).data,
+        safe=False,
+    )
+    response["ETag"] = etag
+    return response
@@ -0,0 +1,167 @@
+import base64
+import binascii
+import datetime
+import json
+
+from django.db import connections
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TaskKeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination for task lists ordered by
+    ``(due_date, priority_rank, id)``, i.e. by due date and then from
+    high to low priority.
+
+    Each page is fetched with a ``WHERE`` condition on the sort keys of
+    the last row of the previous page instead of an ``OFFSET``, so deep
+    pages cost the same as the first one as long as a matching composite
+    index exists (see ``Task.Meta.indexes``).
+
+    NULL due dates are ordered the way the database sorts them natively,
+    which keeps the ORDER BY satisfiable by the index.
+    """
+
+    page_size = 50
+    max_page_size = 200
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return one page of tasks following the cursor in the request.
+        """
+        page_queryset = self.get_page_queryset(queryset, request)
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async variant of ``paginate_queryset`` for async views.
+        """
+        page_queryset = self.get_page_queryset(queryset, request)
+        return self.set_page([task async for task in page_queryset])
+
+    def get_page_queryset(self, queryset, request):
+        """
+        Return the queryset of the requested page plus one look-ahead row.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.nulls_largest = connections[queryset.db].features.nulls_order_largest
+
+        queryset = queryset.order_by("due_date", "priority_rank", "id")
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self.get_keyset_filter(*cursor))
+
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, rows):
+        """
+        Store the fetched rows as the current page and return it.
+        """
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        """
+        Wrap the page in an envelope with the link to the next page.
+        """
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        """
+        Describe the paginated envelope for schema generation.
+        """
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """
+        Return the requested page size, capped at ``max_page_size``.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        """
+        Return the absolute URL of the next page, or None on the last page.
+        """
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        cursor = self.encode_cursor(last.due_date, last.priority_rank, last.id)
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_keyset_filter(self, due_date, priority_rank, task_id):
+        """
+        Build the condition selecting rows after the given sort key.
+        """
+        after_tail = Q(priority_rank__gt=priority_rank) | Q(priority_rank=priority_rank, id__gt=task_id)
+
+        if due_date is None:
+            same_due_date = Q(due_date__isnull=True) & after_tail
+            if self.nulls_largest:
+                return same_due_date
+            return Q(due_date__isnull=False) | same_due_date
+
+        after = Q(due_date__gt=due_date) | (Q(due_date=due_date) & after_tail)
+        if self.nulls_largest:
+            return after | Q(due_date__isnull=True)
+        return Q(due_date__gte=due_date) & after
+
+    def encode_cursor(self, due_date, priority_rank, task_id):
+        """
+        Encode a sort key as an opaque URL-safe cursor.
+        """
+        payload = json.dumps([
+            due_date.isoformat() if due_date else None,
+            priority_rank,
+            task_id,
+        ])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        """
+        Decode the cursor from the request.
+
+        :return: Tuple of (due_date, priority_rank, id) or None for the first page
+        :raises NotFound: If the cursor is malformed
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            due_date, priority_rank, task_id = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if due_date is not None:
+                due_date = datetime.date.fromisoformat(due_date)
+            if not all(type(value) is int for value in (priority_rank, task_id)):
+                raise ValueError
+        except (binascii.Error, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return due_date, priority_rank, task_id
@@ -1,8 +1,9 @@
 from rest_framework import permissions
 from task_app.models import Task
-from task_app.models import Board
 from rest_framework.exceptions import NotFound
 
+from board_app.membership import is_board_member
+
 class IsBoardMember(permissions.BasePermission):
     """
     Permission class that allows access only to board members or the board owner.
@@ -36,9 +37,7 @@ class IsBoardMember(permissions.BasePermission):
         Returns:
             bool: True if the user is the board owner or a board member.
         """
-        user = request.user
-        board = obj.board
-        return board.owner == user or board.members.filter(id=user.id).exists()
+        return is_board_member(request.user.id, obj.board_id)
     
 
 class IsBoardMemberForTaskCreate(permissions.BasePermission):
@@ -47,20 +46,12 @@ class IsBoardMemberForTaskCreate(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
 
-        board_id = request.data.get("board")
-        if not board_id:
-            return False
-
         try:
-            board = Board.objects.get(pk=board_id)
-        except Board.DoesNotExist:
+            board_id = int(request.data.get("board"))
+        except (TypeError, ValueError):
             return False
 
-        user = request.user
-        return (
-            board.owner == user
-            or board.members.filter(id=user.id).exists()
-        )
+        return is_board_member(request.user.id, board_id)
 
 
 class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
@@ -124,11 +115,8 @@ class IsBoardMemberForComment(permissions.BasePermission):
             return False
 
         try:
-            task = Task.objects.select_related("board").get(pk=task_id)
+            board_id = Task.objects.values_list("board_id", flat=True).get(pk=task_id)
         except Task.DoesNotExist:
             raise NotFound(f"Task with id {task_id} does not exist.")
 
-        board = task.board
-        user = request.user
-
-        return board.owner == user or board.members.filter(id=user.id).exists()
+        return is_board_member(request.user.id, board_id)
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from board_app.models import Board
+from board_app.membership import get_board_owner_id, is_board_member
 from task_app.models import Task, TaskCommentModel
 from rest_framework.exceptions import PermissionDenied, NotFound
+from core.instrumentation import TimedSerializerMixin
 
 
 class TaskUserSerializer(serializers.ModelSerializer):
@@ -17,14 +18,14 @@ class TaskUserSerializer(serializers.ModelSerializer):
         fields = ["id", "email", "fullname"]
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for displaying task details.
     """
 
     assignee = TaskUserSerializer(read_only=True)
     reviewer = TaskUserSerializer(read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Task
@@ -41,14 +42,6 @@ class TaskSerializer(serializers.ModelSerializer):
             "comments_count",
         ]
 
-    def get_comments_count(self, obj):
-        """
-        Return the number of comments associated with the task.
-        """
-        if hasattr(obj, "comments"):
-            return obj.comments.count()
-        return 0
-
 class TaskCreateSerializer(serializers.ModelSerializer):
 
     """
@@ -90,32 +83,27 @@ class TaskCreateSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         user = self.context["request"].user
-        board_id = data.get("board")
+        board_id = data.pop("board")
 
-        try:
-            board = Board.objects.get(id=board_id)
-        except Board.DoesNotExist:
+        if get_board_owner_id(board_id) is None:
             raise NotFound(f"Board with id {board_id} does not exist.")
 
-        if not (board.owner == user or board.members.filter(id=user.id).exists()):
+        if not is_board_member(user.id, board_id):
             raise PermissionDenied("You must be a member of the board to create tasks.")
 
-        def is_member(u):
-            return u == board.owner or board.members.filter(id=u.id).exists()
-
         assignee = data.get("assignee")
         reviewer = data.get("reviewer")
 
-        if assignee and not is_member(assignee):
+        if assignee and not is_board_member(assignee.id, board_id):
             raise serializers.ValidationError(
                 {"assignee_id": "Assignee must be a board member."}
             )
-        if reviewer and not is_member(reviewer):
+        if reviewer and not is_board_member(reviewer.id, board_id):
             raise serializers.ValidationError(
                 {"reviewer_id": "Reviewer must be a board member."}
             )
 
-        data["board"] = board
+        data["board_id"] = board_id
         return data
 
     def create(self, validated_data):
@@ -123,6 +111,33 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class TaskBulkCreateItemSerializer(serializers.ModelSerializer):
+    """
+    Serializer for one task of a bulk creation request.
+
+    Only validates the shape of the item. Board existence and membership
+    of the requester, assignee and reviewer are checked by the view for
+    all items together.
+    """
+
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+    board = serializers.IntegerField()
+
+    class Meta:
+        model = Task
+        fields = [
+            "board",
+            "title",
+            "description",
+            "status",
+            "priority",
+            "assignee_id",
+            "reviewer_id",
+            "due_date",
+        ]
+
+
 # class TaskCreateSerializer(serializers.ModelSerializer):
 #     """
 #     Serializer for creating a new task.
@@ -239,7 +254,35 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
         return instance
 
 
-class TaskUpdateResponseSerializer(serializers.ModelSerializer):
+class TaskBulkUpdateItemSerializer(serializers.ModelSerializer):
+    """
+    Serializer for one entry of a bulk task update request.
+
+    Only validates the shape of the entry. Access to the task and the
+    membership of new assignees and reviewers are checked by the view
+    for all entries together.
+    """
+
+    id = serializers.IntegerField()
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = Task
+        fields = [
+            "id",
+            "status",
+            "priority",
+            "assignee_id",
+            "reviewer_id",
+            "due_date",
+        ]
+        extra_kwargs = {
+            "status": {"required": False},
+        }
+
+
+class TaskUpdateResponseSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for returning task data after an update.
     """
@@ -285,7 +328,7 @@ class TaskUpdateResponseSerializer(serializers.ModelSerializer):
 #         return obj.author.userprofile.fullname
 
 
-class TaskCommentsSerializer(serializers.ModelSerializer):
+class TaskCommentsSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for displaying task comments.
     """
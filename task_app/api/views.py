@@ -1,20 +1,27 @@
-from django.db.models import Q
+from django.db import transaction
+from django.utils import timezone
 
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied, NotFound
+from rest_framework.exceptions import PermissionDenied, NotFound, ValidationError
 
-from board_app.models import Board
+from board_app.changes import record_changes
+from board_app.membership import get_user_board_ids, is_board_member
+from board_app.models import Board, BoardChange, BoardMembership
+from core.conditional import make_etag, not_modified
 from task_app.models import Task, TaskCommentModel
 
 from .serializers import (
     TaskSerializer,
+    TaskBulkCreateItemSerializer,
+    TaskBulkUpdateItemSerializer,
     TaskCreateSerializer,
     TaskUpdateSerializer,
     TaskUpdateResponseSerializer,
     TaskCommentsSerializer,
 )
+from .pagination import TaskKeysetPagination
 from .permissions import (
     IsBoardMember,
     IsTaskCreatorOrBoardOwner,
@@ -24,6 +31,39 @@ from .permissions import (
 )
 
 
+def get_task_list_queryset(user):
+    """
+    Return tasks on boards visible to the user, prepared for TaskSerializer.
+
+    Board visibility is a single indexed join, so the query needs no
+    GROUP BY or DISTINCT and the keyset ordering can be served by the
+    composite task indexes.
+    """
+    return Task.objects.filter(
+        board__in=Board.objects.visible_to(user).values("id"),
+    ).select_related(
+        "assignee__userprofile",
+        "reviewer__userprofile",
+    )
+
+
+def task_etag(task):
+    """
+    Return the ETag of a task payload, versioned by ``updated_at``.
+    """
+    return make_etag("task", task.pk, task.updated_at.isoformat())
+
+
+def comments_etag(task_id, updated_at):
+    """
+    Return the ETag of the comment list of a task.
+
+    Creating, editing and deleting comments through the API bumps the
+    task's ``updated_at``, so it versions the comment list as well.
+    """
+    return make_etag("comments", task_id, updated_at.isoformat())
+
+
 class TasksAssignedToMeView(generics.ListAPIView):
     """
     API view for listing tasks assigned to the authenticated user.
@@ -31,6 +71,7 @@ class TasksAssignedToMeView(generics.ListAPIView):
 
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TaskKeysetPagination
 
     def get_queryset(self):
         """
@@ -39,11 +80,7 @@ class TasksAssignedToMeView(generics.ListAPIView):
         """
         user = self.request.user
 
-        return Task.objects.filter(
-            assignee=user
-        ).filter(
-            Q(board__members=user) | Q(board__owner=user)
-        ).distinct()
+        return get_task_list_queryset(user).filter(assignee=user)
 
 
 class TasksReviewedToMeView(generics.ListAPIView):
@@ -54,6 +91,7 @@ class TasksReviewedToMeView(generics.ListAPIView):
 
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TaskKeysetPagination
 
     def get_queryset(self):
         """
@@ -62,11 +100,7 @@ class TasksReviewedToMeView(generics.ListAPIView):
         """
         user = self.request.user
 
-        return Task.objects.filter(
-            reviewer=user
-        ).filter(
-            Q(board__members=user) | Q(board__owner=user)
-        ).distinct()
+        return get_task_list_queryset(user).filter(reviewer=user)
 
 
 # class TaskCreateView(generics.CreateAPIView):
@@ -128,12 +162,18 @@ class TaskCreateView(generics.CreateAPIView):
     - Board ID is provided in the request body.
     - Returns 404 if board does not exist.
     - Returns 403 if user is not member or owner of the board.
+    - Accepts a list of tasks for bulk creation (see ``create_many``).
     """
 
     serializer_class = TaskCreateSerializer
     permission_classes = [IsAuthenticated]
+    max_bulk_size = 5000
+    bulk_batch_size = 500
 
     def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            return self.create_many(request)
+
         serializer = self.get_serializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)  # <- hier wird alles validiert
 
@@ -144,12 +184,126 @@ class TaskCreateView(generics.CreateAPIView):
             status=status.HTTP_201_CREATED,
         )
 
+    def create_many(self, request):
+        """
+        Create a list of tasks in one transaction.
+
+        Board existence and the membership of the requester, assignees and
+        reviewers are checked for all items with a fixed number of queries,
+        and the valid tasks are inserted with ``bulk_create``. Invalid items
+        are reported by index without aborting the valid ones.
+
+        Returns 201 if all tasks were created, 207 if only some were
+        created and 400 if none were.
+        """
+        items = request.data
+        if not items or len(items) > self.max_bulk_size:
+            raise ValidationError(
+                f"Expected a list of 1 to {self.max_bulk_size} tasks."
+            )
+
+        user = request.user
+        errors = {}
+        valid = {}
+        for index, item in enumerate(items):
+            serializer = TaskBulkCreateItemSerializer(data=item)
+            if serializer.is_valid():
+                valid[index] = serializer.validated_data
+            else:
+                errors[index] = serializer.errors
+
+        board_ids = {data["board"] for data in valid.values()}
+        user_ids = {
+            data.get(field)
+            for data in valid.values()
+            for field in ("assignee_id", "reviewer_id")
+        } - {None}
+
+        existing_board_ids = set(
+            Board.objects.filter(id__in=board_ids).values_list("id", flat=True)
+        )
+        user_board_ids = get_user_board_ids(user.id)
+        memberships = set(
+            BoardMembership.objects.filter(
+                board_id__in=board_ids,
+                user_id__in=user_ids,
+            ).values_list("board_id", "user_id")
+        )
+
+        tasks = []
+        for index, data in valid.items():
+            item_errors = self.validate_bulk_item(data, existing_board_ids, user_board_ids, memberships)
+            if item_errors:
+                errors[index] = item_errors
+                continue
+            tasks.append(Task(
+                board_id=data.pop("board"),
+                created_by=user,
+                **data,
+            ))
+
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create(tasks, batch_size=self.bulk_batch_size)
+            record_changes(
+                (task.board_id, BoardChange.TASK, BoardChange.UPSERT, task.pk)
+                for task in tasks
+            )
+
+        created = Task.objects.filter(
+            pk__in=[task.pk for task in tasks],
+        ).select_related(
+            "assignee__userprofile",
+            "reviewer__userprofile",
+        ).order_by("pk")
+
+        if not tasks:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif errors:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response(
+            {
+                "created": TaskSerializer(created, many=True, context={"request": request}).data,
+                "errors": [
+                    {"index": index, "errors": errors[index]}
+                    for index in sorted(errors)
+                ],
+            },
+            status=response_status,
+        )
+
+    def validate_bulk_item(self, data, existing_board_ids, user_board_ids, memberships):
+        """
+        Check one bulk item against the preloaded boards and memberships.
+
+        :return: Dictionary of field errors, empty if the item is valid
+        """
+        board_id = data["board"]
+        if board_id not in existing_board_ids:
+            return {"board": [f"Board with id {board_id} does not exist."]}
+        if board_id not in user_board_ids:
+            return {"board": ["You must be a member of the board to create tasks."]}
+
+        errors = {}
+        assignee_id = data.get("assignee_id")
+        reviewer_id = data.get("reviewer_id")
+        if assignee_id is not None and (board_id, assignee_id) not in memberships:
+            errors["assignee_id"] = ["Assignee must be a board member."]
+        if reviewer_id is not None and (board_id, reviewer_id) not in memberships:
+            errors["reviewer_id"] = ["Reviewer must be a board member."]
+        return errors
+
 class SingleTaskView(generics.RetrieveUpdateDestroyAPIView):
     """
     API view for retrieving, updating, and deleting a single task.
     """
 
-    queryset = Task.objects.all()
+    queryset = Task.objects.filter(board__deleted_at__isnull=True).select_related(
+        "assignee__userprofile",
+        "reviewer__userprofile",
+    )
 
     def get_serializer_class(self):
         """
@@ -159,6 +313,20 @@ class SingleTaskView(generics.RetrieveUpdateDestroyAPIView):
             return TaskUpdateSerializer
         return TaskSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return the task, or 304 Not Modified if the client sends its
+        current ETag.
+        """
+        instance = self.get_object()
+        etag = task_etag(instance)
+
+        response = not_modified(request, etag)
+        if response is None:
+            response = Response(self.get_serializer(instance).data)
+            response["ETag"] = etag
+        return response
+
     def get_permissions(self):
         """
         Return permissions based on request method.
@@ -194,6 +362,134 @@ class SingleTaskView(generics.RetrieveUpdateDestroyAPIView):
         )
 
 
+class TaskBulkUpdateView(generics.GenericAPIView):
+    """
+    API view for partially updating many tasks in one request.
+
+    Takes a list of ``{"id": ..., <changes>}`` entries. Only status,
+    priority, assignee_id, reviewer_id and due_date can be changed.
+    """
+
+    permission_classes = [IsAuthenticated]
+    max_bulk_size = 1000
+    bulk_batch_size = 500
+
+    def patch(self, request, *args, **kwargs):
+        """
+        Apply the changes of all valid entries in one transaction.
+
+        Tasks are loaded, access is checked against the cached board ids of
+        the user and new assignees/reviewers are checked with one membership
+        query. The changed fields are written with ``bulk_update``. Invalid
+        entries are reported by index without aborting the valid ones.
+
+        Returns 200 if all tasks were updated, 207 if only some were
+        updated and 400 if none were.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items or len(items) > self.max_bulk_size:
+            raise ValidationError(
+                f"Expected a list of 1 to {self.max_bulk_size} task changes."
+            )
+
+        errors = {}
+        valid = {}
+        seen_ids = set()
+        for index, item in enumerate(items):
+            serializer = TaskBulkUpdateItemSerializer(data=item)
+            if not serializer.is_valid():
+                errors[index] = serializer.errors
+            elif serializer.validated_data["id"] in seen_ids:
+                errors[index] = {"id": ["Task is listed more than once."]}
+            else:
+                seen_ids.add(serializer.validated_data["id"])
+                valid[index] = serializer.validated_data
+
+        user_board_ids = get_user_board_ids(request.user.id)
+        update_fields = {"updated_at"}
+        updated = []
+
+        with transaction.atomic():
+            tasks = Task.objects.select_for_update().only(
+                "id", "board_id", *TaskBulkUpdateItemSerializer.Meta.fields,
+            ).in_bulk(seen_ids)
+            user_ids = {
+                data.get(field)
+                for data in valid.values()
+                for field in ("assignee_id", "reviewer_id")
+            } - {None}
+            memberships = set(
+                BoardMembership.objects.filter(
+                    board_id__in={task.board_id for task in tasks.values()},
+                    user_id__in=user_ids,
+                ).values_list("board_id", "user_id")
+            )
+
+            now = timezone.now()
+            for index, data in valid.items():
+                task = tasks.get(data.pop("id"))
+                item_errors = self.validate_bulk_item(task, data, user_board_ids, memberships)
+                if item_errors:
+                    errors[index] = item_errors
+                    continue
+                for attr, value in data.items():
+                    setattr(task, attr, value)
+                task.updated_at = now
+                update_fields.update(data)
+                updated.append(task)
+
+            Task.objects.bulk_update(updated, sorted(update_fields), batch_size=self.bulk_batch_size)
+            record_changes(
+                (task.board_id, BoardChange.TASK, BoardChange.UPSERT, task.pk)
+                for task in updated
+            )
+
+        tasks = Task.objects.filter(
+            pk__in=[task.pk for task in updated],
+        ).select_related(
+            "assignee__userprofile",
+            "reviewer__userprofile",
+        ).order_by("pk")
+
+        if not updated:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif errors:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_200_OK
+
+        return Response(
+            {
+                "updated": TaskUpdateResponseSerializer(tasks, many=True, context={"request": request}).data,
+                "errors": [
+                    {"index": index, "errors": errors[index]}
+                    for index in sorted(errors)
+                ],
+            },
+            status=response_status,
+        )
+
+    def validate_bulk_item(self, task, data, user_board_ids, memberships):
+        """
+        Check one entry against the loaded task and preloaded memberships.
+
+        :return: Dictionary of field errors, empty if the entry is valid
+        """
+        if task is None:
+            return {"id": ["Task not found."]}
+        if task.board_id not in user_board_ids:
+            return {"id": ["You must be a member of the board to update this task."]}
+
+        errors = {}
+        assignee_id = data.get("assignee_id")
+        reviewer_id = data.get("reviewer_id")
+        if assignee_id is not None and (task.board_id, assignee_id) not in memberships:
+            errors["assignee_id"] = ["Assignee must be a board member."]
+        if reviewer_id is not None and (task.board_id, reviewer_id) not in memberships:
+            errors["reviewer_id"] = ["Reviewer must be a board member."]
+        return errors
+
+
 class CommentListCreateAPIView(generics.ListCreateAPIView):
     """
     API view for listing and creating comments for a task.
@@ -202,48 +498,59 @@ class CommentListCreateAPIView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated, IsBoardMemberForComment]
     serializer_class = TaskCommentsSerializer
 
-    """
-    Return all comments for a given task if the requesting user
-    is a member or owner of the task's board.
-    
-    Raises:
-        NotFound: If the task does not exist.
-        PermissionDenied: If the user is not a member of the board.
-    """
-
-    def get_queryset(self):
-        user = self.request.user
-        task_id = self.kwargs["pk"]
+    def get_task_updated_at(self):
+        """
+        Return ``updated_at`` of the task if the requesting user is a
+        member or owner of the task's board.
 
+        Raises:
+            NotFound: If the task does not exist.
+            PermissionDenied: If the user is not a member of the board.
+        """
         try:
-            task = Task.objects.select_related("board").get(pk=task_id)
+            board_id, updated_at = Task.objects.values_list("board_id", "updated_at").get(pk=self.kwargs["pk"])
         except Task.DoesNotExist:
             raise NotFound("Task not found.")
 
-        board = task.board
-
-        if not (
-            board.owner == user
-            or board.members.filter(id=user.id).exists()
-        ):
+        if not is_board_member(self.request.user.id, board_id):
             raise PermissionDenied(
                 "You must be a member of the board to view comments."
             )
+        return updated_at
+
+    def list(self, request, *args, **kwargs):
+        """
+        Return all comments of the task, or 304 Not Modified if the
+        client sends the current ETag of the list.
+        """
+        etag = comments_etag(self.kwargs["pk"], self.get_task_updated_at())
+
+        response = not_modified(request, etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+            response["ETag"] = etag
+        return response
 
+    def get_queryset(self):
+        """
+        Return the comments of the task in creation order.
+        """
         return TaskCommentModel.objects.filter(
-            task=task
+            task_id=self.kwargs["pk"]
         ).select_related(
             "author__userprofile"
         ).order_by("created_at")
 
     def perform_create(self, serializer):
         """
-        Create a new comment associated with the given task.
+        Create a new comment associated with the given task; the
+        task's comment counter is incremented by ``comment_saved``.
         """
-        serializer.save(
-            task_id=self.kwargs["pk"],
-            author=self.request.user,
-        )
+        with transaction.atomic():
+            serializer.save(
+                task_id=self.kwargs["pk"],
+                author=self.request.user,
+            )
 
 
 class CommentRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
@@ -257,7 +564,8 @@ class CommentRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         """
-        Return the specific comment for the given task and comment IDs.
+        Return the specific comment for the given task and comment IDs;
+        comments on deleted boards are not found.
         """
         task_id = self.kwargs.get("task_id")
         comment_id = self.kwargs.get("pk")
@@ -265,4 +573,22 @@ class CommentRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         return TaskCommentModel.objects.filter(
             task_id=task_id,
             pk=comment_id,
+            task__board__deleted_at__isnull=True,
         )
+
+    def perform_update(self, serializer):
+        """
+        Save the comment and bump the task's ``updated_at``, which
+        versions the comment list.
+        """
+        with transaction.atomic():
+            comment = serializer.save()
+            Task.objects.filter(pk=comment.task_id).update(updated_at=timezone.now())
+
+    def perform_destroy(self, instance):
+        """
+        Delete the comment; the task's comment counter is decremented by
+        ``comment_deleted``.
+        """
+        with transaction.atomic():
+            instance.delete()
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class TaskAppConfig(AppConfig):
     name = 'task_app'
+
+    def ready(self):
+        from task_app import signals  # noqa: F401
@@ -0,0 +1,82 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from board_app.changes import record_changes
+from board_app.models import BoardChange
+from task_app.models import Task, TaskCommentModel
+
+
+class Command(BaseCommand):
+    """
+    Recompute the denormalized ``Task.comments_count`` counters.
+
+    Tasks are processed in primary-key batches. Every task whose stored
+    counter differs from its actual number of comments is reported and,
+    unless ``--dry-run`` is given, corrected. Corrected tasks are logged
+    in their boards' change logs, so cached ETags, snapshots and
+    dashboards pick up the new counters.
+    """
+
+    help = "Recompute Task.comments_count and report tasks whose counter drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of tasks checked per query (default: 1000).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drift, do not update any counter.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+
+        actual_count = TaskCommentModel.objects.filter(
+            task_id=OuterRef("pk"),
+        ).order_by().values("task_id").annotate(
+            count=Count("pk"),
+        ).values("count")
+
+        checked = 0
+        drifted = 0
+        last_id = 0
+
+        while True:
+            batch = list(
+                Task.objects.filter(pk__gt=last_id).order_by("pk").annotate(
+                    actual_count=Coalesce(Subquery(actual_count), 0),
+                ).values_list("pk", "board_id", "comments_count", "actual_count")[:batch_size]
+            )
+            if not batch:
+                break
+
+            last_id = batch[-1][0]
+            checked += len(batch)
+            stale = [row for row in batch if row[2] != row[3]]
+            drifted += len(stale)
+
+            for pk, _, stored, actual in stale:
+                self.stdout.write(f"Task {pk}: stored {stored}, actual {actual}")
+
+            if stale and not dry_run:
+                now = timezone.now()
+                with transaction.atomic():
+                    for pk, _, _, actual in stale:
+                        Task.objects.filter(pk=pk).update(comments_count=actual, updated_at=now)
+                    record_changes(
+                        (board_id, BoardChange.TASK, BoardChange.UPSERT, pk)
+                        for pk, board_id, _, _ in stale
+                    )
+
+        action = "found" if dry_run else "fixed"
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {checked} tasks, {action} {drifted} with a drifted comment counter."
+        ))
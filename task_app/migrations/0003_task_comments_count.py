@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:44
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_comments_count(apps, schema_editor):
+    """
+    Initialize the comment counter of every task from its comments.
+    """
+    Task = apps.get_model("task_app", "Task")
+    TaskCommentModel = apps.get_model("task_app", "TaskCommentModel")
+    db_alias = schema_editor.connection.alias
+
+    comments_count = TaskCommentModel.objects.using(db_alias).filter(
+        task_id=models.OuterRef("pk"),
+    ).order_by().values("task_id").annotate(
+        count=models.Count("pk"),
+    ).values("count")
+
+    Task.objects.using(db_alias).update(
+        comments_count=Coalesce(models.Subquery(comments_count), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_app', '0002_task_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_comments_count, migrations.RunPython.noop),
+    ]
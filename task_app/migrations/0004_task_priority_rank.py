@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board_app', '0005_board_version'),
+        ('task_app', '0003_task_comments_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_assignee_keyset_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_reviewer_keyset_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='priority_rank',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(priority='high', then=models.Value(0)), models.When(priority='low', then=models.Value(2)), default=models.Value(1)), output_field=models.PositiveSmallIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'due_date', 'priority_rank', 'id'], name='task_assignee_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['reviewer', 'due_date', 'priority_rank', 'id'], name='task_reviewer_keyset_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Case, Value, When
 from django.contrib.auth.models import User
 from board_app.models import Board
 
@@ -37,6 +38,18 @@ class Task(models.Model):
         default="medium",
     )
 
+    # Sort key of the priority: 0 for high, 1 for medium, 2 for low.
+    # Computed by the database, so every write path keeps it in sync.
+    priority_rank = models.GeneratedField(
+        expression=Case(
+            When(priority="high", then=Value(0)),
+            When(priority="low", then=Value(2)),
+            default=Value(1),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+    )
+
     assignee = models.ForeignKey(User,related_name="assigned_tasks",null=True,blank=True,on_delete=models.SET_NULL,)
 
     reviewer = models.ForeignKey(User,related_name="review_tasks",null=True,blank=True,on_delete=models.SET_NULL,)
@@ -49,6 +62,17 @@ class Task(models.Model):
 
     created_by = models.ForeignKey(User,on_delete=models.CASCADE,related_name="created_tasks",null=True,blank=True,)
 
+    # Denormalized number of comments, maintained by the comment signals.
+    # Recompute with ``manage.py recount_comments``.
+    comments_count = models.PositiveIntegerField(default=0,)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of the assigned-to-me / reviewing lists.
+            models.Index(fields=["assignee", "due_date", "priority_rank", "id"], name="task_assignee_keyset_idx"),
+            models.Index(fields=["reviewer", "due_date", "priority_rank", "id"], name="task_reviewer_keyset_idx"),
+        ]
+
     def __str__(self):
         """
         Return a human-readable representation of the task.
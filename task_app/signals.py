@@ -0,0 +1,98 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from board_app.changes import is_board_deletion, record_change, record_changes
+from board_app.models import BoardChange
+from task_app.models import Task, TaskCommentModel
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, **kwargs):
+    """
+    Log a created or updated task in its board's change log.
+    """
+    record_change(instance.board_id, BoardChange.TASK, BoardChange.UPSERT, instance.pk)
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, origin=None, **kwargs):
+    """
+    Log a tombstone for a deleted task, unless its whole board is deleted.
+    """
+    if not is_board_deletion(origin):
+        record_change(instance.board_id, BoardChange.TASK, BoardChange.DELETE, instance.pk)
+
+
+@receiver(post_save, sender=TaskCommentModel)
+def comment_saved(sender, instance, created, **kwargs):
+    """
+    Log a created or updated comment.
+
+    A new comment also increments the task's ``comments_count``, so the
+    task is logged as updated too. Counting here keeps the counter right
+    for comments created outside the API, e.g. in the admin.
+    """
+    if created and instance.task_id is not None:
+        update_comments_count(instance.task_id, 1)
+
+    board_id = get_comment_board_id(instance)
+    if board_id is None:
+        return
+
+    changes = [(board_id, BoardChange.COMMENT, BoardChange.UPSERT, instance.pk)]
+    if created:
+        changes.append((board_id, BoardChange.TASK, BoardChange.UPSERT, instance.task_id))
+    record_changes(changes)
+
+
+@receiver(post_delete, sender=TaskCommentModel)
+def comment_deleted(sender, instance, origin=None, **kwargs):
+    """
+    Decrement the task's ``comments_count`` and log a tombstone for the
+    deleted comment and the updated task.
+
+    Comments deleted together with their task or board are not logged;
+    the task tombstone covers them.
+    """
+    if isinstance(origin, Task) or getattr(origin, "model", None) is Task or is_board_deletion(origin):
+        return
+
+    if instance.task_id is not None:
+        update_comments_count(instance.task_id, -1)
+
+    board_id = get_comment_board_id(instance)
+    if board_id is None:
+        return
+
+    record_changes([
+        (board_id, BoardChange.COMMENT, BoardChange.DELETE, instance.pk),
+        (board_id, BoardChange.TASK, BoardChange.UPSERT, instance.task_id),
+    ])
+
+
+def update_comments_count(task_id, delta):
+    """
+    Atomically adjust the denormalized comment counter of a task.
+
+    The counter never drops below zero, even if it had drifted (see
+    ``manage.py recount_comments``). Also bumps ``updated_at``, since the
+    counter is part of the task payload.
+    """
+    Task.objects.filter(pk=task_id).update(
+        comments_count=Greatest(F("comments_count") + delta, 0),
+        updated_at=timezone.now(),
+    )
+
+
+def get_comment_board_id(comment):
+    """
+    Return the board id of a comment's task, or None for orphaned comments.
+    """
+    if comment.task_id is None:
+        return None
+    if TaskCommentModel.task.is_cached(comment) and comment.task is not None:
+        return comment.task.board_id
+    return Task.objects.filter(pk=comment.task_id).values_list("board_id", flat=True).first()
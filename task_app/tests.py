@@ -1,3 +1,559 @@
-from django.test import TestCase
+import datetime
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from auth_app.models import UserProfile
+from board_app.models import Board
+from core.testing import QueryBudgetTestCase
+from task_app.models import Task, TaskCommentModel
+
+
+class TaskKeysetPaginationTests(APITestCase):
+    """
+    Tests for the cursor pagination of the assigned-to-me and reviewing lists.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        UserProfile.objects.create(user=self.user, fullname="User")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.user)
+        self.client.force_authenticate(self.user)
+
+        today = datetime.date(2026, 1, 1)
+        due_dates = [None, today, today + datetime.timedelta(days=1)]
+        for index in range(30):
+            Task.objects.create(
+                board=self.board,
+                title=f"Task {index}",
+                status="to-do",
+                priority=["low", "medium", "high"][index % 3],
+                due_date=due_dates[index % len(due_dates)],
+                assignee=self.user,
+                reviewer=self.user,
+            )
+
+    def collect_pages(self, url_name, page_size):
+        """
+        Follow the next links and return all task ids in page order.
+        """
+        ids = []
+        url = reverse(url_name) + f"?page_size={page_size}"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["results"]), page_size)
+            ids.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_pages_cover_every_task_once_in_order(self):
+        expected = list(
+            Task.objects.order_by("due_date", "priority_rank", "id").values_list("id", flat=True)
+        )
+
+        for url_name in ("tasks-assigned-to-me", "tasks-reviewed-to-me"):
+            self.assertEqual(self.collect_pages(url_name, 4), expected)
+
+    def test_priorities_are_ordered_from_high_to_low(self):
+        due_date = datetime.date(2025, 12, 31)
+        for priority in ("low", "medium", "high"):
+            Task.objects.create(
+                board=self.board, title=priority, status="to-do", priority=priority,
+                due_date=due_date, assignee=self.user,
+            )
+
+        ids = self.collect_pages("tasks-assigned-to-me", 2)
+        priorities = dict(Task.objects.filter(due_date=due_date).values_list("id", "priority"))
+
+        self.assertEqual(
+            [priorities[task_id] for task_id in ids if task_id in priorities],
+            ["high", "medium", "low"],
+        )
+
+    def test_tasks_on_foreign_boards_are_hidden(self):
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        foreign_board = Board.objects.create(title="Foreign", owner=stranger)
+        Task.objects.create(board=foreign_board, title="Foreign", status="to-do", assignee=self.user)
+
+        self.assertEqual(len(self.collect_pages("tasks-assigned-to-me", 50)), 30)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse("tasks-assigned-to-me") + "?cursor=not-a-cursor")
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TaskCreateTests(APITestCase):
+    """
+    Tests for task creation and its cached membership checks.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        UserProfile.objects.create(user=self.user, fullname="User")
+        self.stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.board.members.add(self.user)
+        self.client.force_authenticate(self.user)
+
+    def create_task(self, **data):
+        """
+        Post a task to the board and return the response.
+        """
+        payload = {"board": self.board.id, "title": "Task", "status": "to-do", **data}
+        return self.client.post(reverse("create-task"), payload, format="json")
+
+    def test_create(self):
+        response = self.create_task(assignee_id=self.user.id)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["board"], self.board.id)
+        self.assertEqual(response.data["assignee"]["id"], self.user.id)
+        self.assertEqual(Task.objects.get().created_by, self.user)
+
+    def test_assignee_must_be_member(self):
+        response = self.create_task(assignee_id=self.stranger.id)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_board(self):
+        response = self.create_task(board=self.board.id + 1)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_non_member_is_forbidden(self):
+        self.client.force_authenticate(self.stranger)
+
+        response = self.create_task()
+
+        self.assertEqual(response.status_code, 403)
+
+
+class TaskBulkCreateTests(APITestCase):
+    """
+    Tests for creating a list of tasks in one request.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        UserProfile.objects.create(user=self.user, fullname="User")
+        self.stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.other_board = Board.objects.create(title="Other", owner=self.stranger)
+        self.client.force_authenticate(self.user)
+
+    def task(self, **data):
+        """
+        Return the payload of one task on the board.
+        """
+        return {"board": self.board.id, "title": "Task", "status": "to-do", "priority": "low", **data}
+
+    def test_create_many_with_constant_queries(self):
+        payload = [self.task(title=f"Task {index}", assignee_id=self.user.id) for index in range(50)]
+
+        with self.assertNumQueries(9):
+            response = self.client.post(reverse("create-task"), payload, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["created"]), 50)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(response.data["created"][0]["assignee"]["id"], self.user.id)
+        self.assertEqual(self.board.changes.filter(kind="task").count(), 50)
+
+    def test_partial_success_reports_errors_by_index(self):
+        payload = [
+            self.task(),
+            self.task(assignee_id=self.stranger.id),
+            self.task(board=self.other_board.id),
+            self.task(board=self.other_board.id + 100),
+            {"board": self.board.id},
+        ]
+
+        response = self.client.post(reverse("create-task"), payload, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(len(response.data["created"]), 1)
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2, 3, 4])
+        self.assertIn("assignee_id", response.data["errors"][0]["errors"])
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_no_valid_items(self):
+        response = self.client.post(reverse("create-task"), [self.task(board=self.other_board.id)], format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.exists())
+
+    def test_empty_list_is_rejected(self):
+        response = self.client.post(reverse("create-task"), [], format="json")
+
+        self.assertEqual(response.status_code, 400)
+
+
+class TaskBulkUpdateTests(APITestCase):
+    """
+    Tests for moving and updating many tasks in one request.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        UserProfile.objects.create(user=self.user, fullname="User")
+        self.stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.other_board = Board.objects.create(title="Other", owner=self.stranger)
+        self.tasks = [
+            Task.objects.create(board=self.board, title=f"Task {index}", status="to-do")
+            for index in range(20)
+        ]
+        self.foreign_task = Task.objects.create(board=self.other_board, title="Foreign", status="to-do")
+        self.client.force_authenticate(self.user)
+
+    def test_move_many_with_constant_queries(self):
+        payload = [
+            {"id": task.id, "status": "done", "assignee_id": self.user.id}
+            for task in self.tasks
+        ]
+
+        with self.assertNumQueries(9):
+            response = self.client.patch(reverse("task-bulk-update"), payload, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["updated"]), 20)
+        self.assertEqual(response.data["updated"][0]["assignee"]["id"], self.user.id)
+        self.assertEqual(Task.objects.filter(board=self.board, status="done").count(), 20)
+        self.assertEqual(self.board.changes.filter(kind="task").count(), 40)
+
+    def test_only_given_fields_are_changed(self):
+        task = self.tasks[0]
+
+        self.client.patch(reverse("task-bulk-update"), [{"id": task.id, "priority": "high"}], format="json")
+
+        task.refresh_from_db()
+        self.assertEqual(task.priority, "high")
+        self.assertEqual(task.status, "to-do")
+        self.assertEqual(task.title, "Task 0")
+
+    def test_partial_success_reports_errors_by_index(self):
+        payload = [
+            {"id": self.tasks[0].id, "status": "review"},
+            {"id": self.foreign_task.id, "status": "review"},
+            {"id": self.tasks[1].id, "assignee_id": self.stranger.id},
+            {"id": self.foreign_task.id + 100, "status": "review"},
+            {"id": self.tasks[0].id, "status": "done"},
+            {"id": self.tasks[2].id, "status": "unknown"},
+        ]
+
+        response = self.client.patch(reverse("task-bulk-update"), payload, format="json")
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([task["id"] for task in response.data["updated"]], [self.tasks[0].id])
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2, 3, 4, 5])
+        self.foreign_task.refresh_from_db()
+        self.assertEqual(self.foreign_task.status, "to-do")
+
+    def test_no_valid_items(self):
+        response = self.client.patch(
+            reverse("task-bulk-update"), [{"id": self.foreign_task.id, "status": "done"}], format="json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+class CommentsCountTests(APITestCase):
+    """
+    Tests for the denormalized comment counter on tasks.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        UserProfile.objects.create(user=self.user, fullname="User")
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.task = Task.objects.create(board=self.board, title="Task", status="to-do")
+        self.client.force_authenticate(self.user)
+
+    def test_create_and_delete_update_counter(self):
+        url = reverse("comment-collection", kwargs={"pk": self.task.pk})
+        first = self.client.post(url, {"content": "first"}, format="json")
+        self.client.post(url, {"content": "second"}, format="json")
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 2)
+
+        response = self.client.delete(
+            reverse("comment", kwargs={"task_id": self.task.pk, "pk": first.data["id"]})
+        )
+        self.task.refresh_from_db()
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.task.comments_count, 1)
+
+    def test_comments_outside_the_api_are_counted(self):
+        comment = self.task.comments.create(author=self.user, content="from the admin")
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 1)
+
+        response = self.client.delete(
+            reverse("comment", kwargs={"task_id": self.task.pk, "pk": comment.pk})
+        )
+        self.task.refresh_from_db()
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.task.comments_count, 0)
+
+    def test_counter_does_not_drop_below_zero(self):
+        # bulk_create skips the signals, so the counter has drifted.
+        comment, = TaskCommentModel.objects.bulk_create([
+            TaskCommentModel(task=self.task, author=self.user, content="not counted"),
+        ])
+
+        comment.delete()
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 0)
+
+    def test_recount_command_fixes_drift(self):
+        # bulk_create skips the signals, so the comment is not counted.
+        TaskCommentModel.objects.bulk_create([
+            TaskCommentModel(task=self.task, author=self.user, content="not counted"),
+        ])
+        out = StringIO()
+
+        self.task.refresh_from_db()
+        self.board.refresh_from_db()
+        updated_at, version = self.task.updated_at, self.board.version
+
+        call_command("recount_comments", "--dry-run", stdout=out)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 0)
+        self.assertIn(f"Task {self.task.pk}: stored 0, actual 1", out.getvalue())
+
+        call_command("recount_comments", stdout=StringIO())
+        self.task.refresh_from_db()
+        self.board.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 1)
+        self.assertGreater(self.task.updated_at, updated_at)
+        self.assertEqual(self.board.version, version + 1)
+
+
+class TaskConditionalGetTests(APITestCase):
+    """
+    Tests for ETag / If-None-Match on task details and comment lists.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        UserProfile.objects.create(user=self.user, fullname="User")
+        self.token = Token.objects.create(user=self.user)
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        self.task = Task.objects.create(board=self.board, title="Task", status="to-do", assignee=self.user)
+        self.comment = self.task.comments.create(author=self.user, content="comment")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.task_url = reverse("task", kwargs={"pk": self.task.pk})
+        self.comments_url = reverse("comment-collection", kwargs={"pk": self.task.pk})
+
+    def test_unchanged_task_is_not_modified(self):
+        etag = self.client.get(self.task_url)["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(len(context.captured_queries), 2)
+
+    def test_task_update_changes_the_etag(self):
+        etag = self.client.get(self.task_url)["ETag"]
+        self.client.patch(self.task_url, {"status": "done"}, format="json")
+
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["status"], "done")
+
+    def test_comment_changes_change_the_list_etag(self):
+        etag = self.client.get(self.comments_url)["ETag"]
+        self.assertEqual(self.client.get(self.comments_url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.client.patch(
+            reverse("comment", kwargs={"task_id": self.task.pk, "pk": self.comment.pk}),
+            {"content": "edited"},
+            format="json",
+        )
+        response = self.client.get(self.comments_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["content"], "edited")
+
+        etag = response["ETag"]
+        self.client.post(self.comments_url, {"content": "second"}, format="json")
+        self.assertEqual(self.client.get(self.comments_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_async_comments_share_the_etag(self):
+        etag = self.client.get(self.comments_url)["ETag"]
+        async_url = reverse("comment-collection-async", kwargs={"pk": self.task.pk})
+
+        response = self.client.get(async_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.client.get(async_url)["ETag"], etag)
+
+    def test_non_member_gets_no_304(self):
+        etag = self.client.get(self.task_url)["ETag"]
+        stranger = User.objects.create_user(username="stranger", email="stranger@example.com")
+        self.client.force_authenticate(stranger)
+
+        self.assertEqual(self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag).status_code, 403)
+
+
+class AsyncTaskEndpointTests(APITestCase):
+    """
+    Tests that the async task endpoints return the same payloads as the sync ones.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="user", email="user@example.com")
+        UserProfile.objects.create(user=self.user, fullname="User")
+        self.token = Token.objects.create(user=self.user)
+        self.board = Board.objects.create(title="Board", owner=self.user)
+        for index in range(3):
+            task = Task.objects.create(board=self.board, title=f"Task {index}", status="to-do", assignee=self.user, reviewer=self.user)
+        task.comments.create(author=self.user, content="comment")
+        self.task = task
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_same_payloads(self):
+        endpoints = [
+            ("tasks-assigned-to-me", "tasks-assigned-to-me-async", {}, "?page_size=2"),
+            ("tasks-reviewed-to-me", "tasks-reviewed-to-me-async", {}, ""),
+            ("comment-collection", "comment-collection-async", {"pk": self.task.pk}, ""),
+        ]
+        for sync_name, async_name, kwargs, query in endpoints:
+            sync_response = self.client.get(reverse(sync_name, kwargs=kwargs) + query)
+            async_response = self.client.get(reverse(async_name, kwargs=kwargs) + query)
+
+            self.assertEqual(async_response.status_code, 200)
+            sync_data, async_data = sync_response.json(), async_response.json()
+            if "next" in sync_data:
+                self.assertEqual(bool(async_data["next"]), bool(sync_data["next"]))
+                sync_data, async_data = sync_data["results"], async_data["results"]
+            self.assertEqual(async_data, sync_data)
+
+
+class TaskQueryBudgetTests(QueryBudgetTestCase):
+    """
+    Query budgets of the task and comment endpoints for boards with 1 to
+    1000 members, tasks and comments.
+
+    Bulk writes of 1000 rows are split into several statements by the
+    SQLite backend, which is why their budgets leave room above the
+    counts of small boards.
+    """
+
+    def task(self, seeded, **data):
+        """
+        Return the payload of one task on the seeded board.
+        """
+        return {
+            "board": seeded.board.id,
+            "title": "New task",
+            "status": "to-do",
+            "priority": "high",
+            "assignee_id": seeded.members[-1].id,
+            "reviewer_id": seeded.owner.id,
+            **data,
+        }
+
+    def test_assigned_to_me(self):
+        self.check_budget(2, lambda seeded: self.client.get(reverse("tasks-assigned-to-me")))
+
+    def test_assigned_to_me_async(self):
+        self.check_budget(2, lambda seeded: self.client.get(reverse("tasks-assigned-to-me-async")))
+
+    def test_reviewing(self):
+        self.check_budget(2, lambda seeded: self.client.get(reverse("tasks-reviewed-to-me")))
+
+    def test_reviewing_async(self):
+        self.check_budget(2, lambda seeded: self.client.get(reverse("tasks-reviewed-to-me-async")))
+
+    def test_create(self):
+        self.check_budget(11, lambda seeded: self.client.post(
+            reverse("create-task"), self.task(seeded), format="json",
+        ))
+
+    def test_create_many(self):
+        self.check_budget(27, lambda seeded: self.client.post(
+            reverse("create-task"),
+            [self.task(seeded, title=f"New task {index}") for index in range(len(seeded.tasks))],
+            format="json",
+        ))
+
+    def test_bulk_update(self):
+        self.check_budget(19, lambda seeded: self.client.patch(
+            reverse("task-bulk-update"),
+            [{"id": task.id, "status": "done"} for task in seeded.tasks],
+            format="json",
+        ))
+
+    def test_detail(self):
+        self.check_budget(3, lambda seeded: self.client.get(
+            reverse("task", kwargs={"pk": seeded.tasks[0].pk}),
+        ))
+
+    def test_update(self):
+        self.check_budget(8, lambda seeded: self.client.patch(
+            reverse("task", kwargs={"pk": seeded.tasks[0].pk}),
+            {"status": "done", "assignee_id": seeded.members[-1].id},
+            format="json",
+        ))
+
+    def test_delete(self):
+        self.check_budget(17, lambda seeded: self.client.delete(
+            reverse("task", kwargs={"pk": seeded.tasks[0].pk}),
+        ))
+
+    def test_comments(self):
+        self.check_budget(5, lambda seeded: self.client.get(
+            reverse("comment-collection", kwargs={"pk": seeded.tasks[0].pk}),
+        ))
+
+    def test_comments_async(self):
+        self.check_budget(4, lambda seeded: self.client.get(
+            reverse("comment-collection-async", kwargs={"pk": seeded.tasks[0].pk}),
+        ))
+
+    def test_create_comment(self):
+        self.check_budget(11, lambda seeded: self.client.post(
+            reverse("comment-collection", kwargs={"pk": seeded.tasks[0].pk}),
+            {"content": "New comment"},
+            format="json",
+        ))
+
+    def test_comment_detail(self):
+        self.check_budget(4, lambda seeded: self.client.get(
+            reverse("comment", kwargs={"task_id": seeded.tasks[0].pk, "pk": seeded.comments[0].pk}),
+        ))
+
+    def test_update_comment(self):
+        self.check_budget(11, lambda seeded: self.client.patch(
+            reverse("comment", kwargs={"task_id": seeded.tasks[0].pk, "pk": seeded.comments[0].pk}),
+            {"content": "Edited"},
+            format="json",
+        ))
+
+    def test_delete_comment(self):
+        self.check_budget(10, lambda seeded: self.client.delete(
+            reverse("comment", kwargs={"task_id": seeded.tasks[0].pk, "pk": seeded.comments[0].pk}),
+        ))